@@ -16,6 +16,7 @@ from .base import (
     validate_ip,
     get_timestamp,
     safe_input,
+    pipelined_map,
 )
 
 from .utils import (
@@ -42,6 +43,7 @@ __all__ = [
     "validate_ip",
     "get_timestamp",
     "safe_input",
+    "pipelined_map",
     # Config and logging
     "Config",
     "Logger",
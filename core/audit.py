@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Audit Module
+Bulk password auditing over streamed candidate files
+"""
+
+import os
+import csv
+import hashlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, List, Any, Callable, Iterator, Tuple
+
+from .base import pipelined_map
+from .passwords import get_estimator
+from .breach import get_breach_store
+
+STRENGTH_LABELS = ["Very Weak", "Weak", "Medium", "Strong", "Very Strong"]
+
+FAILURE_LABELS = {
+    "too_short": "Shorter than minimum length",
+    "no_upper": "No uppercase letters",
+    "no_lower": "No lowercase letters",
+    "no_digit": "No digits",
+    "no_special": "No special characters",
+    "dictionary": "Contains a dictionary word",
+    "spatial": "Contains a keyboard pattern",
+    "repeat": "Contains repeated characters",
+    "sequence": "Contains a character sequence",
+    "date": "Contains a date or year",
+    "breached": "Found in breach corpus",
+    "weak_score": "Estimated strength below Medium",
+}
+
+CSV_HEADER = ["line", "length", "score", "strength", "guesses_log10", "failures"]
+
+DEFAULT_BATCH_SIZE = 2000
+DEFAULT_REUSE_SLOTS = 10000
+
+_worker_min_length = 12
+_worker_cache: Dict[str, tuple] = {}
+_WORKER_CACHE_SIZE = 65536
+
+
+def _init_worker(min_length: int):
+    """Process pool initializer: warm the estimator once per worker"""
+    global _worker_min_length
+    _worker_min_length = min_length
+    get_estimator().index.tables
+
+
+def _score_password(password: str) -> tuple:
+    """Score one password, returning (score, guesses_log10, failures)"""
+    cached = _worker_cache.get(password)
+    if cached is not None:
+        return cached
+
+    estimate = get_estimator().estimate(password)
+    failures = []
+    if len(password) < _worker_min_length:
+        failures.append("too_short")
+    if not any(c.isupper() for c in password):
+        failures.append("no_upper")
+    if not any(c.islower() for c in password):
+        failures.append("no_lower")
+    if not any(c.isdigit() for c in password):
+        failures.append("no_digit")
+    if password.isalnum():
+        failures.append("no_special")
+
+    patterns = {m["pattern"] for m in estimate["sequence"]}
+    if "regex" in patterns:
+        patterns.add("date")
+    for pattern in ("dictionary", "spatial", "repeat", "sequence", "date"):
+        if pattern in patterns:
+            failures.append(pattern)
+
+    score = estimate["score"]
+    store = get_breach_store()
+    if store is not None and store.contains(password):
+        failures.append("breached")
+        score = 0
+    if score < 2:
+        failures.append("weak_score")
+
+    result = (score, round(estimate["guesses_log10"], 2), tuple(failures))
+    if len(_worker_cache) >= _WORKER_CACHE_SIZE:
+        _worker_cache.clear()
+    _worker_cache[password] = result
+    return result
+
+
+def _score_batch(batch: List[Tuple[int, str]]) -> List[tuple]:
+    """Score a batch of (line number, password) pairs in a worker"""
+    rows = []
+    for line_no, password in batch:
+        score, log10, failures = _score_password(password)
+        rows.append((line_no, len(password), score, log10, failures))
+    return rows
+
+
+def mask_password(password: str) -> str:
+    """Mask a password for display, keeping only first and last characters"""
+    if len(password) <= 2:
+        return "*" * len(password)
+    return password[0] + "*" * (len(password) - 2) + password[-1]
+
+
+class HeavyHitters:
+    """
+    Misra-Gries frequent-item summary over password digests
+
+    Keeps at most `slots` counters, so memory is bounded no matter how many
+    distinct passwords stream past. Any password occurring more than
+    total / slots times is guaranteed to be kept; counts are lower bounds.
+    """
+
+    def __init__(self, slots: int = DEFAULT_REUSE_SLOTS):
+        self.slots = slots
+        self.counters: Dict[bytes, List[Any]] = {}
+
+    def add(self, digest: bytes, label: str):
+        entry = self.counters.get(digest)
+        if entry is not None:
+            entry[0] += 1
+        elif len(self.counters) < self.slots:
+            self.counters[digest] = [1, label]
+        else:
+            for key in list(self.counters):
+                entry = self.counters[key]
+                entry[0] -= 1
+                if entry[0] == 0:
+                    del self.counters[key]
+
+    def top(self, n: int) -> List[Tuple[str, int]]:
+        """Most frequent items seen more than once"""
+        ranked = sorted(self.counters.values(), key=lambda e: e[0], reverse=True)
+        return [(label, count) for count, label in ranked[:n] if count > 1]
+
+
+def _read_batches(
+    path: str, batch_size: int, reuse: HeavyHitters, stats: Dict[str, Any]
+) -> Iterator[List[Tuple[int, str]]]:
+    batch = []
+    # Binary lines so "bytes" counts what was read from disk, in step with
+    # the file size the progress bar is measured against
+    with open(path, "rb") as f:
+        for line_no, raw_line in enumerate(f, 1):
+            stats["bytes"] += len(raw_line)
+            password = raw_line.rstrip(b"\r\n").decode("utf-8", errors="replace")
+            if not password:
+                stats["skipped"] += 1
+                continue
+            reuse.add(
+                hashlib.blake2b(password.encode(), digest_size=8).digest(),
+                mask_password(password),
+            )
+            batch.append((line_no, password))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def audit_file(
+    source_path: str,
+    output_path: str,
+    min_length: int = 12,
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Audit a file of passwords (one per line) in a process pool
+
+    Lines are streamed in batches with a bounded number in flight, and each
+    result row is written to CSV as soon as its batch completes. Plaintext
+    passwords are never written out; reuse is tracked by digest.
+
+    Args:
+        source_path: Text file with one candidate password per line
+        output_path: Per-entry CSV report to write
+        min_length: Policy minimum length
+        workers: Number of worker processes (defaults to CPU count)
+        batch_size: Passwords per worker task
+        progress: Callback receiving (passwords scored, bytes read)
+
+    Returns:
+        Aggregate statistics
+    """
+    workers = workers or os.cpu_count() or 1
+    reuse = HeavyHitters()
+    stats: Dict[str, Any] = {
+        "total": 0,
+        "skipped": 0,
+        "bytes": 0,
+        "scores": [0] * len(STRENGTH_LABELS),
+        "failures": Counter(),
+        "log10_sum": 0.0,
+    }
+
+    with open(output_path, "w", encoding="utf-8", newline="") as out:
+        writer = csv.writer(out)
+        writer.writerow(CSV_HEADER)
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(min_length,)
+        ) as executor:
+            for rows in pipelined_map(
+                executor,
+                _score_batch,
+                _read_batches(source_path, batch_size, reuse, stats),
+                workers * 4,
+            ):
+                for line_no, length, score, log10, failures in rows:
+                    writer.writerow(
+                        [
+                            line_no,
+                            length,
+                            score,
+                            STRENGTH_LABELS[score],
+                            log10,
+                            ";".join(failures),
+                        ]
+                    )
+                    stats["scores"][score] += 1
+                    stats["failures"].update(failures)
+                    stats["log10_sum"] += log10
+                stats["total"] += len(rows)
+                if progress:
+                    progress(stats["total"], stats["bytes"])
+
+    stats["reused"] = reuse.top(20)
+    stats["avg_guesses_log10"] = (
+        stats["log10_sum"] / stats["total"] if stats["total"] else 0.0
+    )
+    return stats
+
+
+def write_summary(stats: Dict[str, Any], path: str):
+    """Write aggregate audit statistics as a section,key,value CSV"""
+    total = stats["total"] or 1
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["section", "key", "value", "percent"])
+        writer.writerow(["summary", "passwords", stats["total"], ""])
+        writer.writerow(["summary", "skipped_lines", stats["skipped"], ""])
+        writer.writerow(
+            ["summary", "avg_guesses_log10", f"{stats['avg_guesses_log10']:.2f}", ""]
+        )
+        for label, count in zip(STRENGTH_LABELS, stats["scores"]):
+            writer.writerow(["strength", label, count, f"{count * 100 / total:.1f}"])
+        for code, count in stats["failures"].most_common():
+            writer.writerow(
+                ["failure", FAILURE_LABELS[code], count, f"{count * 100 / total:.1f}"]
+            )
+        for masked, count in stats["reused"]:
+            writer.writerow(["reused", masked, count, f"{count * 100 / total:.1f}"])
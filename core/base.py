@@ -6,11 +6,17 @@ Base classes and core functionality for all modules
 
 import os
 import sys
+import time
+import shutil
+import signal
+import asyncio
 import logging
 import subprocess
 import platform
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from collections import deque
+from concurrent.futures import Executor
+from typing import Optional, List, Dict, Any, Callable, Iterable, Iterator
 from datetime import datetime
 
 
@@ -74,7 +80,7 @@ class SystemInfo:
         self.os_version = platform.version()
         self.os_release = platform.release()
         self.machine = platform.machine()
-        self.processor = platform.processor()
+        self._processor: Optional[str] = None
         self.python_version = platform.python_version()
 
         # Detect Termux environment
@@ -89,6 +95,13 @@ class SystemInfo:
         # Set package manager
         self.package_manager = self._detect_package_manager()
 
+    @property
+    def processor(self) -> str:
+        """Processor name, resolved on first use (it may fork `uname -p`)"""
+        if self._processor is None:
+            self._processor = platform.processor()
+        return self._processor
+
     def _is_termux(self) -> bool:
         """Check if running in Termux"""
         try:
@@ -124,25 +137,8 @@ class SystemInfo:
         return "unknown"
 
     def is_command_available(self, command: str) -> bool:
-        """Check if a command is available"""
-        try:
-            if self.os_type == "windows":
-                result = subprocess.run(
-                    ["where", command],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=5,
-                )
-            else:
-                result = subprocess.run(
-                    ["which", command],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=5,
-                )
-            return result.returncode == 0
-        except:
-            return False
+        """Check if a command is available on PATH (no subprocess)"""
+        return shutil.which(command) is not None
 
     def get_terminal_size(self) -> tuple:
         """Get terminal size (columns, lines)"""
@@ -225,6 +221,141 @@ class CommandExecutor:
             self.logger.error(f"Unexpected error executing command: {e}")
             raise
 
+    def run_concurrent(
+        self,
+        commands: Dict[str, List[str]],
+        timeout: Optional[float] = None,
+        on_line: Optional[Callable[[str, str], None]] = None,
+        on_done: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run several commands at once with streamed, merged output
+
+        Each command gets its own timeout, so one slow command never holds
+        up the others. stdout and stderr are merged and delivered line by
+        line as they arrive.
+
+        Args:
+            commands: Mapping of name to argv list
+            timeout: Per-command timeout in seconds
+            on_line: Callback receiving (name, line) for every output line
+            on_done: Callback receiving (name, result) as each command ends
+
+        Returns:
+            Mapping of name to result dictionary with returncode, lines,
+            seconds, timed_out and error
+        """
+        return asyncio.run(self._run_all(commands, timeout, on_line, on_done))
+
+    async def _run_all(self, commands, timeout, on_line, on_done):
+        tasks = [
+            self._run_async(name, argv, timeout, on_line, on_done)
+            for name, argv in commands.items()
+        ]
+        # _run_async handles its own errors; this is a last line of defence
+        # so one failure never discards the other commands' results
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        collected = {}
+        for name, outcome in zip(commands, results):
+            if isinstance(outcome, BaseException):
+                collected[name] = {
+                    "returncode": None,
+                    "lines": [],
+                    "seconds": 0.0,
+                    "timed_out": False,
+                    "error": str(outcome),
+                }
+            else:
+                collected[name] = outcome[1]
+        return collected
+
+    async def _run_async(self, name, argv, timeout, on_line, on_done):
+        result: Dict[str, Any] = {
+            "returncode": None,
+            "lines": [],
+            "seconds": 0.0,
+            "timed_out": False,
+            "error": None,
+        }
+        start = time.perf_counter()
+        self.logger.debug(f"Executing command: {' '.join(argv)}")
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                start_new_session=os.name == "posix",
+            )
+        except OSError as e:
+            result["error"] = str(e)
+            result["seconds"] = time.perf_counter() - start
+            if on_done:
+                on_done(name, result)
+            return name, result
+
+        def emit(line: bytes):
+            text = line.decode("utf-8", errors="replace").rstrip()
+            result["lines"].append(text)
+            if on_line:
+                on_line(name, text)
+
+        async def pump():
+            # Chunked reads: readline() fails on lines over the 64 KiB
+            # stream limit, which some engines print (e.g. long hex dumps)
+            pending = b""
+            while True:
+                chunk = await proc.stdout.read(65536)
+                if not chunk:
+                    break
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    emit(line)
+            if pending:
+                emit(pending)
+            await proc.wait()
+
+        try:
+            await asyncio.wait_for(pump(), timeout)
+        except asyncio.TimeoutError:
+            result["timed_out"] = True
+            self.logger.error(f"Command timed out: {' '.join(argv)}")
+        except Exception as e:
+            result["error"] = str(e)
+            self.logger.error(f"Command failed: {' '.join(argv)}: {e}")
+        finally:
+            if proc.returncode is None:
+                await self._terminate(proc)
+
+        result["returncode"] = proc.returncode
+        result["seconds"] = time.perf_counter() - start
+        self.logger.debug(f"{name} completed with return code: {proc.returncode}")
+        if on_done:
+            on_done(name, result)
+        return name, result
+
+    async def _terminate(self, proc):
+        """Stop a command and everything it started"""
+        # SIGTERM first: sudo relays it to the command, SIGKILL would not.
+        # Signal the whole session so children holding the pipe die too.
+        self._signal_group(proc, signal.SIGTERM)
+        try:
+            await asyncio.wait_for(proc.wait(), 5)
+        except asyncio.TimeoutError:
+            self._signal_group(proc, getattr(signal, "SIGKILL", signal.SIGTERM))
+            await proc.wait()
+
+    @staticmethod
+    def _signal_group(proc, sig: int):
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(proc.pid, sig)
+            else:
+                proc.send_signal(sig)
+        except (ProcessLookupError, PermissionError):
+            pass
+
     def run_silent(self, command: str, timeout: Optional[int] = 5) -> bool:
         """
         Run command silently and return success status
@@ -317,6 +448,27 @@ def validate_ip(ip: str) -> bool:
     return ip_pattern.match(ip) is not None
 
 
+def pipelined_map(
+    executor: Executor,
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    window: int,
+) -> Iterator[Any]:
+    """
+    Map func over items on an executor, yielding results in input order
+
+    At most `window` jobs are in flight, so memory stays bounded even when
+    items is a stream over a huge file.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
 def get_timestamp() -> str:
     """Get current timestamp string"""
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Breach Module
+Offline breached-password lookup over a memory-mapped sorted SHA1 file
+"""
+
+import os
+import hashlib
+from typing import Optional, Callable, Iterator, Dict
+
+from .utils import get_config
+from .digestset import (
+    DigestSet,
+    SharedDigestSet,
+    write_digest_set,
+    DEFAULT_BATCH_RECORDS,
+)
+
+# Records are raw 20-byte SHA1 digests in a digest set file (see digestset)
+
+MAGIC = b"PYTBRH1\x00"
+RECORD_SIZE = 20
+
+PROGRESS_INTERVAL = 1_000_000  # input lines between progress callbacks
+
+
+class BreachedHashStore(DigestSet):
+    """Read-only, memory-mapped set of breached password SHA1 digests"""
+
+    def __init__(self, path: str):
+        try:
+            super().__init__(path, MAGIC, RECORD_SIZE)
+        except ValueError as e:
+            raise ValueError(f"Not a valid PyTools breach database: {e}")
+
+    def contains_hash(self, sha1_hex: str) -> bool:
+        """Check a hex SHA1 string"""
+        return self.contains_digest(bytes.fromhex(sha1_hex))
+
+    def contains(self, password: str) -> bool:
+        """Check whether a password appears in the breach corpus"""
+        return self.contains_digest(hashlib.sha1(password.encode("utf-8")).digest())
+
+
+def _parse_line(line: bytes, plaintext: bool) -> Optional[bytes]:
+    """Turn an input line into a digest ("HEX", "HEX:count" or a password)"""
+    line = line.rstrip(b"\r\n")
+    if plaintext:
+        return hashlib.sha1(line).digest() if line else None
+    value = line.split(b":", 1)[0].strip()
+    if len(value) != RECORD_SIZE * 2:
+        return None
+    try:
+        return bytes.fromhex(value.decode("ascii"))
+    except ValueError:
+        return None
+
+
+def _read_digests(
+    source_path: str,
+    plaintext: bool,
+    stats: Dict[str, int],
+    progress: Optional[Callable[[int], None]],
+) -> Iterator[bytes]:
+    with open(source_path, "rb", buffering=1024 * 1024) as f:
+        for line in f:
+            stats["lines"] += 1
+            digest = _parse_line(line, plaintext)
+            if digest is None:
+                stats["skipped"] += 1
+                continue
+            yield digest
+            if progress and stats["lines"] % PROGRESS_INTERVAL == 0:
+                progress(stats["lines"])
+
+
+def build_store(
+    source_path: str,
+    output_path: str,
+    plaintext: bool = False,
+    batch_records: int = DEFAULT_BATCH_RECORDS,
+    progress: Optional[Callable[[int], None]] = None,
+) -> dict:
+    """
+    Build a breach database from a hash list by external merge sort
+
+    Args:
+        source_path: Text file of SHA1 hex hashes (optionally "HEX:count")
+        output_path: Database file to create
+        plaintext: Treat each line as a plaintext password to hash
+        batch_records: Digests held in memory per sorted run
+        progress: Callback receiving the number of input lines read so far
+
+    Returns:
+        Dictionary with lines read, records written and lines skipped
+    """
+    stats = {"lines": 0, "skipped": 0}
+    written = write_digest_set(
+        _read_digests(source_path, plaintext, stats, progress),
+        output_path,
+        MAGIC,
+        RECORD_SIZE,
+        batch_records,
+    )
+
+    if progress:
+        progress(stats["lines"])
+
+    return {"lines": stats["lines"], "records": written, "skipped": stats["skipped"]}
+
+
+def get_store_path() -> str:
+    """Configured breach database path (defaults to the config directory)"""
+    config = get_config()
+    path = config.get("security.breach_db", "")
+    if path:
+        return os.path.expanduser(path)
+    return os.path.join(config.config_dir, "breached.db")
+
+
+_shared = SharedDigestSet(BreachedHashStore, get_store_path)
+
+
+def get_breach_store() -> Optional[BreachedHashStore]:
+    """Get the shared breach store, or None if no database is installed"""
+    return _shared.get()
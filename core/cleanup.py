@@ -0,0 +1,903 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Cleanup Module
+Cleanup providers, rule-based planning and batched parallel deletion
+"""
+
+import os
+import re
+import stat
+import heapq
+import queue
+import fnmatch
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeout
+from typing import (
+    Optional,
+    Dict,
+    List,
+    Any,
+    Tuple,
+    Set,
+    NamedTuple,
+    Callable,
+    Type,
+)
+
+import psutil
+
+from .base import SystemInfo, CommandExecutor
+from .diskusage import allocated_size
+from .utils import get_config
+
+DEFAULT_EXCLUDES = [
+    "systemd-private-*",
+    "snap-private-tmp",
+    ".X11-unix",
+    ".ICE-unix",
+    ".font-unix",
+    ".XIM-unix",
+    ".X*-lock",
+    "tmux-*",
+    "ssh-*",
+]
+
+
+class CleanupRule(NamedTuple):
+    """What to remove under one directory"""
+
+    category: str
+    path: str
+    min_age_days: float = 0.0
+    min_size: int = 0
+    patterns: Tuple[str, ...] = ("*",)
+    excludes: Tuple[str, ...] = ()
+
+
+class PlannedFile(NamedTuple):
+    """A file selected for deletion and the identity it had when planned"""
+
+    path: str
+    size: int
+    root: str
+    dev: int
+    ino: int
+    uid: int
+    # Newest of atime/mtime/ctime; any change means the file was touched
+    newest: float
+
+
+class PlannedDir(NamedTuple):
+    """An old directory to remove once emptied"""
+
+    path: str
+    root: str
+    dev: int
+    ino: int
+
+
+class CleanupPlan:
+    """Files selected for deletion, grouped by category"""
+
+    def __init__(self):
+        self.files: Dict[str, List[PlannedFile]] = {}
+        self.dirs: Dict[str, List[PlannedDir]] = {}
+        self.skipped: Dict[str, Dict[str, int]] = {}
+        self.errors = 0
+        self.seconds = 0.0
+
+    def add_category(self, category: str):
+        self.files.setdefault(category, [])
+        self.dirs.setdefault(category, [])
+        self.skipped.setdefault(category, {"young": 0, "in_use": 0, "foreign": 0})
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per-category file count and reclaimable bytes"""
+        return [
+            {
+                "category": category,
+                "files": len(files),
+                "bytes": sum(f.size for f in files),
+                "dirs": len(self.dirs[category]),
+                **self.skipped[category],
+            }
+            for category, files in self.files.items()
+        ]
+
+    @property
+    def total_files(self) -> int:
+        return sum(len(files) for files in self.files.values())
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(f.size for files in self.files.values() for f in files)
+
+    def largest(self, count: int = 10) -> List[Tuple[int, str, str]]:
+        """(size, path, category) of the largest planned files"""
+        return heapq.nlargest(
+            count,
+            (
+                (f.size, f.path, category)
+                for category, files in self.files.items()
+                for f in files
+            ),
+        )
+
+
+def open_file_ids() -> Set[Tuple[int, int]]:
+    """
+    (st_dev, st_ino) of every file currently open by a visible process
+
+    Linux stats /proc/<pid>/fd/<n> directly, which also covers files that
+    were opened by a path that no longer exists. Elsewhere psutil's
+    open_files() paths are used.
+    """
+    ids: Set[Tuple[int, int]] = set()
+    if os.path.isdir("/proc/self/fd"):
+        for pid in os.listdir("/proc"):
+            if not pid.isdigit():
+                continue
+            fd_dir = f"/proc/{pid}/fd"
+            try:
+                fds = os.listdir(fd_dir)
+            except OSError:
+                continue
+            for fd in fds:
+                try:
+                    st = os.stat(f"{fd_dir}/{fd}")
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    ids.add((st.st_dev, st.st_ino))
+        return ids
+
+    for proc in psutil.process_iter():
+        try:
+            files = proc.open_files()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, OSError):
+            continue
+        for f in files:
+            try:
+                st = os.stat(f.path)
+            except OSError:
+                continue
+            ids.add((st.st_dev, st.st_ino))
+    return ids
+
+
+def _compile(patterns: Tuple[str, ...]) -> Optional[Callable[[str], Any]]:
+    """One regex for a set of globs; None when nothing (or everything) matches"""
+    if not patterns or "*" in patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns)).match
+
+
+class CleanupPlanner:
+    """
+    Parallel walk of every rule root, selecting files to delete
+
+    Workers share one queue of (rule, directory) items. A file is planned
+    when it matches the rule's patterns, is at least min_size bytes, and
+    its newest timestamp (access, modify or change) is older than the
+    rule's age. Files held open by a running process, files another user
+    owns in a sticky directory (they could not be removed), sockets, FIFOs
+    and devices are left alone. Directories below the rule root that are
+    old enough are planned for removal once emptied.
+
+    Like systemd-tmpfiles, the walk never leaves the filesystem of the rule
+    root, so bind mounts and other filesystems mounted below it are skipped.
+    """
+
+    def __init__(
+        self,
+        rules: List[CleanupRule],
+        workers: Optional[int] = None,
+        open_files: Optional[Set[Tuple[int, int]]] = None,
+    ):
+        self.rules = [r for r in rules if os.path.isdir(r.path)]
+        self._excludes = [_compile(r.excludes) for r in self.rules]
+        self._patterns = [_compile(r.patterns) for r in self.rules]
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._uid = os.geteuid() if hasattr(os, "geteuid") else None
+        self._open = open_files
+
+    def plan(self) -> CleanupPlan:
+        start = time.perf_counter()
+        result = CleanupPlan()
+        for rule in self.rules:
+            result.add_category(rule.category)
+        if not self.rules:
+            return result
+
+        if self._open is None:
+            self._open = open_file_ids()
+        self._now = time.time()
+        self._devices = []
+        for index, rule in enumerate(self.rules):
+            self._devices.append(os.stat(rule.path).st_dev)
+            self._queue.put((index, rule.path))
+
+        threads = [
+            threading.Thread(target=self._worker, args=(result,), daemon=True)
+            for _ in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        self._queue.join()
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join()
+
+        for category in result.dirs:
+            # Deepest first, so parents are empty by the time they are reached
+            result.dirs[category].sort(key=lambda d: d.path.count(os.sep), reverse=True)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _worker(self, result: CleanupPlan):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            try:
+                self._scan(result, *item)
+            finally:
+                self._queue.task_done()
+
+    def _scan(self, result: CleanupPlan, index: int, directory: str):
+        rule = self.rules[index]
+        excluded = self._excludes[index]
+        wanted = self._patterns[index]
+        device = self._devices[index]
+        cutoff = self._now - rule.min_age_days * 86400
+        files: List[PlannedFile] = []
+        dirs: List[PlannedDir] = []
+        young = in_use = foreign = errors = 0
+        try:
+            sticky = os.stat(directory).st_mode & stat.S_ISVTX
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if excluded and excluded(entry.name):
+                        continue
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        errors += 1
+                        continue
+                    if sticky and self._uid not in (None, 0, st.st_uid):
+                        foreign += 1
+                        continue
+                    if stat.S_ISDIR(st.st_mode):
+                        if st.st_dev != device:
+                            continue  # a mount point: another filesystem
+                        self._queue.put((index, entry.path))
+                        # Directory atime is bumped by this walk itself
+                        if max(st.st_mtime, st.st_ctime) < cutoff:
+                            dirs.append(
+                                PlannedDir(entry.path, rule.path, st.st_dev, st.st_ino)
+                            )
+                        continue
+                    if not (stat.S_ISREG(st.st_mode) or stat.S_ISLNK(st.st_mode)):
+                        continue
+                    if wanted and not wanted(entry.name):
+                        continue
+                    if st.st_size < rule.min_size:
+                        continue
+                    newest = max(st.st_atime, st.st_mtime, st.st_ctime)
+                    if newest >= cutoff:
+                        young += 1
+                        continue
+                    if (st.st_dev, st.st_ino) in self._open:
+                        in_use += 1
+                        continue
+                    size = allocated_size(st) if stat.S_ISREG(st.st_mode) else 0
+                    files.append(
+                        PlannedFile(
+                            entry.path,
+                            size,
+                            rule.path,
+                            st.st_dev,
+                            st.st_ino,
+                            st.st_uid,
+                            newest,
+                        )
+                    )
+        except OSError:
+            errors += 1
+
+        with self._lock:
+            result.files[rule.category].extend(files)
+            result.dirs[rule.category].extend(dirs)
+            skipped = result.skipped[rule.category]
+            skipped["young"] += young
+            skipped["in_use"] += in_use
+            skipped["foreign"] += foreign
+            result.errors += errors
+
+
+_DIR_FLAGS = os.O_RDONLY | os.O_DIRECTORY | getattr(os, "O_NOFOLLOW", 0)
+
+
+def _open_parent(root: str, path: str, device: int) -> int:
+    """
+    Directory fd of `path`'s parent, opened one component at a time
+
+    Every component below the trusted rule root is opened relative to the
+    previous one with O_NOFOLLOW, so a directory swapped for a symlink
+    after planning fails with ELOOP/ENOTDIR instead of being followed, and
+    one on another filesystem is refused.
+    """
+    fd = os.open(root, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        relative = os.path.relpath(os.path.dirname(path), root)
+        for name in relative.split(os.sep) if relative != os.curdir else ():
+            child = os.open(name, _DIR_FLAGS, dir_fd=fd)
+            os.close(fd)
+            fd = child
+            if os.fstat(fd).st_dev != device:
+                raise OSError(f"{path}: crosses a mount point")
+    except OSError:
+        os.close(fd)
+        raise
+    return fd
+
+
+def _delete_batch(
+    batch: List[PlannedFile], open_files: Set[Tuple[int, int]]
+) -> Tuple[int, int, int, int]:
+    """
+    Unlink one directory's worth of planned files relative to its fd
+
+    Each name is re-stat'ed right before unlinking and dropped when its
+    inode, owner or timestamps differ from the plan or it has been opened
+    since. Unlinking by name in an fd-held directory never follows links.
+    """
+    freed = removed = failed = changed = 0
+    try:
+        fd = _open_parent(batch[0].root, batch[0].path, batch[0].dev)
+    except OSError:
+        return 0, 0, len(batch), 0
+    try:
+        for item in batch:
+            name = os.path.basename(item.path)
+            try:
+                st = os.stat(name, dir_fd=fd, follow_symlinks=False)
+            except FileNotFoundError:
+                continue
+            except OSError:
+                failed += 1
+                continue
+            if (
+                st.st_dev != item.dev
+                or st.st_ino != item.ino
+                or st.st_uid != item.uid
+                or max(st.st_atime, st.st_mtime, st.st_ctime) != item.newest
+                or (st.st_dev, st.st_ino) in open_files
+            ):
+                changed += 1
+                continue
+            try:
+                os.unlink(name, dir_fd=fd)
+                freed += item.size
+                removed += 1
+            except FileNotFoundError:
+                continue
+            except OSError:
+                failed += 1
+    finally:
+        os.close(fd)
+    return freed, removed, failed, changed
+
+
+def _remove_dir(item: PlannedDir) -> bool:
+    """rmdir relative to the parent's fd, if it is still the planned inode"""
+    try:
+        fd = _open_parent(item.root, item.path, item.dev)
+    except OSError:
+        return False
+    try:
+        name = os.path.basename(item.path)
+        st = os.stat(name, dir_fd=fd, follow_symlinks=False)
+        if st.st_ino != item.ino or not stat.S_ISDIR(st.st_mode):
+            return False
+        os.rmdir(name, dir_fd=fd)
+        return True
+    except OSError:
+        return False  # not empty, or not ours
+    finally:
+        os.close(fd)
+
+
+def execute_plan(
+    plan: CleanupPlan,
+    workers: Optional[int] = None,
+    batch_size: int = 256,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, int]:
+    """
+    Delete planned files in batches on a thread pool, then empty directories
+
+    Files are batched per directory so each batch works through one
+    directory fd. Unlink is a single syscall that releases the GIL, so a
+    few threads keep the filesystem busy. Open files are looked up again
+    first: anything opened since planning is kept.
+
+    Returns:
+        Dictionary with freed bytes, removed files/directories, failures and
+        files kept because they changed since planning
+    """
+    workers = workers or min(16, (os.cpu_count() or 1) * 2)
+    by_dir: Dict[str, List[PlannedFile]] = {}
+    for files in plan.files.values():
+        for item in files:
+            by_dir.setdefault(os.path.dirname(item.path), []).append(item)
+    batches = [
+        items[i : i + batch_size]
+        for items in by_dir.values()
+        for i in range(0, len(items), batch_size)
+    ]
+    total = sum(len(b) for b in batches)
+    totals = {"freed": 0, "removed": 0, "failed": 0, "changed": 0, "dirs": 0}
+
+    open_files = open_file_ids()
+    done = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda b: _delete_batch(b, open_files), batches)
+        for (freed, removed, failed, changed), batch in zip(results, batches):
+            totals["freed"] += freed
+            totals["removed"] += removed
+            totals["failed"] += failed
+            totals["changed"] += changed
+            done += len(batch)
+            if progress:
+                progress(done, total)
+
+    for dirs in plan.dirs.values():
+        for item in dirs:
+            if _remove_dir(item):
+                totals["dirs"] += 1
+    return totals
+
+
+_open_files: Optional[Set[Tuple[int, int]]] = None
+_open_files_time = 0.0
+_open_files_lock = threading.Lock()
+
+
+def shared_open_file_ids(max_age: float = 10.0) -> Set[Tuple[int, int]]:
+    """open_file_ids() computed once for providers estimating concurrently"""
+    global _open_files, _open_files_time
+    with _open_files_lock:
+        if _open_files is None or time.monotonic() - _open_files_time > max_age:
+            _open_files = open_file_ids()
+            _open_files_time = time.monotonic()
+        return _open_files
+
+
+def _cache_home() -> str:
+    return os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+
+class CleanupProvider:
+    """
+    One source of reclaimable space
+
+    Subclasses describe themselves with name/description, say which
+    systems they apply to in supports(), and implement estimate() (must
+    not change anything; it runs concurrently with other providers) and
+    clean() (returns bytes freed). `detail` is a short note filled in by
+    estimate() for the summary screen.
+    """
+
+    name = ""
+    description = ""
+    # Pre-selected in the cleanup menu
+    default = True
+
+    def __init__(self, system_info: SystemInfo):
+        self.system_info = system_info
+        self.detail = ""
+
+    @classmethod
+    def supports(cls, system_info: SystemInfo) -> bool:
+        return True
+
+    def unavailable_reason(self) -> Optional[str]:
+        """Why this provider can't run right now, or None"""
+        return None
+
+    def estimate(self) -> int:
+        raise NotImplementedError
+
+    def clean(self, executor: CommandExecutor) -> int:
+        raise NotImplementedError
+
+
+PROVIDERS: List[Type[CleanupProvider]] = []
+
+
+def register_provider(cls: Type[CleanupProvider]) -> Type[CleanupProvider]:
+    """Class decorator adding a provider to the cleanup menu"""
+    PROVIDERS.append(cls)
+    return cls
+
+
+def get_providers(system_info: SystemInfo) -> List[CleanupProvider]:
+    """Instances of every registered provider that applies to this system"""
+    return [cls(system_info) for cls in PROVIDERS if cls.supports(system_info)]
+
+
+class RuleProvider(CleanupProvider):
+    """Provider that deletes files selected by CleanupRules"""
+
+    needs_write_access = False
+
+    def __init__(self, system_info: SystemInfo):
+        super().__init__(system_info)
+        self.plan: Optional[CleanupPlan] = None
+
+    def rules(self) -> List[CleanupRule]:
+        raise NotImplementedError
+
+    def unavailable_reason(self) -> Optional[str]:
+        roots = [r.path for r in self.rules() if os.path.isdir(r.path)]
+        if not roots:
+            return "not present"
+        if self.needs_write_access and not any(os.access(p, os.W_OK) for p in roots):
+            return "needs root"
+        return None
+
+    def _plan(self, open_files: Optional[Set[Tuple[int, int]]]) -> CleanupPlan:
+        return CleanupPlanner(
+            self.rules(),
+            get_config().get("performance.max_threads", None),
+            open_files,
+        ).plan()
+
+    def estimate(self) -> int:
+        self.plan = self._plan(shared_open_file_ids())
+        skipped = {"young": 0, "in_use": 0}
+        for item in self.plan.summary():
+            skipped["young"] += item["young"]
+            skipped["in_use"] += item["in_use"]
+        self.detail = f"{self.plan.total_files:,} files"
+        if skipped["in_use"]:
+            self.detail += f", {skipped['in_use']:,} in use"
+        if skipped["young"]:
+            self.detail += f", {skipped['young']:,} too new"
+        return self.plan.total_bytes
+
+    def clean(self, executor: CommandExecutor) -> int:
+        # The estimate's plan predates the selection and confirm prompts;
+        # plan again so only what qualifies now is deleted
+        self.plan = self._plan(None)
+        result = execute_plan(
+            self.plan, get_config().get("performance.max_threads", None)
+        )
+        return result["freed"]
+
+
+@register_provider
+class TempFilesProvider(RuleProvider):
+    name = "Temporary files"
+    description = "Old files in the system temp directories"
+
+    def rules(self) -> List[CleanupRule]:
+        config = get_config()
+        age = float(config.get("system.clean_tmp_age_days", 7))
+        excludes = tuple(config.get("system.clean_exclude_patterns", DEFAULT_EXCLUDES))
+        if self.system_info.os_type == "darwin":
+            return [CleanupRule(self.name, "/private/tmp", age, excludes=excludes)]
+        return [
+            CleanupRule(self.name, "/tmp", age, excludes=excludes),
+            CleanupRule(self.name, "/var/tmp", age * 4, excludes=excludes),
+        ]
+
+
+@register_provider
+class ThumbnailCacheProvider(RuleProvider):
+    name = "Thumbnail cache"
+    description = "Desktop file manager thumbnails"
+
+    @classmethod
+    def supports(cls, system_info: SystemInfo) -> bool:
+        return system_info.os_type == "linux"
+
+    def rules(self) -> List[CleanupRule]:
+        return [CleanupRule(self.name, os.path.join(_cache_home(), "thumbnails"))]
+
+
+@register_provider
+class UserCacheProvider(RuleProvider):
+    name = "User caches"
+    description = "Application caches and logs in ~/Library"
+
+    @classmethod
+    def supports(cls, system_info: SystemInfo) -> bool:
+        return system_info.os_type == "darwin"
+
+    def rules(self) -> List[CleanupRule]:
+        library = os.path.expanduser("~/Library")
+        age = float(get_config().get("system.clean_tmp_age_days", 7))
+        return [
+            CleanupRule(self.name, os.path.join(library, "Caches"), age),
+            CleanupRule(self.name, os.path.join(library, "Logs"), 30),
+        ]
+
+
+@register_provider
+class PipCacheProvider(RuleProvider):
+    name = "pip cache"
+    description = "Downloaded and built Python packages"
+
+    def rules(self) -> List[CleanupRule]:
+        if self.system_info.os_type == "darwin":
+            path = os.path.expanduser("~/Library/Caches/pip")
+        else:
+            path = os.path.join(_cache_home(), "pip")
+        return [CleanupRule(self.name, path)]
+
+
+@register_provider
+class NpmCacheProvider(RuleProvider):
+    name = "npm cache"
+    description = "npm content-addressable package cache"
+
+    def rules(self) -> List[CleanupRule]:
+        return [CleanupRule(self.name, os.path.expanduser("~/.npm/_cacache"))]
+
+
+@register_provider
+class CargoCacheProvider(RuleProvider):
+    name = "Cargo cache"
+    description = "Downloaded and extracted Rust crates"
+
+    def rules(self) -> List[CleanupRule]:
+        registry = os.path.expanduser("~/.cargo/registry")
+        return [
+            CleanupRule(self.name, os.path.join(registry, "cache")),
+            CleanupRule(self.name, os.path.join(registry, "src")),
+        ]
+
+
+@register_provider
+class BrowserCacheProvider(RuleProvider):
+    name = "Browser caches"
+    description = "Chrome, Chromium, Brave and Firefox disk caches"
+    default = False
+
+    def rules(self) -> List[CleanupRule]:
+        if self.system_info.os_type == "darwin":
+            base = os.path.expanduser("~/Library/Caches")
+            roots = ["Google/Chrome", "Chromium", "BraveSoftware", "Firefox"]
+        else:
+            base = _cache_home()
+            roots = ["google-chrome", "chromium", "BraveSoftware", "mozilla/firefox"]
+        return [CleanupRule(self.name, os.path.join(base, r)) for r in roots]
+
+
+@register_provider
+class OldLogsProvider(RuleProvider):
+    name = "Rotated logs"
+    description = "Compressed and rotated logs in /var/log"
+    needs_write_access = True
+
+    @classmethod
+    def supports(cls, system_info: SystemInfo) -> bool:
+        return system_info.os_type == "linux" and not system_info.is_termux
+
+    def rules(self) -> List[CleanupRule]:
+        age = float(get_config().get("system.clean_log_age_days", 30))
+        return [
+            CleanupRule(
+                self.name,
+                "/var/log",
+                age,
+                patterns=("*.gz", "*.xz", "*.bz2", "*.zst", "*.old", "*.[0-9]"),
+                excludes=("journal",),
+            )
+        ]
+
+
+@register_provider
+class CoreDumpProvider(RuleProvider):
+    name = "Core dumps"
+    description = "Crash dumps from systemd-coredump and apport"
+    needs_write_access = True
+
+    @classmethod
+    def supports(cls, system_info: SystemInfo) -> bool:
+        return system_info.os_type == "linux" and not system_info.is_termux
+
+    def rules(self) -> List[CleanupRule]:
+        return [
+            CleanupRule(self.name, "/var/lib/systemd/coredump"),
+            CleanupRule(self.name, "/var/crash"),
+        ]
+
+
+@register_provider
+class JournalProvider(CleanupProvider):
+    """
+    journald vacuum
+
+    Only archived journal files (named with "@") older than the retention
+    period are counted; the active journal is never touched.
+    """
+
+    name = "systemd journal"
+    description = "Archived journal files beyond the retention period"
+    roots = ("/var/log/journal", "/run/log/journal")
+
+    @classmethod
+    def supports(cls, system_info: SystemInfo) -> bool:
+        return system_info.os_type == "linux" and system_info.is_command_available(
+            "journalctl"
+        )
+
+    @property
+    def keep_days(self) -> int:
+        return int(get_config().get("system.journal_keep_days", 14))
+
+    def unavailable_reason(self) -> Optional[str]:
+        if not any(os.path.isdir(p) for p in self.roots):
+            return "no persistent journal"
+        return None
+
+    def estimate(self) -> int:
+        cutoff = time.time() - self.keep_days * 86400
+        total = files = 0
+        stack = [p for p in self.roots if os.path.isdir(p)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        if "@" not in entry.name or not entry.name.endswith(
+                            (".journal", ".journal~")
+                        ):
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                        if st.st_mtime < cutoff:
+                            total += allocated_size(st)
+                            files += 1
+            except OSError:
+                continue
+        self.detail = f"{files} archived files older than {self.keep_days}d"
+        return total
+
+    def clean(self, executor: CommandExecutor) -> int:
+        before = self.estimate()
+        executor.run(
+            f"journalctl --vacuum-time={self.keep_days}d",
+            capture_output=True,
+            sudo=True,
+        )
+        return max(before - self.estimate(), 0)
+
+
+@register_provider
+class AptCacheProvider(CleanupProvider):
+    name = "APT cache"
+    description = "Downloaded .deb packages"
+    archives = "/var/cache/apt/archives"
+
+    @classmethod
+    def supports(cls, system_info: SystemInfo) -> bool:
+        return system_info.package_manager in ["apt", "apt-get"]
+
+    def estimate(self) -> int:
+        total = files = 0
+        for directory in (self.archives, os.path.join(self.archives, "partial")):
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.name.endswith(".deb") and entry.is_file():
+                            total += allocated_size(entry.stat())
+                            files += 1
+            except OSError:
+                continue
+        self.detail = f"{files} packages"
+        return total
+
+    def clean(self, executor: CommandExecutor) -> int:
+        before = self.estimate()
+        executor.run("apt-get clean", capture_output=True, sudo=True)
+        return max(before - self.estimate(), 0)
+
+
+@register_provider
+class DockerImageProvider(CleanupProvider):
+    """Unused Docker images, as reported reclaimable by `docker system df`"""
+
+    name = "Docker images"
+    description = "Images not used by any container"
+    default = False
+    units = {"B": 1, "KB": 1000, "MB": 1000**2, "GB": 1000**3, "TB": 1000**4}
+
+    @classmethod
+    def supports(cls, system_info: SystemInfo) -> bool:
+        return system_info.is_command_available("docker")
+
+    def estimate(self) -> int:
+        executor = CommandExecutor(self.system_info)
+        output = executor.get_output(
+            "docker system df --format '{{.Type}}\t{{.Reclaimable}}'", timeout=30
+        )
+        if output is None:
+            self.detail = "daemon not reachable"
+            return 0
+        for line in output.splitlines():
+            kind, _, reclaimable = line.partition("\t")
+            if kind.strip() == "Images":
+                self.detail = reclaimable.strip()
+                return self._parse_size(reclaimable.split()[0])
+        return 0
+
+    def _parse_size(self, text: str) -> int:
+        match = re.match(r"([\d.]+)\s*([KMGT]?B)", text.upper())
+        if not match:
+            return 0
+        return int(float(match.group(1)) * self.units[match.group(2)])
+
+    def clean(self, executor: CommandExecutor) -> int:
+        before = self.estimate()
+        executor.run("docker image prune --all --force", capture_output=True)
+        return max(before - self.estimate(), 0)
+
+
+def estimate_all(
+    providers: List[CleanupProvider],
+    timeout: float = 60.0,
+    on_done: Optional[Callable[[CleanupProvider, Optional[int], str], None]] = None,
+) -> Dict[CleanupProvider, Optional[int]]:
+    """
+    Run every provider's estimate concurrently
+
+    on_done(provider, bytes, note) is called as each one finishes, so a
+    summary can fill in progressively. Providers that are unavailable,
+    fail or exceed the timeout get None.
+    """
+    results: Dict[CleanupProvider, Optional[int]] = {}
+    runnable = []
+    for provider in providers:
+        reason = provider.unavailable_reason()
+        if reason:
+            results[provider] = None
+            if on_done:
+                on_done(provider, None, reason)
+        else:
+            runnable.append(provider)
+    if not runnable:
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=len(runnable))
+    futures = {executor.submit(p.estimate): p for p in runnable}
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            provider = futures[future]
+            try:
+                size = future.result()
+                note = provider.detail
+            except Exception as e:
+                size, note = None, f"error: {e}"
+            results[provider] = size
+            if on_done:
+                on_done(provider, size, note)
+    except FuturesTimeout:
+        for future, provider in futures.items():
+            if provider not in results:
+                future.cancel()
+                results[provider] = None
+                if on_done:
+                    on_done(provider, None, "timed out")
+    finally:
+        executor.shutdown(wait=False)
+    return results
@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Crypto Module
+Chunked, authenticated file encryption container
+"""
+
+import os
+import time
+import random
+import struct
+import hashlib
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Iterator, BinaryIO
+
+from .base import pipelined_map
+
+# Container layout (version 2):
+#
+#   header  = magic | version | cipher | kdf | log2(N) | r | p | salt
+#             | nonce prefix | chunk size | plaintext size
+#   chunk_i = AES-256-GCM(plaintext[i * chunk_size:(i + 1) * chunk_size])
+#
+# Every chunk is sealed with nonce = prefix || i (big-endian u32) and the
+# header plus a "final chunk" flag as associated data, so chunks cannot be
+# reordered, truncated or moved between files without failing the tag check.
+
+MAGIC = b"PYTENC"
+VERSION = 2
+CIPHER_AES_256_GCM = 1
+KDF_SCRYPT = 1
+
+HEADER = struct.Struct(">6sBBBBBB16s8sIQ")
+TAG_SIZE = 16
+KEY_SIZE = 32
+SALT_SIZE = 16
+NONCE_PREFIX_SIZE = 8
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1MB
+DEFAULT_KDF_LOG_N = 15
+DEFAULT_KDF_R = 8
+DEFAULT_KDF_P = 1
+
+LEGACY_BLOCK = 32 * 2048  # multiple of the legacy 32-byte key
+
+
+class ContainerHeader:
+    """Parsed header of an encrypted container"""
+
+    def __init__(
+        self,
+        salt: bytes,
+        nonce_prefix: bytes,
+        chunk_size: int,
+        plaintext_size: int,
+        kdf_log_n: int = DEFAULT_KDF_LOG_N,
+        kdf_r: int = DEFAULT_KDF_R,
+        kdf_p: int = DEFAULT_KDF_P,
+        version: int = VERSION,
+        cipher: int = CIPHER_AES_256_GCM,
+        kdf: int = KDF_SCRYPT,
+    ):
+        self.salt = salt
+        self.nonce_prefix = nonce_prefix
+        self.chunk_size = chunk_size
+        self.plaintext_size = plaintext_size
+        self.kdf_log_n = kdf_log_n
+        self.kdf_r = kdf_r
+        self.kdf_p = kdf_p
+        self.version = version
+        self.cipher = cipher
+        self.kdf = kdf
+
+    @property
+    def chunk_count(self) -> int:
+        """Number of chunks (an empty file still has one empty chunk)"""
+        if self.plaintext_size == 0:
+            return 1
+        return (self.plaintext_size + self.chunk_size - 1) // self.chunk_size
+
+    def pack(self) -> bytes:
+        """Serialize header to bytes"""
+        return HEADER.pack(
+            MAGIC,
+            self.version,
+            self.cipher,
+            self.kdf,
+            self.kdf_log_n,
+            self.kdf_r,
+            self.kdf_p,
+            self.salt,
+            self.nonce_prefix,
+            self.chunk_size,
+            self.plaintext_size,
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "ContainerHeader":
+        """Parse header bytes, raising ValueError on unknown formats"""
+        if len(data) < HEADER.size or not data.startswith(MAGIC):
+            raise ValueError("Not a PyTools encrypted container")
+
+        (
+            _magic,
+            version,
+            cipher,
+            kdf,
+            log_n,
+            r,
+            p,
+            salt,
+            nonce_prefix,
+            chunk_size,
+            plaintext_size,
+        ) = HEADER.unpack(data[: HEADER.size])
+
+        if version != VERSION:
+            raise ValueError(f"Unsupported container version: {version}")
+        if cipher != CIPHER_AES_256_GCM or kdf != KDF_SCRYPT:
+            raise ValueError("Unsupported cipher or key derivation function")
+        if chunk_size <= 0:
+            raise ValueError("Corrupted container header")
+
+        return cls(
+            salt=salt,
+            nonce_prefix=nonce_prefix,
+            chunk_size=chunk_size,
+            plaintext_size=plaintext_size,
+            kdf_log_n=log_n,
+            kdf_r=r,
+            kdf_p=p,
+            version=version,
+            cipher=cipher,
+            kdf=kdf,
+        )
+
+
+def _get_aesgcm():
+    """Import AESGCM lazily so legacy decryption works without it"""
+    try:
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    except ImportError:
+        raise RuntimeError(
+            "The 'cryptography' package is required: pip install cryptography"
+        )
+    return AESGCM
+
+
+def derive_key(
+    password: str,
+    salt: bytes,
+    log_n: int = DEFAULT_KDF_LOG_N,
+    r: int = DEFAULT_KDF_R,
+    p: int = DEFAULT_KDF_P,
+) -> bytes:
+    """Derive a 256-bit key from a password with scrypt"""
+    n = 1 << log_n
+    # scrypt needs 128 * r * N bytes; leave headroom above hashlib's default
+    maxmem = 128 * r * (n + p + 2) + 16 * 1024 * 1024
+    return hashlib.scrypt(
+        password.encode(), salt=salt, n=n, r=r, p=p, maxmem=maxmem, dklen=KEY_SIZE
+    )
+
+
+def is_container(path: str) -> bool:
+    """Check whether a file starts with the container magic"""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def read_header(path: str) -> ContainerHeader:
+    """Read and parse the header of an encrypted container"""
+    with open(path, "rb") as f:
+        return ContainerHeader.unpack(f.read(HEADER.size))
+
+
+def _chunk_nonce(header: ContainerHeader, index: int) -> bytes:
+    return header.nonce_prefix + struct.pack(">I", index)
+
+
+def _chunk_aad(header_bytes: bytes, header: ContainerHeader, index: int) -> bytes:
+    final = b"\x01" if index == header.chunk_count - 1 else b"\x00"
+    return header_bytes + final
+
+
+def _default_workers() -> int:
+    return max(1, min(os.cpu_count() or 1, 8))
+
+
+@contextmanager
+def _atomic_output(path: str) -> Iterator[BinaryIO]:
+    """
+    Write to a temporary file beside `path`, replacing it only on success
+
+    A failed run never truncates or deletes an existing file, and output may
+    name the input itself: it's read in full before the rename.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def encrypt_file(
+    input_path: str,
+    output_path: str,
+    password: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    kdf_log_n: int = DEFAULT_KDF_LOG_N,
+    workers: Optional[int] = None,
+) -> ContainerHeader:
+    """
+    Encrypt a file into a chunked AES-256-GCM container
+
+    Memory use is bounded by workers * 2 chunks regardless of file size.
+
+    Args:
+        input_path: File to encrypt
+        output_path: Destination container path
+        password: Password for key derivation
+        chunk_size: Plaintext bytes per authenticated chunk
+        kdf_log_n: scrypt cost parameter as a power of two
+        workers: Number of encryption threads (defaults to CPU count)
+
+    Returns:
+        Header written to the container
+    """
+    AESGCM = _get_aesgcm()
+    workers = workers or _default_workers()
+
+    header = ContainerHeader(
+        salt=os.urandom(SALT_SIZE),
+        nonce_prefix=os.urandom(NONCE_PREFIX_SIZE),
+        chunk_size=chunk_size,
+        plaintext_size=os.path.getsize(input_path),
+        kdf_log_n=kdf_log_n,
+    )
+    header_bytes = header.pack()
+    aead = AESGCM(
+        derive_key(password, header.salt, header.kdf_log_n, header.kdf_r, header.kdf_p)
+    )
+
+    def seal(job):
+        index, data = job
+        return aead.encrypt(
+            _chunk_nonce(header, index),
+            data,
+            _chunk_aad(header_bytes, header, index),
+        )
+
+    def read_chunks(f_in):
+        remaining = header.plaintext_size
+        for index in range(header.chunk_count):
+            data = f_in.read(min(chunk_size, remaining))
+            if len(data) != min(chunk_size, remaining):
+                raise ValueError("Input file changed during encryption")
+            remaining -= len(data)
+            yield index, data
+
+    with _atomic_output(output_path) as f_out, open(input_path, "rb") as f_in:
+        f_out.write(header_bytes)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for sealed in pipelined_map(executor, seal, read_chunks(f_in), workers * 2):
+                f_out.write(sealed)
+
+    return header
+
+
+class ContainerReader:
+    """
+    Random-access reader for encrypted containers
+
+    Chunks have a fixed sealed size, so the header doubles as the chunk
+    index: chunk i lives at HEADER.size + i * (chunk_size + TAG_SIZE).
+    Only the chunks covering a requested byte range are read and opened.
+    """
+
+    def __init__(self, path: str, password: str, workers: Optional[int] = None):
+        AESGCM = _get_aesgcm()
+        from cryptography.exceptions import InvalidTag
+
+        self._invalid_tag = InvalidTag
+        self.path = path
+        self.workers = workers or _default_workers()
+
+        with open(path, "rb") as f:
+            self.header_bytes = f.read(HEADER.size)
+        self.header = ContainerHeader.unpack(self.header_bytes)
+        self.sealed_chunk_size = self.header.chunk_size + TAG_SIZE
+
+        expected = self.chunk_offset(self.header.chunk_count - 1) + TAG_SIZE
+        expected += self.header.plaintext_size - (
+            (self.header.chunk_count - 1) * self.header.chunk_size
+        )
+        actual = os.path.getsize(path)
+        if actual < expected:
+            raise ValueError("Encrypted file is truncated")
+        if actual > expected:
+            raise ValueError("Unexpected trailing data after last chunk")
+
+        self._aead = AESGCM(
+            derive_key(
+                password,
+                self.header.salt,
+                self.header.kdf_log_n,
+                self.header.kdf_r,
+                self.header.kdf_p,
+            )
+        )
+
+    def chunk_offset(self, index: int) -> int:
+        """File offset of a sealed chunk"""
+        return HEADER.size + index * self.sealed_chunk_size
+
+    def _open_chunk(self, job) -> bytes:
+        index, data = job
+        try:
+            return self._aead.decrypt(
+                _chunk_nonce(self.header, index),
+                data,
+                _chunk_aad(self.header_bytes, self.header, index),
+            )
+        except self._invalid_tag:
+            if index == 0:
+                raise ValueError("Wrong password or corrupted file")
+            raise ValueError(f"Integrity check failed at chunk {index}")
+
+    def _read_chunks(self, f, first: int, last: int) -> Iterator[tuple]:
+        f.seek(self.chunk_offset(first))
+        for index in range(first, last + 1):
+            yield index, f.read(self.sealed_chunk_size)
+
+    def iter_chunks(
+        self, first: int = 0, last: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """Yield decrypted chunks first..last (inclusive) in order"""
+        if last is None:
+            last = self.header.chunk_count - 1
+        with open(self.path, "rb") as f:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                yield from pipelined_map(
+                    executor,
+                    self._open_chunk,
+                    self._read_chunks(f, first, last),
+                    self.workers * 2,
+                )
+
+    def iter_range(self, offset: int, length: int) -> Iterator[bytes]:
+        """Yield plaintext for [offset, offset + length), clipped to file size"""
+        size = self.header.plaintext_size
+        if offset < 0 or length < 0:
+            raise ValueError("Offset and length must be non-negative")
+        end = min(offset + length, size)
+        if offset >= end:
+            return
+
+        chunk_size = self.header.chunk_size
+        first = offset // chunk_size
+        last = (end - 1) // chunk_size
+        for index, plain in enumerate(self.iter_chunks(first, last), start=first):
+            base = index * chunk_size
+            yield plain[max(offset - base, 0) : end - base]
+
+    def read_range(self, offset: int, length: int) -> bytes:
+        """Decrypt a byte range into memory"""
+        return b"".join(self.iter_range(offset, length))
+
+    def verify(self) -> int:
+        """Check every chunk tag without writing plaintext; returns chunk count"""
+        count = 0
+        for _ in self.iter_chunks():
+            count += 1
+        return count
+
+
+def decrypt_file(
+    input_path: str,
+    output_path: str,
+    password: str,
+    workers: Optional[int] = None,
+) -> ContainerHeader:
+    """
+    Decrypt a chunked container, verifying every chunk tag
+
+    Raises:
+        ValueError: Wrong password, corrupted or truncated container
+    """
+    reader = ContainerReader(input_path, password, workers)
+    with _atomic_output(output_path) as f_out:
+        for plain in reader.iter_chunks():
+            f_out.write(plain)
+    return reader.header
+
+
+def decrypt_range(
+    input_path: str,
+    output_path: str,
+    password: str,
+    offset: int,
+    length: int,
+    workers: Optional[int] = None,
+) -> int:
+    """
+    Decrypt only a byte range of a container to a file
+
+    Returns:
+        Number of plaintext bytes written
+    """
+    reader = ContainerReader(input_path, password, workers)
+    written = 0
+    with _atomic_output(output_path) as f_out:
+        for plain in reader.iter_range(offset, length):
+            f_out.write(plain)
+            written += len(plain)
+    return written
+
+
+def verify_file(input_path: str, password: str, workers: Optional[int] = None) -> int:
+    """Verify container integrity; returns number of chunks checked"""
+    return ContainerReader(input_path, password, workers).verify()
+
+
+def benchmark_decrypt(
+    input_path: str,
+    password: str,
+    range_size: int = 64 * 1024,
+    samples: int = 32,
+    workers: Optional[int] = None,
+) -> Dict[str, float]:
+    """
+    Compare full-file and ranged decryption throughput
+
+    Key derivation is done once up front and excluded from timings.
+
+    Returns:
+        Dictionary of timing and throughput figures
+    """
+    reader = ContainerReader(input_path, password, workers)
+    size = reader.header.plaintext_size
+
+    start = time.perf_counter()
+    for _ in reader.iter_chunks():
+        pass
+    full_seconds = time.perf_counter() - start
+
+    rng = random.Random(0)
+    span = max(size - range_size, 0)
+    ranged_bytes = 0
+    start = time.perf_counter()
+    for _ in range(samples):
+        ranged_bytes += len(reader.read_range(rng.randint(0, span), range_size))
+    ranged_seconds = time.perf_counter() - start
+
+    mb = 1024 * 1024
+    return {
+        "size": size,
+        "chunks": reader.header.chunk_count,
+        "full_seconds": full_seconds,
+        "full_mb_s": size / mb / full_seconds if full_seconds > 0 else 0.0,
+        "range_size": range_size,
+        "range_samples": samples,
+        "range_ms": ranged_seconds * 1000 / samples if samples else 0.0,
+        "range_mb_s": ranged_bytes / mb / ranged_seconds if ranged_seconds > 0 else 0.0,
+    }
+
+
+def legacy_xor_file(input_path: str, output_path: str, password: str):
+    """
+    Decrypt (or encrypt) the legacy v1 XOR format
+
+    The legacy format XORs data with the unsalted SHA256 of the password.
+    Blocks are processed as big integers instead of byte by byte.
+    """
+    key = hashlib.sha256(password.encode()).digest()
+    block_key = int.from_bytes(key * (LEGACY_BLOCK // len(key)), "big")
+
+    with _atomic_output(output_path) as f_out, open(input_path, "rb") as f_in:
+        while True:
+            data = f_in.read(LEGACY_BLOCK)
+            if not data:
+                break
+            if len(data) == LEGACY_BLOCK:
+                mask = block_key
+            else:
+                mask = block_key >> (8 * (LEGACY_BLOCK - len(data)))
+            value = int.from_bytes(data, "big") ^ mask
+            f_out.write(value.to_bytes(len(data), "big"))
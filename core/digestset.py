@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Digest Set Module
+Memory-mapped sorted sets of fixed-size digests
+"""
+
+import os
+import mmap
+import heapq
+import struct
+import tempfile
+from typing import Iterator, List, Optional, Callable
+
+# File layout:
+#
+#   magic (8) | record count (u64) | bucket table (65537 x u64) | records
+#
+# Records are raw digests of a fixed size, sorted and de-duplicated. The
+# bucket table maps each 2-byte digest prefix to its first record index,
+# so a lookup binary-searches only one bucket (~count / 65536 records).
+
+BUCKETS = 1 << 16
+COUNT = struct.Struct("<Q")
+TABLE = struct.Struct(f"<{BUCKETS + 1}Q")
+MAGIC_SIZE = 8
+DATA_OFFSET = MAGIC_SIZE + COUNT.size + TABLE.size
+
+DEFAULT_BATCH_RECORDS = 2_000_000  # digests held in memory per sorted run
+
+
+class DigestSet:
+    """Read-only, memory-mapped set of fixed-size digests"""
+
+    def __init__(self, path: str, magic: bytes, record_size: int):
+        self.path = path
+        self.record_size = record_size
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("Database is empty")
+
+        try:
+            self._check(magic)
+        except ValueError:
+            self.close()
+            raise
+
+    def _check(self, magic: bytes):
+        """Validate the header and bucket table before any lookup uses them"""
+        if self._mm[:MAGIC_SIZE] != magic:
+            raise ValueError("Unrecognized database format")
+        if len(self._mm) < DATA_OFFSET:
+            raise ValueError("Database is truncated or corrupted")
+
+        (self.count,) = COUNT.unpack_from(self._mm, MAGIC_SIZE)
+        if len(self._mm) != DATA_OFFSET + self.count * self.record_size:
+            raise ValueError("Database is truncated or corrupted")
+        self._table = TABLE.unpack_from(self._mm, MAGIC_SIZE + COUNT.size)
+        if self._table[0] != 0 or self._table[-1] != self.count:
+            raise ValueError("Database is truncated or corrupted")
+
+    def contains_digest(self, digest: bytes) -> bool:
+        """Check whether a raw digest is in the set"""
+        bucket = (digest[0] << 8) | digest[1]
+        lo = self._table[bucket]
+        hi = self._table[bucket + 1]
+        mm = self._mm
+        size = self.record_size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = DATA_OFFSET + mid * size
+            record = mm[start : start + size]
+            if record < digest:
+                lo = mid + 1
+            elif record > digest:
+                hi = mid
+            else:
+                return True
+        return False
+
+    def close(self):
+        """Release the memory map"""
+        try:
+            self._mm.close()
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SharedDigestSet:
+    """
+    Process-wide digest set, reopened when its file is replaced
+
+    `path_func` is called on every get() so configuration changes take
+    effect; the open set is reused while the path and mtime stay the same.
+    """
+
+    def __init__(
+        self, opener: Callable[[str], DigestSet], path_func: Callable[[], str]
+    ):
+        self.opener = opener
+        self.path_func = path_func
+        self._store: Optional[DigestSet] = None
+        self._mtime: Optional[int] = None
+
+    def get(self) -> Optional[DigestSet]:
+        """The open set, or None if no usable database is installed"""
+        path = self.path_func()
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        if self._store is None or self._store.path != path or self._mtime != mtime:
+            if self._store is not None:
+                self._store.close()
+                self._store = None
+            try:
+                self._store = self.opener(path)
+                self._mtime = mtime
+            except (OSError, ValueError):
+                return None
+        return self._store
+
+
+def _write_run(records: List[bytes], directory: str) -> str:
+    records.sort()
+    fd, path = tempfile.mkstemp(prefix="digest-run-", dir=directory)
+    with os.fdopen(fd, "wb") as f:
+        f.write(b"".join(records))
+    return path
+
+
+def _read_run(path: str, record_size: int) -> Iterator[bytes]:
+    with open(path, "rb", buffering=1024 * 1024) as f:
+        while True:
+            record = f.read(record_size)
+            if len(record) < record_size:
+                return
+            yield record
+
+
+def write_digest_set(
+    digests: Iterator[bytes],
+    output_path: str,
+    magic: bytes,
+    record_size: int,
+    batch_records: int = DEFAULT_BATCH_RECORDS,
+) -> int:
+    """
+    Build a digest set file by external merge sort
+
+    Digests are collected in batches that are sorted into temporary runs,
+    then the runs are k-way merged into the output, so memory stays bounded
+    by batch_records regardless of input size. The output is written to a
+    temporary file and atomically renamed into place.
+
+    Returns:
+        Number of unique records written
+    """
+    out_dir = os.path.dirname(os.path.abspath(output_path))
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    runs: List[str] = []
+
+    try:
+        batch: List[bytes] = []
+        for digest in digests:
+            batch.append(digest)
+            if len(batch) >= batch_records:
+                runs.append(_write_run(batch, out_dir))
+                batch = []
+        if batch:
+            runs.append(_write_run(batch, out_dir))
+        batch = []
+
+        counts = [0] * BUCKETS
+        written = 0
+        with open(tmp_path, "wb", buffering=1024 * 1024) as out:
+            out.write(magic)
+            out.write(COUNT.pack(0))
+            out.write(TABLE.pack(*([0] * (BUCKETS + 1))))
+
+            previous = None
+            for record in heapq.merge(*(_read_run(run, record_size) for run in runs)):
+                if record == previous:
+                    continue
+                previous = record
+                out.write(record)
+                counts[(record[0] << 8) | record[1]] += 1
+                written += 1
+
+            offsets = [0] * (BUCKETS + 1)
+            for bucket in range(BUCKETS):
+                offsets[bucket + 1] = offsets[bucket] + counts[bucket]
+
+            out.seek(MAGIC_SIZE)
+            out.write(COUNT.pack(written))
+            out.write(TABLE.pack(*offsets))
+
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        for run in runs:
+            try:
+                os.remove(run)
+            except OSError:
+                pass
+
+    return written
@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Disk Usage Module
+Parallel du-style space analysis
+"""
+
+import os
+import stat
+import zlib
+import heapq
+import queue
+import struct
+import hashlib
+import threading
+import time
+from array import array
+from typing import Optional, Dict, List, Any, Tuple, Iterable
+from .utils import get_cache
+
+DEFAULT_EXCLUDES = ("/proc", "/sys", "/dev", "/run")
+
+SNAPSHOT_MAGIC = b"PYTDU2\x00\x00"
+# magic, timestamp, directories, root length, names length, top files length
+SNAPSHOT_HEADER = struct.Struct("<8sdQIQQ")
+
+
+def allocated_size(st: os.stat_result) -> int:
+    """Bytes actually allocated on disk (sparse files count what they use)"""
+    blocks = getattr(st, "st_blocks", None)
+    return blocks * 512 if blocks is not None else st.st_size
+
+
+class DiskUsage:
+    """
+    Directory size tree from a parallel walk
+
+    Directories live in flat parallel lists indexed by the order they were
+    discovered. A directory is always registered before its children, so
+    child indices are greater than their parent's, and one backwards pass
+    over the lists rolls sizes up into every ancestor.
+    """
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.timestamp = time.time()
+        self.names: List[str] = []
+        self.parents: List[int] = []
+        # Index of the same directory in the previous snapshot, or -1
+        self.matched: List[int] = []
+        self.mtimes: List[int] = []
+        self.own_bytes: List[int] = []
+        self.own_files: List[int] = []
+        # Size of each directory's largest own file, and how many of its
+        # files have other hard links
+        self.largest: List[int] = []
+        self.linked: List[int] = []
+        self.total_bytes: List[int] = []
+        self.total_files: List[int] = []
+        self.top_files: List[Tuple[int, str]] = []
+        self.stats: Dict[str, Any] = {
+            "dirs": 0,
+            "files": 0,
+            "errors": 0,
+            "reused": 0,
+            "bytes": 0,
+            "seconds": 0.0,
+        }
+        self._children: Optional[List[List[int]]] = None
+
+    def add(self, name: str, parent: int, mtime: int, matched: int = -1) -> int:
+        self.names.append(name)
+        self.parents.append(parent)
+        self.mtimes.append(mtime)
+        self.matched.append(matched)
+        self.own_bytes.append(0)
+        self.own_files.append(0)
+        self.largest.append(0)
+        self.linked.append(0)
+        return len(self.names) - 1
+
+    def finalize(self):
+        """Aggregate own sizes bottom-up into subtree totals"""
+        total_bytes = list(self.own_bytes)
+        total_files = list(self.own_files)
+        parents = self.parents
+        for index in range(len(parents) - 1, 0, -1):
+            parent = parents[index]
+            total_bytes[parent] += total_bytes[index]
+            total_files[parent] += total_files[index]
+        self.total_bytes = total_bytes
+        self.total_files = total_files
+        self._children = None
+        self.stats["dirs"] = len(self.names)
+        self.stats["files"] = total_files[0] if total_files else 0
+        self.stats["bytes"] = total_bytes[0] if total_bytes else 0
+
+    def path(self, index: int) -> str:
+        parts = []
+        while index > 0:
+            parts.append(self.names[index])
+            index = self.parents[index]
+        return os.path.join(self.root, *reversed(parts))
+
+    def child_lists(self) -> List[List[int]]:
+        """Subdirectory indices of every directory, in discovery order"""
+        if self._children is None:
+            children: List[List[int]] = [[] for _ in self.names]
+            for child in range(1, len(self.parents)):
+                children[self.parents[child]].append(child)
+            self._children = children
+        return self._children
+
+    def children(self, index: int) -> List[int]:
+        """Subdirectories of a directory, largest first"""
+        return sorted(
+            self.child_lists()[index],
+            key=lambda i: self.total_bytes[i],
+            reverse=True,
+        )
+
+    def largest_directories(self, count: int) -> List[int]:
+        """Indices of the directories with the largest subtree totals"""
+        return heapq.nlargest(
+            count, range(len(self.names)), key=self.total_bytes.__getitem__
+        )
+
+
+class DiskUsageScanner:
+    """
+    Threaded scandir walk feeding a DiskUsage tree
+
+    Workers pull directories from a shared queue, stat every entry once
+    (lstat, symlinks are not followed) and charge allocated blocks to the
+    directory. Hard-linked files are counted once. Each worker keeps its
+    own bounded heap of the largest files; the heaps are merged at the end.
+
+    Given a previous DiskUsage, directories are matched to it by name so
+    growth can be compared. With incremental set, a directory whose mtime
+    is unchanged is not listed again: its entries can't have been added,
+    removed or renamed, so its own files are taken from the snapshot and
+    only its subdirectories are stat'ed to continue the walk. Files
+    rewritten in place don't change the directory mtime, so a full scan
+    is still needed to catch those. Directories that held hard-linked files
+    are always listed again, so every link goes through the same dedupe.
+
+    Reused directories contribute their files from the previous largest
+    files list; any whose largest file (kept per directory in the snapshot)
+    beats the new cut-off is listed again, so files that were just below
+    the old list can still make it in.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        workers: Optional[int] = None,
+        top: int = 20,
+        one_filesystem: bool = True,
+        excludes: Iterable[str] = DEFAULT_EXCLUDES,
+        previous: Optional[DiskUsage] = None,
+        incremental: bool = False,
+    ):
+        self.root = os.path.abspath(root)
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        self.top = top
+        self.one_filesystem = one_filesystem
+        self.excludes = {os.path.abspath(p) for p in excludes} - {self.root}
+        if previous is not None and previous.root != self.root:
+            previous = None
+        self.previous = previous
+        self.incremental = incremental and previous is not None
+        self._previous_children = previous.child_lists() if previous else None
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._inodes: set = set()
+        self._reused: Dict[str, int] = {}  # path -> index
+
+    def scan(self) -> DiskUsage:
+        start = time.perf_counter()
+        usage = DiskUsage(self.root)
+        root_st = os.stat(self.root)
+        self._root_dev = root_st.st_dev
+        usage.add("", -1, root_st.st_mtime_ns, 0 if self.previous else -1)
+        usage.own_bytes[0] = allocated_size(root_st)
+        self._queue.put((0, self.root, usage.matched[0]))
+
+        heaps: List[List[Tuple[int, str]]] = []
+        threads = []
+        for _ in range(self.workers):
+            heap: List[Tuple[int, str]] = []
+            heaps.append(heap)
+            thread = threading.Thread(
+                target=self._worker, args=(usage, heap), daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+
+        self._queue.join()
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join()
+
+        candidates = [item for heap in heaps for item in heap]
+        if self._reused:
+            candidates = self._reused_top_files(usage, candidates)
+        usage.top_files = heapq.nlargest(self.top, candidates)
+        usage.stats["reused"] = len(self._reused)
+        usage.finalize()
+        usage.stats["seconds"] = time.perf_counter() - start
+        return usage
+
+    def _reused_top_files(
+        self, usage: DiskUsage, candidates: List[Tuple[int, str]]
+    ) -> List[Tuple[int, str]]:
+        """Add the largest files of directories that were not listed again"""
+        reused = self._reused
+        merged = candidates + [
+            item
+            for item in self.previous.top_files
+            if os.path.dirname(item[1]) in reused
+        ]
+        top = heapq.nlargest(self.top, merged)
+        cutoff = top[-1][0] if len(top) >= self.top else -1
+        # Files of these directories missing from the old list may qualify
+        relist = {p for p, i in reused.items() if usage.largest[i] > cutoff}
+        if not relist:
+            return merged
+        merged = [item for item in merged if os.path.dirname(item[1]) not in relist]
+        for path in relist:
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try:
+                            if not entry.is_dir(follow_symlinks=False):
+                                st = entry.stat(follow_symlinks=False)
+                                merged.append((allocated_size(st), entry.path))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return merged
+
+    def _worker(self, usage: DiskUsage, heap: List[Tuple[int, str]]):
+        errors = 0
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            try:
+                index, path, matched = item
+                if (
+                    self.incremental
+                    and matched >= 0
+                    and usage.mtimes[index] == self.previous.mtimes[matched]
+                    and not self.previous.linked[matched]
+                ):
+                    errors += self._reuse_directory(usage, index, path, matched)
+                else:
+                    errors += self._scan_directory(usage, heap, index, path, matched)
+            finally:
+                self._queue.task_done()
+        with self._lock:
+            usage.stats["errors"] += errors
+
+    def _register(
+        self,
+        usage: DiskUsage,
+        index: int,
+        own: int,
+        files: int,
+        subdirs: List[Tuple[str, str, os.stat_result, int]],
+        largest: int = 0,
+        linked: int = 0,
+    ):
+        with self._lock:
+            usage.own_bytes[index] += own
+            usage.own_files[index] += files
+            usage.largest[index] = largest
+            usage.linked[index] = linked
+            children = []
+            for name, child_path, st, matched in subdirs:
+                child = usage.add(name, index, st.st_mtime_ns, matched)
+                usage.own_bytes[child] = allocated_size(st)
+                children.append((child, child_path, matched))
+        for child in children:
+            self._queue.put(child)
+
+    def _keep_directory(self, path: str, st: os.stat_result) -> bool:
+        if path in self.excludes:
+            return False
+        return not self.one_filesystem or st.st_dev == self._root_dev
+
+    def _scan_directory(
+        self,
+        usage: DiskUsage,
+        heap: List[Tuple[int, str]],
+        index: int,
+        path: str,
+        matched: int,
+    ) -> int:
+        own = files = failed = largest = linked = 0
+        subdirs = []
+        top = self.top
+        previous = {}
+        if matched >= 0:
+            names = self.previous.names
+            previous = {names[c]: c for c in self._previous_children[matched]}
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                        if entry.is_dir(follow_symlinks=False):
+                            if self._keep_directory(entry.path, st):
+                                subdirs.append(
+                                    (
+                                        entry.name,
+                                        entry.path,
+                                        st,
+                                        previous.get(entry.name, -1),
+                                    )
+                                )
+                            continue
+                        if st.st_nlink > 1 and not entry.is_symlink():
+                            linked += 1
+                            key = (st.st_dev, st.st_ino)
+                            with self._lock:
+                                if key in self._inodes:
+                                    continue
+                                self._inodes.add(key)
+                        size = allocated_size(st)
+                        own += size
+                        files += 1
+                        if size > largest:
+                            largest = size
+                        if len(heap) < top:
+                            heapq.heappush(heap, (size, entry.path))
+                        elif size > heap[0][0]:
+                            heapq.heapreplace(heap, (size, entry.path))
+                    except OSError:
+                        failed += 1
+        except OSError:
+            failed += 1
+
+        self._register(usage, index, own, files, subdirs, largest, linked)
+        return failed
+
+    def _reuse_directory(
+        self, usage: DiskUsage, index: int, path: str, matched: int
+    ) -> int:
+        """Carry an unchanged directory over from the snapshot"""
+        previous = self.previous
+        failed = 0
+        subdirs = []
+        for child in self._previous_children[matched]:
+            name = previous.names[child]
+            child_path = os.path.join(path, name)
+            try:
+                st = os.lstat(child_path)
+            except OSError:
+                failed += 1
+                continue
+            if stat.S_ISDIR(st.st_mode) and self._keep_directory(child_path, st):
+                subdirs.append((name, child_path, st, child))
+
+        # own_bytes already holds the directory's own blocks from its stat
+        usage.own_bytes[index] = 0
+        self._register(
+            usage,
+            index,
+            previous.own_bytes[matched],
+            previous.own_files[matched],
+            subdirs,
+            previous.largest[matched],
+        )
+        with self._lock:
+            self._reused[path] = index
+        return failed
+
+
+def scan_usage(
+    root: str,
+    workers: Optional[int] = None,
+    top: int = 20,
+    one_filesystem: bool = True,
+) -> DiskUsage:
+    """Scan a tree and return its aggregated DiskUsage"""
+    return DiskUsageScanner(root, workers, top, one_filesystem).scan()
+
+
+def growth(
+    current: DiskUsage, previous: DiskUsage, count: int = 15
+) -> List[Tuple[int, int, int]]:
+    """
+    Directories that grew most since the previous snapshot
+
+    Returns:
+        (subtree delta, own files delta, index in current) for the `count`
+        largest positive subtree deltas; new directories count in full
+    """
+    deltas = []
+    for index, matched in enumerate(current.matched):
+        if matched >= 0:
+            total = current.total_bytes[index] - previous.total_bytes[matched]
+            own = current.own_bytes[index] - previous.own_bytes[matched]
+        else:
+            total = current.total_bytes[index]
+            own = current.own_bytes[index]
+        if total > 0:
+            deltas.append((total, own, index))
+    return heapq.nlargest(count, deltas)
+
+
+def get_snapshot_path(root: str) -> str:
+    """Snapshot file for a scanned root in the PyTools cache directory"""
+    key = hashlib.sha1(os.path.abspath(root).encode("utf-8", "surrogateescape"))
+    directory = os.path.join(get_cache().cache_dir, "disk_usage")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"{key.hexdigest()}.snap")
+
+
+def save_snapshot(usage: DiskUsage, path: str):
+    """
+    Write the directory tree compactly and atomically
+
+    Layout: a fixed header, then a zlib stream holding the root path, six
+    int64 arrays (parent, mtime, own bytes, own files, largest file size,
+    hard-linked files), the NUL-separated
+    directory names and the largest files as NUL-separated size/path pairs.
+    """
+    root = os.fsencode(usage.root)
+    names = b"\0".join(os.fsencode(name) for name in usage.names)
+    top = b"\0".join(
+        part
+        for size, file_path in usage.top_files
+        for part in (str(size).encode(), os.fsencode(file_path))
+    )
+    compressor = zlib.compressobj(1)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(
+            SNAPSHOT_HEADER.pack(
+                SNAPSHOT_MAGIC,
+                usage.timestamp,
+                len(usage.names),
+                len(root),
+                len(names),
+                len(top),
+            )
+        )
+        f.write(compressor.compress(root))
+        for values in (
+            usage.parents,
+            usage.mtimes,
+            usage.own_bytes,
+            usage.own_files,
+            usage.largest,
+            usage.linked,
+        ):
+            f.write(compressor.compress(array("q", values).tobytes()))
+        f.write(compressor.compress(names))
+        f.write(compressor.compress(top))
+        f.write(compressor.flush())
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path: str) -> Optional[DiskUsage]:
+    """Read a snapshot written by save_snapshot, or None if unusable"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(SNAPSHOT_HEADER.size)
+            magic, timestamp, count, root_len, names_len, top_len = (
+                SNAPSHOT_HEADER.unpack(header)
+            )
+            if magic != SNAPSHOT_MAGIC:
+                return None
+            body = zlib.decompress(f.read())
+    except (OSError, struct.error, zlib.error):
+        return None
+    if len(body) != root_len + count * 48 + names_len + top_len:
+        return None
+
+    usage = DiskUsage(os.fsdecode(body[:root_len]))
+    usage.timestamp = timestamp
+    offset = root_len
+    columns = []
+    for _ in range(6):
+        values = array("q")
+        values.frombytes(body[offset : offset + count * 8])
+        columns.append(values.tolist())
+        offset += count * 8
+    (
+        usage.parents,
+        usage.mtimes,
+        usage.own_bytes,
+        usage.own_files,
+        usage.largest,
+        usage.linked,
+    ) = columns
+    names = body[offset : offset + names_len]
+    usage.names = [os.fsdecode(name) for name in names.split(b"\0")] if count else []
+    offset += names_len
+    top = body[offset : offset + top_len].split(b"\0") if top_len else []
+    usage.top_files = [
+        (int(top[i]), os.fsdecode(top[i + 1])) for i in range(0, len(top) - 1, 2)
+    ]
+    usage.matched = [-1] * count
+    usage.finalize()
+    return usage
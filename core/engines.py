@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Engines Module
+External antivirus/rootkit engine commands and output parsers
+"""
+
+import re
+from typing import Dict, List, Any, Callable
+
+CLAMSCAN_FOUND = re.compile(r"^(?P<target>.+): (?P<detail>.+) FOUND$")
+CHKROOTKIT_CHECK = re.compile(r"^Checking `(?P<target>[^']+)'\.\.\.\s*(?P<status>.*)$")
+QUOTED_PATH = re.compile(r"'(/[^']+)'|(?:File|Path): (/\S+)")
+
+
+def _finding(engine: str, severity: str, target: str, detail: str) -> Dict[str, str]:
+    return {"engine": engine, "severity": severity, "target": target, "detail": detail}
+
+
+def parse_clamscan(lines: List[str]) -> List[Dict[str, str]]:
+    """Parse `clamscan --infected` output ("path: Signature FOUND")"""
+    findings = []
+    for line in lines:
+        match = CLAMSCAN_FOUND.match(line)
+        if match:
+            findings.append(
+                _finding("clamav", "infected", match["target"], match["detail"])
+            )
+        elif line.startswith("ERROR:"):
+            findings.append(_finding("clamav", "error", "", line[6:].strip()))
+    return findings
+
+
+def parse_chkrootkit(lines: List[str]) -> List[Dict[str, str]]:
+    """Parse chkrootkit output ("Checking `name'... INFECTED" and warnings)"""
+    findings = []
+    suspicious_block = False
+    for line in lines:
+        stripped = line.strip()
+        match = CHKROOTKIT_CHECK.match(stripped)
+        if match:
+            suspicious_block = False
+            status = match["status"]
+            if "INFECTED" in status:
+                findings.append(
+                    _finding("chkrootkit", "infected", match["target"], status)
+                )
+            elif status.startswith(("Warning", "Vulnerable", "Possible")):
+                findings.append(
+                    _finding("chkrootkit", "warning", match["target"], status)
+                )
+            continue
+
+        if "suspicious files and directories were found" in stripped:
+            suspicious_block = True
+        elif suspicious_block and stripped.startswith("/"):
+            findings.append(
+                _finding("chkrootkit", "warning", stripped, "Suspicious file")
+            )
+        elif stripped.startswith(("Warning:", "WARNING:")) or "INFECTED" in stripped:
+            findings.append(_finding("chkrootkit", "warning", "", stripped))
+        elif stripped:
+            suspicious_block = False
+    return findings
+
+
+def parse_rkhunter(lines: List[str]) -> List[Dict[str, str]]:
+    """Parse `rkhunter --report-warnings-only` output (multi-line warnings)"""
+    findings: List[Dict[str, str]] = []
+    for line in lines:
+        if line.startswith("Warning:"):
+            detail = line[len("Warning:") :].strip()
+            findings.append(_finding("rkhunter", "warning", "", detail))
+        elif findings and line.startswith((" ", "\t")) and line.strip():
+            findings[-1]["detail"] += " " + line.strip()
+        else:
+            continue
+        finding = findings[-1]
+        if not finding["target"]:
+            path = QUOTED_PATH.search(finding["detail"])
+            if path:
+                finding["target"] = path.group(1) or path.group(2)
+    return findings
+
+
+# Engine table: executable, arguments (with {target} placeholder), whether
+# the engine needs root, and its output parser
+ENGINES: Dict[str, Dict[str, Any]] = {
+    "clamav": {
+        "command": "clamscan",
+        "args": ["--infected", "--recursive", "--suppress-ok-results", "{target}"],
+        "root": False,
+        "parser": parse_clamscan,
+    },
+    "chkrootkit": {
+        "command": "chkrootkit",
+        "args": [],
+        "root": True,
+        "parser": parse_chkrootkit,
+    },
+    "rkhunter": {
+        "command": "rkhunter",
+        "args": [
+            "--check",
+            "--skip-keypress",
+            "--report-warnings-only",
+            "--nocolors",
+        ],
+        "root": True,
+        "parser": parse_rkhunter,
+    },
+}
+
+
+def build_command(name: str, target: str, sudo: bool) -> List[str]:
+    """
+    Build the argv list for an engine
+
+    With sudo the command runs non-interactively (sudo -n): credentials
+    must be cached beforehand since concurrent engines cannot share a
+    password prompt.
+    """
+    engine = ENGINES[name]
+    argv = [engine["command"]] + [arg.format(target=target) for arg in engine["args"]]
+    if sudo and engine["root"]:
+        argv = ["sudo", "-n"] + argv
+    return argv
+
+
+def parse_output(name: str, lines: List[str]) -> List[Dict[str, str]]:
+    """Run the engine's parser over its captured output"""
+    parser: Callable[[List[str]], List[Dict[str, str]]] = ENGINES[name]["parser"]
+    return parser(lines)
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Exporter Module
+Prometheus / OpenMetrics exporter for system, disk and network metrics
+"""
+
+import os
+import gzip
+import time
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, List, Tuple, Any
+
+import psutil
+
+from .utils import get_logger
+
+PROMETHEUS_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# (labels, value) pairs of one metric family
+Samples = List[Tuple[Dict[str, str], float]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricFamily:
+    """One named metric with its type, help text and labelled samples"""
+
+    def __init__(self, name: str, kind: str, help_text: str):
+        self.name = name
+        self.kind = kind  # "gauge" or "counter"
+        self.help = help_text
+        self.samples: Samples = []
+
+    def add(self, value: float, **labels: str) -> "MetricFamily":
+        self.samples.append((labels, value))
+        return self
+
+    def render(self, openmetrics: bool) -> List[str]:
+        # Counter families are named without _total in OpenMetrics metadata
+        base = self.name
+        if openmetrics and self.kind == "counter" and base.endswith("_total"):
+            base = base[: -len("_total")]
+        lines = [f"# HELP {base} {self.help}", f"# TYPE {base} {self.kind}"]
+        for labels, value in self.samples:
+            if labels:
+                pairs = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+                lines.append(f"{self.name}{{{pairs}}} {_format_value(value)}")
+            else:
+                lines.append(f"{self.name} {_format_value(value)}")
+        return lines
+
+
+def _read_proc_stat() -> Dict[str, int]:
+    """procs_running, procs_blocked and the fork counter from /proc/stat"""
+    values = {}
+    try:
+        with open("/proc/stat", "rb") as f:
+            for line in f:
+                if line.startswith((b"procs_", b"processes ")):
+                    key, value = line.split()[:2]
+                    values[key.decode()] = int(value)
+    except OSError:
+        pass
+    return values
+
+
+def collect_metrics() -> List[MetricFamily]:
+    """Read every exported metric once"""
+    families: List[MetricFamily] = []
+
+    def family(name: str, kind: str, help_text: str) -> MetricFamily:
+        metric = MetricFamily(f"pytools_{name}", kind, help_text)
+        families.append(metric)
+        return metric
+
+    # CPU
+    cpu_seconds = family("cpu_seconds_total", "counter", "CPU time spent in each mode")
+    for mode, value in psutil.cpu_times()._asdict().items():
+        cpu_seconds.add(value, mode=mode)
+    usage = family("cpu_usage_percent", "gauge", "CPU usage since the previous refresh")
+    for core, percent in enumerate(psutil.cpu_percent(percpu=True)):
+        usage.add(percent, cpu=str(core))
+    family("cpu_count", "gauge", "Logical CPUs").add(psutil.cpu_count() or 0)
+    try:
+        load = os.getloadavg()
+        load_family = family("load_average", "gauge", "System load average")
+        for period, value in zip(("1m", "5m", "15m"), load):
+            load_family.add(value, period=period)
+    except (AttributeError, OSError):
+        pass
+
+    # Memory
+    mem = psutil.virtual_memory()
+    family("memory_total_bytes", "gauge", "Physical memory").add(mem.total)
+    family("memory_available_bytes", "gauge", "Memory available to new work").add(
+        mem.available
+    )
+    family("memory_used_bytes", "gauge", "Memory in use").add(mem.used)
+    swap = psutil.swap_memory()
+    family("swap_total_bytes", "gauge", "Swap space").add(swap.total)
+    family("swap_used_bytes", "gauge", "Swap in use").add(swap.used)
+
+    # Filesystems
+    size = family("filesystem_size_bytes", "gauge", "Filesystem size")
+    used = family("filesystem_used_bytes", "gauge", "Filesystem space used")
+    free = family("filesystem_free_bytes", "gauge", "Filesystem space free")
+    for part in psutil.disk_partitions(all=False):
+        try:
+            disk = psutil.disk_usage(part.mountpoint)
+        except OSError:
+            continue
+        labels = {
+            "device": part.device,
+            "mountpoint": part.mountpoint,
+            "fstype": part.fstype,
+        }
+        size.add(disk.total, **labels)
+        used.add(disk.used, **labels)
+        free.add(disk.free, **labels)
+
+    # Disk I/O
+    try:
+        disks = psutil.disk_io_counters(perdisk=True) or {}
+    except (OSError, RuntimeError):
+        disks = {}
+    read_bytes = family("disk_read_bytes_total", "counter", "Bytes read from disk")
+    written = family("disk_written_bytes_total", "counter", "Bytes written to disk")
+    reads = family("disk_reads_completed_total", "counter", "Completed disk reads")
+    writes = family("disk_writes_completed_total", "counter", "Completed disk writes")
+    for name, io in disks.items():
+        read_bytes.add(io.read_bytes, disk=name)
+        written.add(io.write_bytes, disk=name)
+        reads.add(io.read_count, disk=name)
+        writes.add(io.write_count, disk=name)
+
+    # Network interfaces
+    nics = psutil.net_io_counters(pernic=True) or {}
+    try:
+        nic_stats = psutil.net_if_stats()
+    except OSError:
+        nic_stats = {}
+    counters = [
+        ("network_receive_bytes_total", "bytes_recv", "Bytes received"),
+        ("network_transmit_bytes_total", "bytes_sent", "Bytes sent"),
+        ("network_receive_packets_total", "packets_recv", "Packets received"),
+        ("network_transmit_packets_total", "packets_sent", "Packets sent"),
+        ("network_receive_errors_total", "errin", "Receive errors"),
+        ("network_transmit_errors_total", "errout", "Transmit errors"),
+        ("network_receive_drop_total", "dropin", "Dropped incoming packets"),
+        ("network_transmit_drop_total", "dropout", "Dropped outgoing packets"),
+    ]
+    for name, field, help_text in counters:
+        metric = family(name, "counter", help_text)
+        for nic, io in nics.items():
+            metric.add(getattr(io, field), interface=nic)
+    up = family("network_up", "gauge", "Whether the interface is up")
+    for nic, stats in nic_stats.items():
+        up.add(1 if stats.isup else 0, interface=nic)
+
+    # Processes
+    family("processes", "gauge", "Number of processes").add(len(psutil.pids()))
+    proc_stat = _read_proc_stat()
+    if proc_stat:
+        state = family("processes_state", "gauge", "Processes by scheduler state")
+        state.add(proc_stat.get("procs_running", 0), state="running")
+        state.add(proc_stat.get("procs_blocked", 0), state="blocked")
+        family("forks_total", "counter", "Processes created since boot").add(
+            proc_stat.get("processes", 0)
+        )
+
+    family("boot_time_seconds", "gauge", "System boot time, unix time").add(
+        psutil.boot_time()
+    )
+    return families
+
+
+class MetricsExporter:
+    """
+    HTTP /metrics endpoint serving pre-rendered samples
+
+    A background thread collects all metrics every `interval` seconds (on a
+    fixed schedule, like SystemSampler) and renders them once into every
+    variant a scraper may ask for: Prometheus text and OpenMetrics, each
+    plain and gzip-compressed. A scrape only picks one of those byte
+    strings, so it costs the same however often it comes and never touches
+    /proc or the disks.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 9877, interval: float = 5):
+        self.host = host
+        self.port = port
+        self.interval = interval
+        self.scrapes = 0
+        self.refresh_seconds = 0.0
+        self.logger = get_logger()
+        # (openmetrics, gzip) -> body; replaced as a whole on each refresh
+        self._payloads: Dict[Tuple[bool, bool], bytes] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def refresh(self):
+        """Collect and render all metrics now"""
+        start = time.perf_counter()
+        families = collect_metrics()
+        exporter = MetricFamily(
+            "pytools_exporter_refresh_seconds",
+            "gauge",
+            "Time the previous refresh took to collect metrics",
+        ).add(self.refresh_seconds)
+        timestamp = MetricFamily(
+            "pytools_exporter_last_refresh_timestamp_seconds",
+            "gauge",
+            "When metrics were last collected, unix time",
+        ).add(time.time())
+        families += [exporter, timestamp]
+
+        payloads = {}
+        for openmetrics in (False, True):
+            lines = [line for f in families for line in f.render(openmetrics)]
+            if openmetrics:
+                lines.append("# EOF")
+            body = ("\n".join(lines) + "\n").encode("utf-8")
+            payloads[(openmetrics, False)] = body
+            payloads[(openmetrics, True)] = gzip.compress(body, compresslevel=6)
+        self._payloads = payloads
+        self.refresh_seconds = time.perf_counter() - start
+
+    def payload(self, openmetrics: bool, compressed: bool) -> bytes:
+        self.scrapes += 1
+        return self._payloads[(openmetrics, compressed)]
+
+    def _run(self):
+        deadline = time.monotonic() + self.interval
+        while not self._stop.wait(max(0.0, deadline - time.monotonic())):
+            deadline += self.interval
+            now = time.monotonic()
+            if deadline < now:
+                deadline = now + self.interval
+            try:
+                self.refresh()
+            except Exception as e:
+                self.logger.error(f"Metrics refresh failed: {e}")
+
+    def start(self) -> "MetricsExporter":
+        """Take the first reading, bind the server and start refreshing"""
+        psutil.cpu_percent(percpu=True)  # prime usage deltas
+        self.refresh()
+        self._server = ThreadingHTTPServer((self.host, self.port), _handler(self))
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._run, name="pytools-exporter", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def url(self) -> str:
+        host = (
+            self.host
+            if self.host not in ("", "0.0.0.0", "::")
+            else socket.gethostname()
+        )
+        if ":" in host:
+            host = f"[{host}]"
+        return f"http://{host}:{self.port}/metrics"
+
+
+def _handler(exporter: MetricsExporter):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        server_version = "PyTools/2.0.0"
+        protocol_version = "HTTP/1.1"  # keep-alive between scrapes
+        # Headers and body are separate writes; with Nagle's algorithm the
+        # body waits for the client's delayed ACK (~40 ms) on kept-alive
+        # connections
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            path = self.path.split("?", 1)[0]
+            if path == "/metrics":
+                openmetrics = "application/openmetrics-text" in self.headers.get(
+                    "Accept", ""
+                )
+                compressed = "gzip" in self.headers.get("Accept-Encoding", "")
+                body = exporter.payload(openmetrics, compressed)
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type", OPENMETRICS_TYPE if openmetrics else PROMETHEUS_TYPE
+                )
+                if compressed:
+                    self.send_header("Content-Encoding", "gzip")
+            elif path == "/":
+                body = b'<html><body><a href="/metrics">Metrics</a></body></html>\n'
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+            else:
+                body = b"Not found\n"
+                self.send_response(404)
+                self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any):
+            exporter.logger.debug(f"Exporter {self.address_string()} {format % args}")
+
+    return MetricsHandler
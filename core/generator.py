@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Generator Module
+High-volume password and passphrase generation
+"""
+
+import os
+import mmap
+import math
+import time
+import string
+from array import array
+from itertools import combinations
+from typing import Optional, Dict, List, Any, Callable, Iterator
+
+RANDOM_BLOCK_SIZE = 1024 * 1024  # bytes drawn from os.urandom at a time
+WRITE_BATCH = 10000  # outputs joined per file write
+# A diceware list (five dice); smaller lists make weak passphrases
+MIN_PASSPHRASE_WORDS = 7776
+
+CHARACTER_CLASSES = {
+    "upper": string.ascii_uppercase,
+    "lower": string.ascii_lowercase,
+    "digit": string.digits,
+    "special": string.punctuation,
+}
+
+
+class RandomPool:
+    """
+    Uniform random values from large os.urandom blocks
+
+    Values are drawn by rejection sampling: raw values at or above the
+    largest multiple of n are discarded, so `value % n` has no modulo bias.
+    """
+
+    def __init__(self, block_size: int = RANDOM_BLOCK_SIZE):
+        self.block_size = block_size
+
+    def characters(self, alphabet: str, count: int) -> str:
+        """Return `count` characters drawn uniformly from alphabet"""
+        n = len(alphabet)
+        if not 0 < n <= 256:
+            raise ValueError("Alphabet must have 1-256 characters")
+
+        # Map accepted bytes to alphabet characters and delete the rest,
+        # so sampling and rejection both run inside bytes.translate
+        limit = 256 - 256 % n
+        table = bytes(ord(alphabet[b % n]) if b < limit else 0 for b in range(256))
+        rejected = bytes(range(limit, 256))
+        encoded = alphabet.encode("latin-1")
+        if len(encoded) != n:
+            raise ValueError("Alphabet must be single-byte characters")
+
+        parts = []
+        remaining = count
+        while remaining > 0:
+            block = os.urandom(min(self.block_size, remaining * 2 + 64))
+            chunk = block.translate(table, rejected)[:remaining]
+            parts.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(parts).decode("latin-1")
+
+    def integers(self, n: int, count: int) -> List[int]:
+        """Return `count` integers drawn uniformly from [0, n)"""
+        if not 0 < n <= 1 << 32:
+            raise ValueError("Range must be between 1 and 2^32")
+
+        limit = (1 << 32) - (1 << 32) % n
+        values: List[int] = []
+        while len(values) < count:
+            needed = count - len(values)
+            raw = array("I", os.urandom(min(self.block_size, needed * 8 + 64)))
+            values.extend(v % n for v in raw if v < limit)
+        del values[count:]
+        return values
+
+
+def build_alphabet(classes: List[str]) -> str:
+    """Concatenate the character sets for the requested classes"""
+    return "".join(CHARACTER_CLASSES[name] for name in classes)
+
+
+def password_entropy(length: int, classes: List[str]) -> float:
+    """
+    Exact entropy (bits) of a uniform password with one char per class
+
+    Counts strings over the combined alphabet that contain at least one
+    character of every class, by inclusion-exclusion over missing classes.
+    """
+    sizes = [len(CHARACTER_CLASSES[name]) for name in classes]
+    total = sum(sizes)
+    valid = 0
+    for k in range(len(sizes) + 1):
+        for missing in combinations(sizes, k):
+            valid += (-1) ** k * (total - sum(missing)) ** length
+    return math.log2(valid) if valid > 0 else 0.0
+
+
+def generate_passwords(
+    length: int,
+    classes: List[str],
+    count: int,
+    pool: Optional[RandomPool] = None,
+) -> Iterator[str]:
+    """
+    Generate passwords containing at least one character of every class
+
+    Candidates are drawn uniformly from the combined alphabet and rejected
+    if a class is missing, which keeps the output uniform over all valid
+    passwords (unlike placing required characters and shuffling).
+    """
+    if length < len(classes):
+        raise ValueError("Length must be at least the number of required classes")
+
+    pool = pool or RandomPool()
+    alphabet = build_alphabet(classes)
+
+    # Translate each character to its class marker for a fast coverage check
+    markers = "".join(chr(ord("0") + i) for i in range(len(classes)))
+    class_map = str.maketrans(
+        {
+            char: markers[i]
+            for i, name in enumerate(classes)
+            for char in CHARACTER_CLASSES[name]
+        }
+    )
+
+    produced = 0
+    while produced < count:
+        batch = min(count - produced, WRITE_BATCH)
+        # Over-draw slightly to cover rejected candidates
+        chars = pool.characters(alphabet, length * (batch + batch // 2 + 16))
+        for start in range(0, len(chars) - length + 1, length):
+            candidate = chars[start : start + length]
+            classes_seen = candidate.translate(class_map)
+            if all(marker in classes_seen for marker in markers):
+                yield candidate
+                produced += 1
+                if produced >= count:
+                    return
+
+
+class MappedWordlist:
+    """
+    Wordlist read through mmap with a compact line-offset index
+
+    Accepts plain lists (one word per line) and diceware lists
+    ("11111<tab>word"), using the last field of each line.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            # mmap refuses empty files
+            if os.fstat(self._file.fileno()).st_size == 0:
+                raise ValueError("Wordlist is empty")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self._file.close()
+            raise
+        self._starts = array("Q")
+        self._ends = array("Q")
+        self._index()
+        if not self._starts:
+            self.close()
+            raise ValueError("Wordlist is empty")
+
+    def _index(self):
+        mm = self._mm
+        size = len(mm)
+        pos = 0
+        while pos < size:
+            end = mm.find(b"\n", pos)
+            if end == -1:
+                end = size
+            line = mm[pos:end].rstrip(b"\r")
+            word = line.split()[-1] if line.strip() else b""
+            if word:
+                start = pos + line.rindex(word)
+                self._starts.append(start)
+                self._ends.append(start + len(word))
+            pos = end + 1
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def word(self, index: int) -> str:
+        return self._mm[self._starts[index] : self._ends[index]].decode(
+            "utf-8", errors="replace"
+        )
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def passphrase_entropy(wordlist_size: int, words: int) -> float:
+    """Entropy (bits) of a passphrase of uniformly chosen words"""
+    return words * math.log2(wordlist_size)
+
+
+def generate_passphrases(
+    wordlist: MappedWordlist,
+    words: int,
+    count: int,
+    separator: str = "-",
+    pool: Optional[RandomPool] = None,
+) -> Iterator[str]:
+    """
+    Generate diceware-style passphrases from a mapped wordlist
+
+    Raises ValueError up front if the list is smaller than a diceware list.
+    """
+    size = len(wordlist)
+    if size < MIN_PASSPHRASE_WORDS:
+        raise ValueError(
+            f"Wordlist has {size:,} words; passphrases need a diceware-size "
+            f"list of at least {MIN_PASSPHRASE_WORDS:,} (e.g. the EFF large "
+            "wordlist)"
+        )
+    return _passphrases(wordlist, words, count, separator, pool or RandomPool())
+
+
+def _passphrases(
+    wordlist: MappedWordlist,
+    words: int,
+    count: int,
+    separator: str,
+    pool: RandomPool,
+) -> Iterator[str]:
+    size = len(wordlist)
+    produced = 0
+    while produced < count:
+        batch = min(count - produced, WRITE_BATCH)
+        indices = pool.integers(size, batch * words)
+        for start in range(0, len(indices), words):
+            yield separator.join(
+                wordlist.word(i) for i in indices[start : start + words]
+            )
+        produced += batch
+
+
+def write_outputs(
+    outputs: Iterator[str],
+    output_path: str,
+    count: int,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Stream generated outputs to a file in large batched writes
+
+    Returns:
+        Dictionary with count, bytes written, elapsed seconds and rate
+    """
+    written = 0
+    batch: List[str] = []
+    start = time.perf_counter()
+
+    with open(output_path, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+        for output in outputs:
+            batch.append(output)
+            if len(batch) >= WRITE_BATCH:
+                data = "\n".join(batch) + "\n"
+                f.write(data)
+                written += len(batch)
+                batch = []
+                if progress:
+                    progress(written)
+        if batch:
+            data = "\n".join(batch) + "\n"
+            f.write(data)
+            written += len(batch)
+        # Bytes on disk after encoding and newline translation, not characters
+        size = f.tell()
+
+    elapsed = time.perf_counter() - start
+    if progress:
+        progress(written)
+
+    return {
+        "count": written,
+        "bytes": size,
+        "seconds": elapsed,
+        "rate": written / elapsed if elapsed > 0 else 0.0,
+    }
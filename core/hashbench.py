@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Hash Benchmark Module
+Streaming file hashing and hash throughput benchmarks
+"""
+
+import os
+import ssl
+import sys
+import json
+import mmap
+import time
+import hashlib
+import platform
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Any, Callable
+
+ALGORITHMS = ["md5", "sha1", "sha256", "sha512", "blake2b", "sha3_256"]
+BUFFER_SIZES = [4 * 1024, 64 * 1024, 1024 * 1024, 8 * 1024 * 1024]
+FILE_METHODS = ["read", "readinto", "mmap"]
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+
+def hash_file(
+    path: str,
+    algorithms: List[str],
+    method: str = "readinto",
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> Dict[str, str]:
+    """
+    Hash a file with several algorithms in one streaming pass
+
+    Args:
+        path: File to hash
+        algorithms: hashlib algorithm names
+        method: "read" (new bytes per chunk), "readinto" (one reused
+            buffer) or "mmap" (zero-copy slices of the mapping)
+        buffer_size: Chunk size in bytes
+
+    Returns:
+        Mapping of algorithm name to hex digest
+    """
+    hashers = [hashlib.new(name) for name in algorithms]
+    updates = [h.update for h in hashers]
+
+    with open(path, "rb", buffering=0) as f:
+        if method == "read":
+            while True:
+                chunk = f.read(buffer_size)
+                if not chunk:
+                    break
+                for update in updates:
+                    update(chunk)
+
+        elif method == "readinto":
+            buffer = bytearray(buffer_size)
+            view = memoryview(buffer)
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                for update in updates:
+                    update(view[:n])
+            view.release()
+
+        elif method == "mmap":
+            size = os.fstat(f.fileno()).st_size
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        for start in range(0, size, buffer_size):
+                            chunk = view[start : start + buffer_size]
+                            for update in updates:
+                                update(chunk)
+                            chunk.release()
+                    finally:
+                        view.release()
+        else:
+            raise ValueError(f"Unknown read method: {method}")
+
+    return {name: h.hexdigest() for name, h in zip(algorithms, hashers)}
+
+
+def _rate(nbytes: int, seconds: float) -> float:
+    return nbytes / (1024 * 1024) / seconds if seconds > 0 else 0.0
+
+
+def bench_memory(algorithm: str, data: bytes, buffer_size: int) -> float:
+    """MB/s hashing an in-memory buffer in buffer_size slices"""
+    view = memoryview(data)
+    h = hashlib.new(algorithm)
+    start = time.perf_counter()
+    for offset in range(0, len(data), buffer_size):
+        h.update(view[offset : offset + buffer_size])
+    h.digest()
+    elapsed = time.perf_counter() - start
+    view.release()
+    return _rate(len(data), elapsed)
+
+
+def bench_file(algorithm: str, path: str, method: str, buffer_size: int) -> float:
+    """MB/s hashing a file with the given read method"""
+    size = os.path.getsize(path)
+    start = time.perf_counter()
+    hash_file(path, [algorithm], method, buffer_size)
+    return _rate(size, time.perf_counter() - start)
+
+
+def bench_parallel(
+    algorithm: str, paths: List[str], buffer_size: int, workers: int
+) -> Dict[str, float]:
+    """
+    MB/s hashing several files sequentially versus in a thread pool
+
+    hashlib releases the GIL while hashing large buffers, so threads scale
+    across cores without process start-up or pickling costs.
+    """
+    total = sum(os.path.getsize(p) for p in paths)
+
+    start = time.perf_counter()
+    for path in paths:
+        hash_file(path, [algorithm], "readinto", buffer_size)
+    sequential = _rate(total, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(
+            executor.map(
+                lambda p: hash_file(p, [algorithm], "readinto", buffer_size), paths
+            )
+        )
+    parallel = _rate(total, time.perf_counter() - start)
+
+    return {"sequential": sequential, "parallel": parallel}
+
+
+def run_benchmark(
+    algorithms: List[str] = ALGORITHMS,
+    buffer_sizes: List[int] = BUFFER_SIZES,
+    data_size: int = 32 * 1024 * 1024,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run the full benchmark matrix
+
+    Every algorithm is measured in memory and through each file read
+    method at every buffer size, then single-threaded against a parallel
+    multi-file run. File results are warm page-cache numbers (the data was
+    just written), so they measure hashing and copy overhead, not the disk.
+
+    Returns:
+        Dictionary with system info, per-run results, parallel results, the
+        fastest file-hashing run ("best") and the fastest in-memory run
+        ("memory_ceiling")
+    """
+    workers = workers or os.cpu_count() or 1
+    file_count = max(workers, 2)
+    steps = len(algorithms) * (len(buffer_sizes) * (1 + len(FILE_METHODS)) + 1)
+    done = 0
+
+    data = os.urandom(data_size)
+    results: List[Dict[str, Any]] = []
+    parallel: List[Dict[str, Any]] = []
+
+    with tempfile.TemporaryDirectory(prefix="pytools-hashbench-") as tmp:
+        main_file = os.path.join(tmp, "data.bin")
+        with open(main_file, "wb") as f:
+            f.write(data)
+
+        # Split the same volume across several files for the parallel run
+        part = max(data_size // file_count, 1)
+        parts = []
+        for i in range(file_count):
+            path = os.path.join(tmp, f"part{i}.bin")
+            with open(path, "wb") as f:
+                f.write(data[i * part : (i + 1) * part])
+            parts.append(path)
+
+        for algorithm in algorithms:
+            for buffer_size in buffer_sizes:
+                results.append(
+                    {
+                        "algorithm": algorithm,
+                        "mode": "memory",
+                        "buffer_size": buffer_size,
+                        "mb_s": bench_memory(algorithm, data, buffer_size),
+                    }
+                )
+                done += 1
+                for method in FILE_METHODS:
+                    results.append(
+                        {
+                            "algorithm": algorithm,
+                            "mode": method,
+                            "buffer_size": buffer_size,
+                            "mb_s": bench_file(
+                                algorithm, main_file, method, buffer_size
+                            ),
+                        }
+                    )
+                    done += 1
+                if progress:
+                    progress(done, steps)
+
+            rates = bench_parallel(algorithm, parts, DEFAULT_BUFFER_SIZE, workers)
+            parallel.append(
+                {
+                    "algorithm": algorithm,
+                    "files": file_count,
+                    "workers": workers,
+                    "sequential_mb_s": rates["sequential"],
+                    "parallel_mb_s": rates["parallel"],
+                }
+            )
+            done += 1
+            if progress:
+                progress(done, steps)
+
+    # The headline figure is file hashing; memory mode never reads the file
+    # and is reported separately as the ceiling
+    file_results = [r for r in results if r["mode"] != "memory"]
+    memory_results = [r for r in results if r["mode"] == "memory"]
+    best = max(file_results, key=lambda r: r["mb_s"]) if file_results else None
+    ceiling = max(memory_results, key=lambda r: r["mb_s"]) if memory_results else None
+    return {
+        "system": {
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "python": sys.version.split()[0],
+            "openssl": ssl.OPENSSL_VERSION,
+        },
+        "data_size": data_size,
+        "results": results,
+        "parallel": parallel,
+        "best": best,
+        "memory_ceiling": ceiling,
+    }
+
+
+def save_results(results: Dict[str, Any], path: str):
+    """Write benchmark results as JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core History Module
+Persistent multi-resolution metrics history in a memory-mapped file
+"""
+
+import os
+import math
+import mmap
+import struct
+import threading
+from array import array
+from typing import Optional, Dict, List, Tuple, Any
+
+from .monitor import SystemSampler, get_sampler
+from .utils import get_cache, get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, every instance may write
+    fcntl = None
+
+METRICS = (
+    "cpu",
+    "memory",
+    "memory_used",
+    "swap",
+    "disk_read",
+    "disk_write",
+    "net_recv",
+    "net_sent",
+)
+
+# (seconds per bucket, buckets kept): 1 h of seconds, 24 h of minutes and
+# 30 days of hours, about 180 KB on disk with the metrics above
+TIERS = ((1, 3600), (60, 1440), (3600, 720))
+
+MAGIC = b"PYTMH1\0\0"
+HEADER = struct.Struct("<8sII")  # magic, metric count, tier count
+# resolution, slots, newest stored bucket, pending bucket, pending samples
+TIER_HEADER = struct.Struct("<IIqqI4x")
+NAN = float("nan")
+
+
+def sample_values(sample: Dict[str, Any]) -> Tuple[float, ...]:
+    """One SystemSampler sample as a row of METRICS"""
+    return (
+        sample["cpu"]["total"],
+        sample["memory"]["percent"],
+        sample["memory"]["used"],
+        sample["swap"]["percent"],
+        sample["disk"]["read_bytes"],
+        sample["disk"]["write_bytes"],
+        sample["net"]["recv_bytes"],
+        sample["net"]["sent_bytes"],
+    )
+
+
+class MetricsHistory:
+    """
+    Fixed-size ring buffers of metric averages at several resolutions
+
+    Every tier is a ring of `slots` buckets of `resolution` seconds, stored
+    as float32 columns (one contiguous run per metric) in a memory-mapped
+    file, so reading a series is a slice of the map and the file never
+    grows. Buckets are addressed by absolute bucket number modulo the ring
+    size; buckets skipped while nothing was recording are set to NaN.
+
+    Each recorded sample is added to a pending sum per tier, and the mean is
+    written to the ring when the sample's bucket moves on, which is how the
+    minute and hour tiers are downsampled from the raw samples. The pending
+    sums live in the file header too, so a restart loses nothing.
+
+    Only one process records at a time (an exclusive lock on the file);
+    others open it read-only and see the recorder's updates through the
+    shared mapping.
+    """
+
+    def __init__(self, path: str, writable: bool = True):
+        self.path = path
+        self.writable = writable
+        self._lock = threading.Lock()
+        self._metrics = len(METRICS)
+
+        # Header, per-tier headers with pending sums, then the float data
+        tier_size = TIER_HEADER.size + 8 * self._metrics
+        self._tier_offsets = [HEADER.size + i * tier_size for i in range(len(TIERS))]
+        data_offset = HEADER.size + len(TIERS) * tier_size
+        self._data_bases: List[int] = []  # float index of each tier's data
+        floats = 0
+        for _, slots in TIERS:
+            self._data_bases.append(floats)
+            floats += slots * self._metrics
+        self.size = data_offset + floats * 4
+
+        flags = os.O_RDWR | os.O_CREAT if writable else os.O_RDONLY
+        self._fd = os.open(path, flags, 0o644)
+        try:
+            if writable and fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            if not self._valid():
+                if not writable:
+                    raise ValueError(f"{path} is not a metrics history file")
+                self._initialize(data_offset, floats)
+            self._map = mmap.mmap(
+                self._fd,
+                self.size,
+                access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ,
+            )
+        except Exception:
+            os.close(self._fd)
+            raise
+        self._data = memoryview(self._map)[data_offset:].cast("f")
+
+    def _valid(self) -> bool:
+        if os.fstat(self._fd).st_size != self.size:
+            return False
+        header = os.pread(self._fd, HEADER.size + len(TIERS) * TIER_HEADER.size, 0)
+        if header[: HEADER.size] != HEADER.pack(MAGIC, self._metrics, len(TIERS)):
+            return False
+        for i, (resolution, slots) in enumerate(TIERS):
+            stored = TIER_HEADER.unpack_from(
+                os.pread(self._fd, TIER_HEADER.size, self._tier_offsets[i])
+            )
+            if stored[:2] != (resolution, slots):
+                return False
+        return True
+
+    def _initialize(self, data_offset: int, floats: int):
+        """(Re)create an empty history of the current layout"""
+        header = bytearray(data_offset)
+        HEADER.pack_into(header, 0, MAGIC, self._metrics, len(TIERS))
+        for i, (resolution, slots) in enumerate(TIERS):
+            TIER_HEADER.pack_into(
+                header, self._tier_offsets[i], resolution, slots, -1, -1, 0
+            )
+        os.ftruncate(self._fd, 0)
+        os.pwrite(self._fd, bytes(header) + array("f", [NAN] * floats).tobytes(), 0)
+
+    def close(self):
+        self._data.release()
+        if self.writable:
+            self._map.flush()
+        self._map.close()
+        os.close(self._fd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _tier(self, tier: int) -> Tuple[int, int, List[float]]:
+        """Newest stored bucket, pending bucket and pending sums/count"""
+        offset = self._tier_offsets[tier]
+        _, _, head, bucket, count = TIER_HEADER.unpack_from(self._map, offset)
+        sums = list(
+            struct.unpack_from(
+                f"<{self._metrics}d", self._map, offset + TIER_HEADER.size
+            )
+        )
+        return head, bucket, sums + [count]
+
+    def _store(self, tier: int, bucket: int, values: List[float]):
+        """Write one bucket's values, blanking buckets skipped since the head"""
+        offset = self._tier_offsets[tier]
+        _, slots, head, _, _ = TIER_HEADER.unpack_from(self._map, offset)
+        if head >= 0 and bucket <= head - slots:
+            return  # older than the ring reaches
+        base = self._data_bases[tier]
+        data = self._data
+        if bucket > head:
+            gap = min(bucket - head - 1, slots) if head >= 0 else 0
+            for missing in range(bucket - gap, bucket):
+                slot = missing % slots
+                for m in range(self._metrics):
+                    data[base + m * slots + slot] = NAN
+            head = bucket
+        slot = bucket % slots
+        for m, value in enumerate(values):
+            data[base + m * slots + slot] = value
+        struct.pack_into("<q", self._map, offset + 8, head)
+
+    def record(self, timestamp: float, values: Tuple[float, ...]):
+        """Add one sample (a row of METRICS) taken at `timestamp`"""
+        if not self.writable:
+            raise PermissionError("history is open read-only")
+        with self._lock:
+            for tier, (resolution, _) in enumerate(TIERS):
+                offset = self._tier_offsets[tier]
+                _, bucket, pending = self._tier(tier)
+                count = pending[-1]
+                sums = pending[:-1]
+                current = int(timestamp // resolution)
+                if count and bucket != current:
+                    self._store(tier, bucket, [s / count for s in sums])
+                    count = 0
+                if not count:
+                    sums = [0.0] * self._metrics
+                sums = [s + v for s, v in zip(sums, values)]
+                count += 1
+                struct.pack_into("<qI", self._map, offset + 16, current, count)
+                struct.pack_into(
+                    f"<{self._metrics}d", self._map, offset + TIER_HEADER.size, *sums
+                )
+
+    def record_sample(self, sample: Dict[str, Any]):
+        """SystemSampler listener"""
+        self.record(sample["timestamp"], sample_values(sample))
+
+    def attach(self, sampler: SystemSampler) -> "MetricsHistory":
+        """Record every sample `sampler` takes"""
+        sampler.add_listener(self.record_sample)
+        return self
+
+    @staticmethod
+    def resolution_for(seconds: float) -> int:
+        """Finest resolution whose ring covers `seconds`"""
+        for resolution, slots in TIERS:
+            if resolution * slots >= seconds:
+                return resolution
+        return TIERS[-1][0]
+
+    def series(
+        self, metric: str, seconds: float, now: float, resolution: Optional[int] = None
+    ) -> Tuple[int, List[float]]:
+        """
+        Values of `metric` over the `seconds` before `now`, oldest first
+
+        Uses the finest tier that covers the span unless `resolution` picks
+        one. Returns (resolution, values) with one value per bucket; buckets
+        without data are NaN, and the newest bucket includes samples still
+        pending in it.
+        """
+        index = METRICS.index(metric)
+        resolution = resolution or self.resolution_for(seconds)
+        tier = [r for r, _ in TIERS].index(resolution)
+        slots = TIERS[tier][1]
+        newest = int(now // resolution)
+        count = min(max(int(math.ceil(seconds / resolution)), 1), slots)
+        oldest = newest - count + 1
+
+        with self._lock:
+            head, bucket, pending = self._tier(tier)
+            start = self._data_bases[tier] + index * slots
+            first = oldest % slots
+            column = self._data[start : start + slots]
+            if first + count <= slots:
+                values = column[first : first + count].tolist()
+            else:
+                values = (
+                    column[first:].tolist() + column[: first + count - slots].tolist()
+                )
+            column.release()
+
+        # Slots past the head or before the ring's reach hold other buckets
+        for i in range(count):
+            b = oldest + i
+            if b > head or b <= head - slots:
+                values[i] = NAN
+        if pending[-1] and oldest <= bucket <= newest:
+            values[bucket - oldest] = pending[index] / pending[-1]
+        return resolution, values
+
+
+def get_history_path() -> str:
+    """History file in the PyTools cache directory"""
+    return os.path.join(get_cache().cache_dir, "metrics.hist")
+
+
+_recorder: Optional[MetricsHistory] = None
+_reader: Optional[MetricsHistory] = None
+_history_lock = threading.Lock()
+
+
+def start_recording(
+    sampler: Optional[SystemSampler] = None,
+) -> Optional[MetricsHistory]:
+    """
+    Record the shared sampler (or `sampler`) into the history file
+
+    Returns None when another PyTools process is already recording (its
+    data is still visible through get_history()) or when the history file
+    can't be used, e.g. a read-only or full cache directory, or a
+    filesystem without locking. History is optional, so this never raises.
+    """
+    global _recorder
+    with _history_lock:
+        if _recorder is None:
+            try:
+                history = MetricsHistory(get_history_path(), writable=True)
+            except BlockingIOError:
+                get_logger().info(
+                    "Metrics history is recorded by another PyTools process"
+                )
+                return None
+            except (OSError, ValueError) as e:
+                get_logger().warning(f"Metrics history disabled: {e}")
+                return None
+            _recorder = history.attach(sampler or get_sampler())
+        return _recorder
+
+
+def is_recording() -> bool:
+    return _recorder is not None
+
+
+def get_history() -> Optional[MetricsHistory]:
+    """This process's recorder, or a shared read-only view of the file"""
+    global _reader
+    with _history_lock:
+        if _recorder is not None:
+            return _recorder
+        if _reader is None:
+            try:
+                _reader = MetricsHistory(get_history_path(), writable=False)
+            except (OSError, ValueError):
+                return None
+        return _reader
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Monitor Module
+Fixed-rate background sampling of system metrics
+"""
+
+import os
+import time
+import threading
+from typing import Optional, Dict, List, Any, Callable
+
+import psutil
+
+
+class SystemSampler:
+    """
+    Background thread sampling CPU, memory, swap, disk and network
+
+    Samples are taken on a fixed schedule (deadlines advance by exactly one
+    interval, so slow samples do not cause drift). Counters such as disk and
+    network I/O are turned into per-second rates from consecutive samples.
+    The sampler measures its own CPU time so its overhead can be reported.
+
+    Consumers either read `latest` (with `version` to detect new samples),
+    block in `wait_for_sample`, or register listeners called on the sampler
+    thread with each new sample.
+    """
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self.latest: Optional[Dict[str, Any]] = None
+        self.version = 0
+        self.overhead = {"cpu_percent": 0.0, "sample_ms": 0.0}
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._previous: Optional[Dict[str, Any]] = None
+        self._cpu_time = 0.0
+        self._wall_time = 0.0
+
+    def add_listener(self, callback: Callable[[Dict[str, Any]], None]):
+        """Call `callback(sample)` on the sampler thread for every sample"""
+        self._listeners.append(callback)
+
+    def start(self) -> "SystemSampler":
+        if self._thread is None:
+            # Prime the CPU counters so the first real sample is meaningful
+            psutil.cpu_percent(percpu=True)
+            self._previous = self._counters()
+            self._thread = threading.Thread(
+                target=self._run, name="pytools-sampler", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait_for_sample(
+        self, version: int, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Block until a sample newer than `version` exists (or timeout)"""
+        with self._cond:
+            if self.version <= version:
+                self._cond.wait(timeout)
+            return self.latest if self.version > version else None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _run(self):
+        deadline = time.monotonic() + self.interval
+        while not self._stop.wait(max(0.0, deadline - time.monotonic())):
+            deadline += self.interval
+            # Skip missed ticks instead of bursting to catch up
+            now = time.monotonic()
+            if deadline < now:
+                deadline = now + self.interval
+
+            cpu_start = time.thread_time()
+            wall_start = time.perf_counter()
+            try:
+                sample = self._sample()
+            except Exception:
+                continue
+            cpu_used = time.thread_time() - cpu_start
+            wall_used = time.perf_counter() - wall_start
+
+            self._cpu_time += cpu_used
+            self._wall_time += self.interval
+            self.overhead = {
+                "cpu_percent": self._cpu_time / self._wall_time * 100,
+                "sample_ms": wall_used * 1000,
+            }
+            sample["overhead"] = dict(self.overhead)
+
+            with self._cond:
+                self.latest = sample
+                self.version += 1
+                self._cond.notify_all()
+
+            for listener in self._listeners:
+                try:
+                    listener(sample)
+                except Exception:
+                    pass
+
+    @staticmethod
+    def _counters() -> Dict[str, Any]:
+        return {
+            "time": time.monotonic(),
+            "disk": psutil.disk_io_counters(),
+            "net": psutil.net_io_counters(),
+        }
+
+    def _sample(self) -> Dict[str, Any]:
+        counters = self._counters()
+        previous = self._previous or counters
+        self._previous = counters
+        elapsed = counters["time"] - previous["time"] or self.interval
+
+        def rate(kind: str, field: str) -> float:
+            now, before = counters[kind], previous[kind]
+            if now is None or before is None:
+                return 0.0
+            return max(getattr(now, field) - getattr(before, field), 0) / elapsed
+
+        mem = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        try:
+            load = os.getloadavg()
+        except (AttributeError, OSError):
+            load = None
+
+        cores = psutil.cpu_percent(percpu=True)
+        return {
+            "timestamp": time.time(),
+            "cpu": {
+                "total": sum(cores) / len(cores) if cores else 0.0,
+                "cores": cores,
+                "load": load,
+            },
+            "memory": {
+                "total": mem.total,
+                "used": mem.used,
+                "available": mem.available,
+                "percent": mem.percent,
+            },
+            "swap": {"total": swap.total, "used": swap.used, "percent": swap.percent},
+            "disk": {
+                "read_bytes": rate("disk", "read_bytes"),
+                "write_bytes": rate("disk", "write_bytes"),
+                "read_ops": rate("disk", "read_count"),
+                "write_ops": rate("disk", "write_count"),
+            },
+            "net": {
+                "sent_bytes": rate("net", "bytes_sent"),
+                "recv_bytes": rate("net", "bytes_recv"),
+                "sent_packets": rate("net", "packets_sent"),
+                "recv_packets": rate("net", "packets_recv"),
+            },
+        }
+
+
+_shared_sampler: Optional[SystemSampler] = None
+_shared_lock = threading.Lock()
+
+
+def get_sampler() -> SystemSampler:
+    """
+    Process-wide 1 s sampler, started on first use
+
+    Screens that only need a recent reading share this instead of blocking
+    on their own measurement interval.
+    """
+    global _shared_sampler
+    with _shared_lock:
+        if _shared_sampler is None or not _shared_sampler.running:
+            _shared_sampler = SystemSampler(1.0).start()
+        return _shared_sampler
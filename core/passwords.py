@@ -0,0 +1,859 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Passwords Module
+Pattern-based password strength estimation (zxcvbn-style)
+"""
+
+import os
+import re
+import math
+import pickle
+import threading
+from datetime import datetime
+from itertools import product
+from typing import Optional, Dict, List, Any, Iterable, Tuple
+
+from .utils import get_cache
+
+# Guess-count model constants (after zxcvbn)
+BRUTEFORCE_CARDINALITY = 10
+MIN_GUESSES_BEFORE_GROWING_SEQUENCE = 10000
+MIN_SUBMATCH_GUESSES_SINGLE_CHAR = 10
+MIN_SUBMATCH_GUESSES_MULTI_CHAR = 50
+MIN_YEAR_SPACE = 20
+REFERENCE_YEAR = datetime.now().year
+MAX_ANALYZED_LENGTH = 100
+
+# Offline attack against a slow hash (bcrypt/scrypt/PBKDF2)
+GUESSES_PER_SECOND = 1e4
+
+SCORE_THRESHOLDS = [1e3 + 5, 1e6 + 5, 1e8 + 5, 1e10 + 5]
+
+WORDLIST_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "wordlists"
+)
+INDEX_VERSION = 2
+
+L33T_TABLE = {
+    "a": ["4", "@"],
+    "b": ["8"],
+    "c": ["(", "{", "[", "<"],
+    "e": ["3"],
+    "g": ["6", "9"],
+    "i": ["1", "!", "|"],
+    "l": ["1", "|", "7"],
+    "o": ["0"],
+    "s": ["$", "5"],
+    "t": ["+", "7"],
+    "x": ["%"],
+    "z": ["2"],
+}
+MAX_L33T_VARIANTS = 16
+
+DATE_SEPARATED = re.compile(r"^(\d{1,4})([\s/\\_.-])(\d{1,2})\2(\d{1,4})$")
+RECENT_YEAR = re.compile(r"19\d\d|20\d\d")
+REPEAT_GREEDY = re.compile(r"(.+)\1+", re.DOTALL)
+REPEAT_LAZY = re.compile(r"(.+?)\1+", re.DOTALL)
+REPEAT_LAZY_ANCHORED = re.compile(r"^(.+?)\1+$", re.DOTALL)
+
+
+def _build_slanted_graph(rows: List[List[str]]) -> Dict[str, List[Optional[str]]]:
+    """
+    Build adjacency for a staggered keyboard
+
+    Each key is a string of its unshifted and shifted characters. Row r is
+    offset half a key to the right of row r - 1, giving six neighbours:
+    left, upper-left, upper-right, right, lower-right, lower-left.
+    """
+    graph = {}
+    for r, row in enumerate(rows):
+        for c, key in enumerate(row):
+
+            def at(rr, cc):
+                if 0 <= rr < len(rows) and 0 <= cc < len(rows[rr]):
+                    return rows[rr][cc]
+                return None
+
+            neighbours = [
+                at(r, c - 1),
+                at(r - 1, c),
+                at(r - 1, c + 1),
+                at(r, c + 1),
+                at(r + 1, c),
+                at(r + 1, c - 1),
+            ]
+            for char in key:
+                graph[char] = neighbours
+    return graph
+
+
+def _build_aligned_graph(rows: List[str]) -> Dict[str, List[Optional[str]]]:
+    """Build 8-way adjacency for a grid keypad (spaces are gaps)"""
+    graph = {}
+    for r, row in enumerate(rows):
+        for c, char in enumerate(row):
+            if char == " ":
+                continue
+            neighbours = []
+            for dr, dc in [
+                (0, -1),
+                (-1, -1),
+                (-1, 0),
+                (-1, 1),
+                (0, 1),
+                (1, 1),
+                (1, 0),
+                (1, -1),
+            ]:
+                rr, cc = r + dr, c + dc
+                if (
+                    0 <= rr < len(rows)
+                    and 0 <= cc < len(rows[rr])
+                    and rows[rr][cc] != " "
+                ):
+                    neighbours.append(rows[rr][cc])
+                else:
+                    neighbours.append(None)
+            graph[char] = neighbours
+    return graph
+
+
+QWERTY_ROWS = [
+    ["`~", "1!", "2@", "3#", "4$", "5%", "6^", "7&", "8*", "9(", "0)", "-_", "=+"],
+    ["qQ", "wW", "eE", "rR", "tT", "yY", "uU", "iI", "oO", "pP", "[{", "]}", "\\|"],
+    ["aA", "sS", "dD", "fF", "gG", "hH", "jJ", "kK", "lL", ";:", "'\""],
+    ["zZ", "xX", "cC", "vV", "bB", "nN", "mM", ",<", ".>", "/?"],
+]
+# Row 1 starts half a key right of "1", not of "`"
+QWERTY_ROWS[0] = QWERTY_ROWS[0][1:]
+
+GRAPHS = {
+    "qwerty": _build_slanted_graph(QWERTY_ROWS),
+    "keypad": _build_aligned_graph(["789", "456", "123", " 0."]),
+}
+SHIFTED_CHARS = {key[1] for row in QWERTY_ROWS for key in row}
+
+
+def _graph_stats(graph: Dict[str, List[Optional[str]]]) -> Tuple[int, float]:
+    """Starting positions and average degree of a keyboard graph"""
+    # Characters on the same key share one neighbour list
+    keys = {id(neighbours): neighbours for neighbours in graph.values()}
+    degrees = [sum(1 for n in neighbours if n) for neighbours in keys.values()]
+    return len(keys), sum(degrees) / len(degrees)
+
+
+GRAPH_STATS = {name: _graph_stats(graph) for name, graph in GRAPHS.items()}
+
+
+class WordlistIndex:
+    """
+    Lazily-loaded ranked wordlists with an on-disk compiled index
+
+    Plain-text lists (one word per line, most common first) are read from
+    the bundled data/wordlists directory and the user's config wordlists
+    directory. They are compiled once into a pickled index in the cache
+    directory and only rebuilt when a source changes. The index merges all
+    lists into one {word: ((list name, rank), ...)} table plus the set of
+    word prefixes, so matching stops extending a substring as soon as no
+    word can start with it.
+    """
+
+    def __init__(
+        self, dirs: Optional[List[str]] = None, index_path: Optional[str] = None
+    ):
+        cache = get_cache()
+        if dirs is None:
+            dirs = [WORDLIST_DIR, os.path.join(cache.config.config_dir, "wordlists")]
+        self.dirs = dirs
+        self.index_path = index_path or os.path.join(cache.cache_dir, "wordlists.idx")
+        self._tables: Optional[Tuple[Dict[str, tuple], set]] = None
+        self._lock = threading.Lock()
+
+    def _sources(self) -> List[Tuple[str, str, int, int]]:
+        sources = []
+        for directory in self.dirs:
+            if not os.path.isdir(directory):
+                continue
+            for entry in sorted(os.scandir(directory), key=lambda e: e.name):
+                if entry.name.endswith(".txt") and entry.is_file():
+                    st = entry.stat()
+                    sources.append(
+                        (entry.name[:-4], entry.path, st.st_mtime_ns, st.st_size)
+                    )
+        return sources
+
+    def _compile(self, sources) -> Tuple[Dict[str, tuple], set]:
+        ranked: Dict[str, Dict[str, int]] = {}
+        for name, path, _mtime, _size in sources:
+            words = ranked.setdefault(name, {})
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                for line in f:
+                    word = line.strip().lower()
+                    if word and word not in words:
+                        words[word] = len(words) + 1
+        return build_tables(ranked)
+
+    def _load(self) -> Tuple[Dict[str, tuple], set]:
+        sources = self._sources()
+        signature = [(path, mtime, size) for _name, path, mtime, size in sources]
+
+        try:
+            with open(self.index_path, "rb") as f:
+                index = pickle.load(f)
+            if (
+                index.get("version") == INDEX_VERSION
+                and index.get("signature") == signature
+            ):
+                return index["words"], index["prefixes"]
+        except Exception:
+            pass
+
+        words, prefixes = self._compile(sources)
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(
+                    {
+                        "version": INDEX_VERSION,
+                        "signature": signature,
+                        "words": words,
+                        "prefixes": prefixes,
+                    },
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass
+        return words, prefixes
+
+    @property
+    def tables(self) -> Tuple[Dict[str, tuple], set]:
+        """(words, prefixes) lookup tables, loaded on first access"""
+        if self._tables is None:
+            with self._lock:
+                if self._tables is None:
+                    self._tables = self._load()
+        return self._tables
+
+
+def build_tables(ranked: Dict[str, Dict[str, int]]) -> Tuple[Dict[str, tuple], set]:
+    """Merge {name: {word: rank}} lists into word and prefix lookup tables"""
+    words: Dict[str, tuple] = {}
+    prefixes = set()
+    for name, entries in ranked.items():
+        for word, rank in entries.items():
+            words[word] = words.get(word, ()) + ((name, rank),)
+            for k in range(1, len(word)):
+                prefixes.add(word[:k])
+    return words, prefixes
+
+
+def _n_ck(n: int, k: int) -> int:
+    if k > n:
+        return 0
+    return math.factorial(n) // (math.factorial(k) * math.factorial(n - k))
+
+
+class PasswordEstimator:
+    """
+    Estimate password guessability from recognizable patterns
+
+    The password is scanned for dictionary words (plain, reversed and l33t),
+    keyboard walks, repeats, character sequences, years and dates. Each match
+    gets a guess estimate, and a dynamic program picks the non-overlapping
+    sequence of matches (with bruteforce filling the gaps) that minimizes
+    total guesses, as an attacker trying the cheapest patterns first would.
+    """
+
+    def __init__(self, index: Optional[WordlistIndex] = None):
+        self.index = index or WordlistIndex()
+
+    # ------------------------------------------------------------------ #
+    # Matching
+    # ------------------------------------------------------------------ #
+
+    def _dictionaries(self, user_inputs: Iterable[str]) -> List[tuple]:
+        tables = [self.index.tables]
+        user_words = [w.strip().lower() for w in user_inputs if w and w.strip()]
+        if user_words:
+            ranked = {w: i for i, w in reversed(list(enumerate(user_words, 1)))}
+            tables.append(build_tables({"user_inputs": ranked}))
+        return tables
+
+    def _dictionary_match(self, password: str, dicts) -> List[Dict[str, Any]]:
+        matches = []
+        lower = password.lower()
+        n = len(password)
+        for words, prefixes in dicts:
+            for i in range(n):
+                for j in range(i, n):
+                    word = lower[i : j + 1]
+                    entries = words.get(word)
+                    if entries is not None:
+                        for name, rank in entries:
+                            matches.append(
+                                {
+                                    "pattern": "dictionary",
+                                    "i": i,
+                                    "j": j,
+                                    "token": password[i : j + 1],
+                                    "matched_word": word,
+                                    "rank": rank,
+                                    "dictionary_name": name,
+                                    "reversed": False,
+                                    "l33t": False,
+                                }
+                            )
+                    if word not in prefixes:
+                        break
+        return matches
+
+    def _reverse_dictionary_match(self, password: str, dicts) -> List[Dict[str, Any]]:
+        reversed_password = password[::-1]
+        n = len(password)
+        matches = []
+        for match in self._dictionary_match(reversed_password, dicts):
+            if len(match["token"]) < 2:
+                continue
+            i, j = n - 1 - match["j"], n - 1 - match["i"]
+            match.update(
+                {"token": password[i : j + 1], "i": i, "j": j, "reversed": True}
+            )
+            matches.append(match)
+        return matches
+
+    def _l33t_match(self, password: str, dicts) -> List[Dict[str, Any]]:
+        reverse_table: Dict[str, List[str]] = {}
+        for letter, subs in L33T_TABLE.items():
+            for sub in subs:
+                if sub in password:
+                    reverse_table.setdefault(sub, []).append(letter)
+        if not reverse_table:
+            return []
+
+        subs = sorted(reverse_table)
+        matches = []
+        seen = set()
+        for count, letters in enumerate(product(*(reverse_table[s] for s in subs))):
+            if count >= MAX_L33T_VARIANTS:
+                break
+            sub_map = dict(zip(subs, letters))
+            translated = "".join(sub_map.get(ch, ch) for ch in password)
+            for match in self._dictionary_match(translated, dicts):
+                token = password[match["i"] : match["j"] + 1]
+                if len(token) <= 1 or token.lower() == match["matched_word"]:
+                    continue
+                used = {k: v for k, v in sub_map.items() if k in token}
+                key = (
+                    match["i"],
+                    match["j"],
+                    match["dictionary_name"],
+                    match["matched_word"],
+                )
+                if key in seen:
+                    continue
+                seen.add(key)
+                match.update({"token": token, "l33t": True, "sub": used})
+                matches.append(match)
+        return matches
+
+    def _spatial_match(self, password: str) -> List[Dict[str, Any]]:
+        matches = []
+        n = len(password)
+        for graph_name, graph in GRAPHS.items():
+            i = 0
+            while i < n - 1:
+                j = i + 1
+                last_direction = None
+                turns = 0
+                shifted = (
+                    1 if graph_name == "qwerty" and password[i] in SHIFTED_CHARS else 0
+                )
+                while True:
+                    found = False
+                    if j < n:
+                        current = password[j]
+                        for direction, key in enumerate(graph.get(password[j - 1], [])):
+                            if key and current in key:
+                                found = True
+                                if graph_name == "qwerty" and key.index(current) == 1:
+                                    shifted += 1
+                                if last_direction != direction:
+                                    turns += 1
+                                    last_direction = direction
+                                break
+                    if found:
+                        j += 1
+                        continue
+                    if j - i > 2:
+                        matches.append(
+                            {
+                                "pattern": "spatial",
+                                "i": i,
+                                "j": j - 1,
+                                "token": password[i:j],
+                                "graph": graph_name,
+                                "turns": turns,
+                                "shifted_count": shifted,
+                            }
+                        )
+                    i = j
+                    break
+        return matches
+
+    def _repeat_match(self, password: str, dicts) -> List[Dict[str, Any]]:
+        matches = []
+        pos = 0
+        n = len(password)
+        while pos < n:
+            greedy = REPEAT_GREEDY.search(password, pos)
+            if not greedy:
+                break
+            lazy = REPEAT_LAZY.search(password, pos)
+            if len(greedy.group(0)) > len(lazy.group(0)):
+                match = greedy
+                base = REPEAT_LAZY_ANCHORED.match(match.group(0)).group(1)
+            else:
+                match = lazy
+                base = match.group(1)
+
+            base_guesses = self._most_guessable(base, self._omnimatch(base, dicts))[
+                "guesses"
+            ]
+            matches.append(
+                {
+                    "pattern": "repeat",
+                    "i": match.start(),
+                    "j": match.end() - 1,
+                    "token": match.group(0),
+                    "base_token": base,
+                    "base_guesses": base_guesses,
+                    "repeat_count": len(match.group(0)) // len(base),
+                }
+            )
+            pos = match.end()
+        return matches
+
+    def _sequence_match(self, password: str) -> List[Dict[str, Any]]:
+        matches = []
+        n = len(password)
+        if n <= 1:
+            return matches
+
+        def update(i, j, delta):
+            if (j - i > 1 or abs(delta) == 1) and 0 < abs(delta) <= 5:
+                token = password[i : j + 1]
+                if token.islower() and token.isalpha():
+                    name, space = "lower", 26
+                elif token.isupper() and token.isalpha():
+                    name, space = "upper", 26
+                elif token.isdigit():
+                    name, space = "digits", 10
+                else:
+                    name, space = "unicode", 26
+                matches.append(
+                    {
+                        "pattern": "sequence",
+                        "i": i,
+                        "j": j,
+                        "token": token,
+                        "sequence_name": name,
+                        "sequence_space": space,
+                        "ascending": delta > 0,
+                    }
+                )
+
+        i = 0
+        last_delta = None
+        for k in range(1, n):
+            delta = ord(password[k]) - ord(password[k - 1])
+            if last_delta is None:
+                last_delta = delta
+            if delta == last_delta:
+                continue
+            j = k - 1
+            update(i, j, last_delta)
+            i = j
+            last_delta = delta
+        update(i, n - 1, last_delta)
+        return matches
+
+    def _regex_match(self, password: str) -> List[Dict[str, Any]]:
+        return [
+            {
+                "pattern": "regex",
+                "regex_name": "recent_year",
+                "i": m.start(),
+                "j": m.end() - 1,
+                "token": m.group(0),
+                "year": int(m.group(0)),
+            }
+            for m in RECENT_YEAR.finditer(password)
+        ]
+
+    @staticmethod
+    def _valid_date(day: int, month: int, year: int) -> bool:
+        return 1 <= month <= 12 and 1 <= day <= 31 and 1000 <= year <= 2050
+
+    @staticmethod
+    def _expand_year(year: int, digits: int) -> int:
+        if digits > 2:
+            return year
+        return year + (1900 if year > 50 else 2000)
+
+    def _date_match(self, password: str) -> List[Dict[str, Any]]:
+        matches = []
+        n = len(password)
+
+        def add(i, j, candidates, separator):
+            best = min(candidates, key=lambda c: abs(c[2] - REFERENCE_YEAR))
+            matches.append(
+                {
+                    "pattern": "date",
+                    "i": i,
+                    "j": j,
+                    "token": password[i : j + 1],
+                    "separator": separator,
+                    "day": best[0],
+                    "month": best[1],
+                    "year": best[2],
+                }
+            )
+
+        # Without separators: 4-8 digits split into day, month and year
+        for i in range(n - 3):
+            for j in range(i + 3, min(n, i + 8)):
+                token = password[i : j + 1]
+                if not token.isdigit():
+                    break
+                candidates = []
+                for y_len in (2, 4):
+                    for d_len in (1, 2):
+                        m_len = len(token) - y_len - d_len
+                        if m_len not in (1, 2):
+                            continue
+                        # year-first and year-last layouts
+                        layouts = [
+                            (token[y_len:], token[:y_len]),
+                            (token[: len(token) - y_len], token[len(token) - y_len :]),
+                        ]
+                        for dm, y in layouts:
+                            for d, m in (
+                                (dm[:d_len], dm[d_len:]),
+                                (dm[m_len:], dm[:m_len]),
+                            ):
+                                year = self._expand_year(int(y), y_len)
+                                if self._valid_date(int(d), int(m), year):
+                                    candidates.append((int(d), int(m), year))
+                if candidates:
+                    add(i, j, candidates, "")
+
+        # With separators: 1/1/91, 2024-12-31, ...
+        for i in range(n - 5):
+            for j in range(i + 5, min(n, i + 10)):
+                m = DATE_SEPARATED.match(password[i : j + 1])
+                if not m:
+                    continue
+                a, sep, b, c = m.group(1), m.group(2), m.group(3), m.group(4)
+                candidates = []
+                for d, mo, y in ((a, b, c), (b, a, c), (c, b, a)):
+                    if len(d) > 2:
+                        continue
+                    year = self._expand_year(int(y), len(y))
+                    if self._valid_date(int(d), int(mo), year):
+                        candidates.append((int(d), int(mo), year))
+                if candidates:
+                    add(i, j, candidates, sep)
+
+        return matches
+
+    def _omnimatch(self, password: str, dicts) -> List[Dict[str, Any]]:
+        matches = []
+        matches.extend(self._dictionary_match(password, dicts))
+        matches.extend(self._reverse_dictionary_match(password, dicts))
+        matches.extend(self._l33t_match(password, dicts))
+        matches.extend(self._spatial_match(password))
+        matches.extend(self._repeat_match(password, dicts))
+        matches.extend(self._sequence_match(password))
+        matches.extend(self._regex_match(password))
+        matches.extend(self._date_match(password))
+        return matches
+
+    # ------------------------------------------------------------------ #
+    # Guess estimation
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _uppercase_variations(token: str) -> int:
+        if token.islower() or not any(c.isalpha() for c in token):
+            return 1
+        if (
+            token.isupper()
+            or (token[0].isupper() and token[1:].islower())
+            or (token[-1].isupper() and token[:-1].islower())
+        ):
+            return 2
+        upper = sum(1 for c in token if c.isupper())
+        lower = sum(1 for c in token if c.islower())
+        return sum(_n_ck(upper + lower, i) for i in range(1, min(upper, lower) + 1))
+
+    @staticmethod
+    def _l33t_variations(match: Dict[str, Any]) -> int:
+        if not match.get("l33t"):
+            return 1
+        variations = 1
+        token = match["token"].lower()
+        for sub, letter in match["sub"].items():
+            subbed = token.count(sub)
+            unsubbed = token.count(letter)
+            if subbed == 0 or unsubbed == 0:
+                variations *= 2
+            else:
+                possibilities = sum(
+                    _n_ck(subbed + unsubbed, i)
+                    for i in range(1, min(subbed, unsubbed) + 1)
+                )
+                variations *= possibilities
+        return variations
+
+    def _estimate_guesses(self, match: Dict[str, Any], password: str) -> float:
+        if "guesses" in match:
+            return match["guesses"]
+
+        length = len(match["token"])
+        min_guesses = 1
+        if length < len(password):
+            min_guesses = (
+                MIN_SUBMATCH_GUESSES_SINGLE_CHAR
+                if length == 1
+                else MIN_SUBMATCH_GUESSES_MULTI_CHAR
+            )
+
+        pattern = match["pattern"]
+        if pattern == "bruteforce":
+            guesses = BRUTEFORCE_CARDINALITY**length
+            guesses = max(guesses, 11 if length == 1 else 51)
+        elif pattern == "dictionary":
+            guesses = match["rank"] * self._uppercase_variations(match["token"])
+            guesses *= self._l33t_variations(match)
+            if match.get("reversed"):
+                guesses *= 2
+        elif pattern == "spatial":
+            starts, degree = GRAPH_STATS[match["graph"]]
+            guesses = 0
+            for i in range(2, length + 1):
+                for j in range(1, min(match["turns"], i - 1) + 1):
+                    guesses += _n_ck(i - 1, j - 1) * starts * degree**j
+            shifted = match["shifted_count"]
+            if shifted:
+                unshifted = length - shifted
+                if unshifted == 0:
+                    guesses *= 2
+                else:
+                    guesses *= sum(
+                        _n_ck(shifted + unshifted, i)
+                        for i in range(1, min(shifted, unshifted) + 1)
+                    )
+        elif pattern == "repeat":
+            guesses = match["base_guesses"] * match["repeat_count"]
+        elif pattern == "sequence":
+            first = match["token"][0]
+            if first in "aAzZ019":
+                base = 4
+            elif first.isdigit():
+                base = 10
+            else:
+                base = 26
+            if not match["ascending"]:
+                base *= 2
+            guesses = base * length
+        elif pattern == "regex":
+            guesses = max(abs(match["year"] - REFERENCE_YEAR), MIN_YEAR_SPACE)
+        elif pattern == "date":
+            guesses = max(abs(match["year"] - REFERENCE_YEAR), MIN_YEAR_SPACE) * 365
+            if match["separator"]:
+                guesses *= 4
+        else:
+            guesses = BRUTEFORCE_CARDINALITY**length
+
+        match["guesses"] = max(guesses, min_guesses)
+        return match["guesses"]
+
+    def _most_guessable(
+        self, password: str, matches: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Pick the match sequence that minimizes total guesses"""
+        n = len(password)
+        if n == 0:
+            return {"guesses": 1, "sequence": []}
+
+        by_end: List[List[Dict[str, Any]]] = [[] for _ in range(n)]
+        for match in matches:
+            by_end[match["j"]].append(match)
+        for bucket in by_end:
+            bucket.sort(key=lambda m: m["i"])
+
+        # optimal_*[k][l]: best sequence of l matches covering password[:k + 1]
+        optimal_m: List[Dict[int, Dict[str, Any]]] = [{} for _ in range(n)]
+        optimal_pi: List[Dict[int, float]] = [{} for _ in range(n)]
+        optimal_g: List[Dict[int, float]] = [{} for _ in range(n)]
+
+        def update(match, length):
+            k = match["j"]
+            pi = self._estimate_guesses(match, password)
+            if length > 1:
+                pi *= optimal_pi[match["i"] - 1][length - 1]
+            g = math.factorial(length) * pi + MIN_GUESSES_BEFORE_GROWING_SEQUENCE ** (
+                length - 1
+            )
+            for other_length, other_g in optimal_g[k].items():
+                if other_length <= length and other_g <= g:
+                    return
+            optimal_g[k][length] = g
+            optimal_m[k][length] = match
+            optimal_pi[k][length] = pi
+
+        def bruteforce(i, j):
+            return {
+                "pattern": "bruteforce",
+                "i": i,
+                "j": j,
+                "token": password[i : j + 1],
+            }
+
+        for k in range(n):
+            for match in by_end[k]:
+                if match["i"] > 0:
+                    for length in list(optimal_m[match["i"] - 1]):
+                        update(match, length + 1)
+                else:
+                    update(match, 1)
+
+            update(bruteforce(0, k), 1)
+            for i in range(1, k + 1):
+                match = bruteforce(i, k)
+                for length, last in list(optimal_m[i - 1].items()):
+                    if last["pattern"] == "bruteforce":
+                        continue
+                    update(match, length + 1)
+
+        # Unwind the best sequence ending at the last character
+        k = n - 1
+        best_length, guesses = min(optimal_g[k].items(), key=lambda item: item[1])
+        sequence = []
+        length = best_length
+        while k >= 0:
+            match = optimal_m[k][length]
+            sequence.insert(0, match)
+            k = match["i"] - 1
+            length -= 1
+
+        return {"guesses": guesses, "sequence": sequence}
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+
+    def estimate(
+        self, password: str, user_inputs: Iterable[str] = ()
+    ) -> Dict[str, Any]:
+        """
+        Estimate password strength
+
+        Args:
+            password: Password to analyze
+            user_inputs: Extra words to penalize (username, email, ...)
+
+        Returns:
+            Dictionary with guesses, entropy (bits), score (0-4),
+            crack time and the matched pattern sequence
+        """
+        analyzed = password[:MAX_ANALYZED_LENGTH]
+        dicts = self._dictionaries(user_inputs)
+        result = self._most_guessable(analyzed, self._omnimatch(analyzed, dicts))
+
+        guesses = result["guesses"]
+        # Characters beyond the analyzed prefix count as bruteforce
+        guesses *= BRUTEFORCE_CARDINALITY ** (len(password) - len(analyzed))
+
+        score = sum(1 for threshold in SCORE_THRESHOLDS if guesses >= threshold)
+        return {
+            "guesses": guesses,
+            "guesses_log10": math.log10(guesses) if guesses > 0 else 0.0,
+            "entropy": math.log2(guesses) if guesses > 0 else 0.0,
+            "score": score,
+            "crack_seconds": guesses / GUESSES_PER_SECOND,
+            "sequence": result["sequence"],
+            "feedback": self._feedback(result["sequence"], score),
+        }
+
+    @staticmethod
+    def _feedback(sequence: List[Dict[str, Any]], score: int) -> List[str]:
+        if score > 2 or not sequence:
+            return []
+
+        warnings = []
+        longest = max(sequence, key=lambda m: len(m["token"]))
+        pattern = longest["pattern"]
+        if pattern == "dictionary":
+            name = longest["dictionary_name"]
+            if name == "passwords":
+                warnings.append("This is similar to a commonly used password")
+            elif name in ("names", "surnames"):
+                warnings.append("Names and surnames by themselves are easy to guess")
+            elif name == "user_inputs":
+                warnings.append("Avoid including your own personal information")
+            else:
+                warnings.append("A word by itself is easy to guess")
+            if longest.get("l33t"):
+                warnings.append(
+                    "Predictable substitutions like '@' instead of 'a' don't help much"
+                )
+            if longest.get("reversed"):
+                warnings.append("Reversed words aren't much harder to guess")
+        elif pattern == "spatial":
+            warnings.append("Keyboard patterns like 'qwerty' are easy to guess")
+        elif pattern == "repeat":
+            warnings.append("Repeats like 'abcabc' are easy to guess")
+        elif pattern == "sequence":
+            warnings.append("Sequences like 'abc' or '6543' are easy to guess")
+        elif pattern in ("regex", "date"):
+            warnings.append("Dates and recent years are easy to guess")
+        return warnings
+
+
+_estimator: Optional[PasswordEstimator] = None
+
+
+def get_estimator() -> PasswordEstimator:
+    """Get the shared estimator (wordlists load on first estimate)"""
+    global _estimator
+    if _estimator is None:
+        _estimator = PasswordEstimator()
+    return _estimator
+
+
+def format_crack_time(seconds: float) -> str:
+    """Format an attack duration in human terms"""
+    minute = 60
+    hour = minute * 60
+    day = hour * 24
+    month = day * 31
+    year = month * 12
+    century = year * 100
+
+    if seconds < 1:
+        return "Instant"
+    for limit, unit, label in [
+        (minute, 1, "second"),
+        (hour, minute, "minute"),
+        (day, hour, "hour"),
+        (month, day, "day"),
+        (year, month, "month"),
+        (century, year, "year"),
+    ]:
+        if seconds < limit:
+            value = int(round(seconds / unit))
+            return f"{value} {label}{'s' if value != 1 else ''}"
+    return "Centuries+"
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Permission Audit Module
+Parallel filesystem walk flagging risky permissions and ownership
+"""
+
+import os
+import stat
+import queue
+import struct
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, List, Any, Iterator, Iterable
+
+try:
+    import pwd
+    import grp
+except ImportError:  # Windows
+    pwd = None
+    grp = None
+
+DEFAULT_EXCLUDES = ("/proc", "/sys", "/dev", "/run")
+
+# Set-ID programs shipped by common distributions
+EXPECTED_SETID = {
+    "sudo",
+    "su",
+    "passwd",
+    "chsh",
+    "chfn",
+    "newgrp",
+    "gpasswd",
+    "mount",
+    "umount",
+    "pkexec",
+    "fusermount",
+    "fusermount3",
+    "ping",
+    "ping6",
+    "ssh-keysign",
+    "dbus-daemon-launch-helper",
+    "polkit-agent-helper-1",
+    "Xorg.wrap",
+    "unix_chkpwd",
+    "pam_extrausers_chkpwd",
+    "crontab",
+    "ssh-agent",
+    "wall",
+    "write",
+    "write.ul",
+    "expiry",
+    "chage",
+    "at",
+    "newuidmap",
+    "newgidmap",
+    "chrome-sandbox",
+    "snap-confine",
+    "mount.nfs",
+    "mount.cifs",
+    "ntfs-3g",
+    "bsd-write",
+    "dotlockfile",
+    "utempter",
+    "plocate",
+    "mlocate",
+    "locate",
+}
+
+CAPABILITY_NAMES = [
+    "chown",
+    "dac_override",
+    "dac_read_search",
+    "fowner",
+    "fsetid",
+    "kill",
+    "setgid",
+    "setuid",
+    "setpcap",
+    "linux_immutable",
+    "net_bind_service",
+    "net_broadcast",
+    "net_admin",
+    "net_raw",
+    "ipc_lock",
+    "ipc_owner",
+    "sys_module",
+    "sys_rawio",
+    "sys_chroot",
+    "sys_ptrace",
+    "sys_pacct",
+    "sys_admin",
+    "sys_boot",
+    "sys_nice",
+    "sys_resource",
+    "sys_time",
+    "sys_tty_config",
+    "mknod",
+    "lease",
+    "audit_write",
+    "audit_control",
+    "setfcap",
+    "mac_override",
+    "mac_admin",
+    "syslog",
+    "wake_alarm",
+    "block_suspend",
+    "audit_read",
+    "perfmon",
+    "bpf",
+    "checkpoint_restore",
+]
+
+DANGEROUS_CAPABILITIES = {
+    "dac_override",
+    "dac_read_search",
+    "fowner",
+    "setuid",
+    "setgid",
+    "setpcap",
+    "sys_admin",
+    "sys_module",
+    "sys_ptrace",
+    "sys_rawio",
+    "setfcap",
+    "bpf",
+    "chown",
+}
+
+# File capabilities granted by common packages
+EXPECTED_CAPABILITIES = {
+    "ping": {"net_raw"},
+    "arping": {"net_raw"},
+    "clockdiff": {"net_raw"},
+    "traceroute6.iputils": {"net_raw"},
+    "mtr-packet": {"net_raw"},
+    "dumpcap": {"net_admin", "net_raw"},
+    "gnome-keyring-daemon": {"ipc_lock"},
+    "newuidmap": {"setuid"},
+    "newgidmap": {"setgid"},
+    "gst-ptp-helper": {"net_bind_service", "net_admin"},
+    "systemd-detect-virt": {"dac_override", "sys_ptrace"},
+}
+
+# Expected programs only count as such in package-managed locations
+TRUSTED_BIN_DIRS = {"/bin", "/sbin", "/usr/bin", "/usr/sbin"}
+TRUSTED_PREFIXES = (
+    "/usr/lib/",
+    "/usr/lib32/",
+    "/usr/lib64/",
+    "/usr/libexec/",
+    "/lib/",
+    "/lib32/",
+    "/lib64/",
+)
+
+
+def _is_expected(path: str, st: os.stat_result, names) -> bool:
+    """
+    Whether a privileged file is a known program in its usual place
+
+    The name alone proves nothing (anyone can plant /tmp/x/sudo), so the
+    file must also be root-owned, not world-writable, and live directly in
+    a system bin directory or below a system library directory.
+    """
+    if os.path.basename(path) not in names:
+        return False
+    if st.st_uid != 0 or st.st_mode & stat.S_IWOTH:
+        return False
+    return os.path.dirname(path) in TRUSTED_BIN_DIRS or path.startswith(
+        TRUSTED_PREFIXES
+    )
+
+
+CAPABILITY_XATTR = "security.capability"
+CAP_HEADER = struct.Struct("<I")
+CAP_WORD = struct.Struct("<II")
+
+
+def is_supported() -> bool:
+    """The audit relies on POSIX ownership and permission bits"""
+    return pwd is not None
+
+
+def decode_capabilities(data: bytes) -> List[str]:
+    """Decode a security.capability xattr into permitted capability names"""
+    if len(data) < CAP_HEADER.size + CAP_WORD.size:
+        return []
+    permitted, _ = CAP_WORD.unpack_from(data, CAP_HEADER.size)
+    if len(data) >= CAP_HEADER.size + 2 * CAP_WORD.size:
+        high, _ = CAP_WORD.unpack_from(data, CAP_HEADER.size + CAP_WORD.size)
+        permitted |= high << 32
+    return [
+        CAPABILITY_NAMES[bit] if bit < len(CAPABILITY_NAMES) else str(bit)
+        for bit in range(64)
+        if permitted >> bit & 1
+    ]
+
+
+def _finding(check: str, severity: str, path: str, detail: str) -> Dict[str, str]:
+    return {"check": check, "severity": severity, "path": path, "detail": detail}
+
+
+class PermissionAuditor:
+    """
+    Work-stealing parallel permission auditor
+
+    Each worker thread owns a deque of directories: it pushes subdirectories
+    and pops from the same end (depth-first, cache-friendly), while idle
+    workers steal from the opposite end of other workers' deques. All checks
+    use the lstat result scandir already fetched, so every entry costs one
+    stat call (plus a getxattr for executables when capabilities are checked).
+    """
+
+    def __init__(
+        self,
+        root: str,
+        workers: Optional[int] = None,
+        one_filesystem: bool = True,
+        excludes: Iterable[str] = DEFAULT_EXCLUDES,
+        check_capabilities: bool = True,
+    ):
+        self.root = os.path.abspath(root)
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        self.one_filesystem = one_filesystem
+        self.excludes = {os.path.abspath(p) for p in excludes} - {self.root}
+        self.check_capabilities = check_capabilities and hasattr(os, "getxattr")
+        self.stats: Dict[str, Any] = {
+            "dirs": 0,
+            "files": 0,
+            "errors": 0,
+            "findings": 0,
+            "seconds": 0.0,
+        }
+        self._uids = {p.pw_uid for p in pwd.getpwall()} if pwd else set()
+        self._gids = {g.gr_gid for g in grp.getgrall()} if grp else set()
+        self._deques: List[deque] = []
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._results: "queue.Queue" = queue.Queue()
+        self._stop = threading.Event()
+
+    def run(self) -> Iterator[Dict[str, str]]:
+        """Walk the tree, yielding findings as workers produce them"""
+        start = time.perf_counter()
+        root_st = os.lstat(self.root)
+        self._root_dev = root_st.st_dev
+        self._deques = [deque() for _ in range(self.workers)]
+        self._pending = 1
+        self._deques[0].append(self.root)
+        self._check_entry(self.root, root_st, is_dir=True, emit=self._results.put)
+
+        threads = [
+            threading.Thread(target=self._worker, args=(i,), daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        finished = 0
+        try:
+            while finished < len(threads):
+                item = self._results.get()
+                if item is None:
+                    finished += 1
+                    continue
+                self.stats["findings"] += 1
+                yield item
+        finally:
+            self._stop.set()
+            with self._idle:
+                self._idle.notify_all()
+            for thread in threads:
+                thread.join()
+            self.stats["seconds"] = time.perf_counter() - start
+
+    def _next_directory(self, index: int) -> Optional[str]:
+        own = self._deques[index]
+        try:
+            return own.pop()
+        except IndexError:
+            pass
+        count = len(self._deques)
+        for offset in range(1, count):
+            try:
+                return self._deques[(index + offset) % count].popleft()
+            except IndexError:
+                continue
+        return None
+
+    def _worker(self, index: int):
+        own = self._deques[index]
+        emit = self._results.put
+        dirs = files = errors = 0
+        try:
+            while not self._stop.is_set():
+                directory = self._next_directory(index)
+                if directory is None:
+                    with self._idle:
+                        if self._pending == 0:
+                            self._idle.notify_all()
+                            return
+                        self._idle.wait(0.005)
+                    continue
+
+                subdirs, scanned, failed = self._scan_directory(directory, emit)
+                dirs += 1
+                files += scanned
+                errors += failed
+                # Count new work before publishing it: a thief could finish a
+                # subdir first and see _pending drop to 0 while work remains
+                if subdirs:
+                    with self._idle:
+                        self._pending += len(subdirs)
+                    own.extend(subdirs)
+                with self._idle:
+                    self._pending -= 1
+                    if subdirs or self._pending == 0:
+                        self._idle.notify_all()
+        finally:
+            with self._lock:
+                self.stats["dirs"] += dirs
+                self.stats["files"] += files
+                self.stats["errors"] += errors
+            emit(None)
+
+    def _scan_directory(self, directory: str, emit) -> tuple:
+        subdirs = []
+        scanned = 0
+        failed = 0
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_symlink():
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                        if entry.is_dir(follow_symlinks=False):
+                            path = entry.path
+                            if path in self.excludes:
+                                continue
+                            if self.one_filesystem and st.st_dev != self._root_dev:
+                                continue
+                            subdirs.append(path)
+                            self._check_entry(path, st, True, emit)
+                        else:
+                            scanned += 1
+                            self._check_entry(entry.path, st, False, emit)
+                    except OSError:
+                        failed += 1
+        except OSError:
+            failed += 1
+        return subdirs, scanned, failed
+
+    def _check_entry(self, path: str, st: os.stat_result, is_dir: bool, emit):
+        mode = st.st_mode
+
+        if st.st_uid not in self._uids or st.st_gid not in self._gids:
+            owner = "user" if st.st_uid not in self._uids else "group"
+            emit(
+                _finding(
+                    "no_owner",
+                    "warning",
+                    path,
+                    f"No {owner} for uid {st.st_uid}/gid {st.st_gid}",
+                )
+            )
+
+        if is_dir:
+            if mode & stat.S_IWOTH and not mode & stat.S_ISVTX:
+                emit(
+                    _finding(
+                        "world_writable",
+                        "high",
+                        path,
+                        "World-writable directory without sticky bit",
+                    )
+                )
+            return
+
+        if not stat.S_ISREG(mode):
+            return
+
+        if mode & stat.S_IWOTH:
+            emit(_finding("world_writable", "high", path, "World-writable file"))
+
+        if mode & (stat.S_ISUID | stat.S_ISGID):
+            kind = " and ".join(
+                name
+                for bit, name in ((stat.S_ISUID, "SUID"), (stat.S_ISGID, "SGID"))
+                if mode & bit
+            )
+            expected = _is_expected(path, st, EXPECTED_SETID)
+            emit(
+                _finding(
+                    "setid",
+                    "info" if expected else "high",
+                    path,
+                    f"{kind} ({stat.filemode(mode)}, uid {st.st_uid})",
+                )
+            )
+
+        if self.check_capabilities and mode & 0o111:
+            try:
+                data = os.getxattr(path, CAPABILITY_XATTR, follow_symlinks=False)
+            except OSError:
+                return
+            caps = set(decode_capabilities(data))
+            if not caps:
+                return
+            expected = EXPECTED_CAPABILITIES.get(os.path.basename(path))
+            if (
+                expected is not None
+                and _is_expected(path, st, EXPECTED_CAPABILITIES)
+                and caps <= expected
+            ):
+                severity = "info"
+            elif caps & DANGEROUS_CAPABILITIES:
+                severity = "high"
+            else:
+                severity = "warning"
+            emit(
+                _finding(
+                    "capabilities",
+                    severity,
+                    path,
+                    ",".join(f"cap_{c}" for c in sorted(caps)),
+                )
+            )
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Processes Module
+Two-sample process resource accounting with cached static attributes
+"""
+
+import os
+import sys
+import time
+from typing import Optional, Dict, List, Tuple, NamedTuple, Iterator
+
+import psutil
+
+SORT_KEYS = {
+    "cpu": "cpu_percent",
+    "rss": "rss",
+    "io": "io_rate",
+    "threads": "num_threads",
+    "fds": "num_fds",
+}
+
+
+PROC = "/proc"
+
+try:
+    CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+    PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    CLOCK_TICKS = 100
+    PAGE_SIZE = 4096
+
+# (create_time, ppid, cpu_seconds, rss, read_bytes, write_bytes, threads, fds)
+Counters = Tuple[float, int, float, int, int, int, int, int]
+
+
+class ProcessStat(NamedTuple):
+    """Numeric snapshot of one process over the sampling interval"""
+
+    pid: int
+    ppid: int
+    name: str
+    username: str
+    cmdline: str
+    exe: str
+    cpu_percent: float
+    rss: int
+    memory_percent: float
+    read_rate: float
+    write_rate: float
+    num_threads: int
+    num_fds: int
+    io_visible: bool = True
+
+    @property
+    def io_rate(self) -> float:
+        return self.read_rate + self.write_rate
+
+
+class StaticInfo(NamedTuple):
+    """Attributes that never change for the lifetime of a process"""
+
+    create_time: float
+    name: str
+    username: str
+    cmdline: str
+    exe: str
+
+
+def _use_procfs() -> bool:
+    return sys.platform.startswith("linux") and os.path.exists(f"{PROC}/self/stat")
+
+
+def _read(path: str) -> bytes:
+    """
+    Whole small /proc file with one read
+
+    Raw os.open/os.read instead of open(): a buffered file object adds an
+    fstat, an ioctl and an lseek per file, which is most of the syscalls a
+    sample makes.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 4096)
+    finally:
+        os.close(fd)
+
+
+def _count_fds(pid: int) -> int:
+    """Open descriptors of `pid`, -1 when /proc permissions hide them"""
+    try:
+        return len(os.listdir(f"{PROC}/{pid}/fd"))
+    except PermissionError:
+        return -1
+
+
+def _read_procfs(pid: int, boot_time: float, io: bool, fds: bool) -> Counters:
+    """
+    Dynamic counters straight from /proc/<pid>/{stat,io,fd}
+
+    One stat read covers parent, CPU time, start time, threads and RSS,
+    instead of the several stat/status/statm reads psutil makes. I/O and fd
+    counts are -1 when /proc permissions hide them or they weren't asked
+    for.
+    """
+    data = _read(f"{PROC}/{pid}/stat")
+    # Fields after "(comm)" start at field 3 (state); comm may contain spaces
+    fields = data[data.rfind(b")") + 2 :].split()
+    create_time = boot_time + int(fields[19]) / CLOCK_TICKS
+    cpu = (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+    read_bytes = write_bytes = -1
+    if io:
+        try:
+            # rchar, wchar, syscr, syscw, read_bytes, write_bytes, ...
+            counters = _read(f"{PROC}/{pid}/io").split()
+            read_bytes, write_bytes = int(counters[9]), int(counters[11])
+        except PermissionError:
+            pass
+
+    return (
+        create_time,
+        int(fields[1]),
+        cpu,
+        int(fields[21]) * PAGE_SIZE,
+        read_bytes,
+        write_bytes,
+        int(fields[17]),
+        _count_fds(pid) if fds else -1,
+    )
+
+
+def _psutil_fds(proc: psutil.Process) -> int:
+    try:
+        return proc.num_fds() if os.name == "posix" else proc.num_handles()
+    except psutil.AccessDenied:
+        return -1
+
+
+def _read_psutil(proc: psutil.Process, io: bool, fds: bool) -> Counters:
+    """Portable counterpart of _read_procfs, batched with oneshot()"""
+    with proc.oneshot():
+        cpu = proc.cpu_times()
+        read_bytes = write_bytes = -1
+        if io:
+            try:
+                counters = proc.io_counters()
+                read_bytes, write_bytes = counters.read_bytes, counters.write_bytes
+            except (psutil.AccessDenied, AttributeError, NotImplementedError):
+                pass
+        return (
+            proc.create_time(),
+            proc.ppid(),
+            cpu.user + cpu.system,
+            proc.memory_info().rss,
+            read_bytes,
+            write_bytes,
+            proc.num_threads(),
+            _psutil_fds(proc) if fds else -1,
+        )
+
+
+def _read_static(pid: int, create_time: float) -> Optional[StaticInfo]:
+    """Name, owner, command line and executable of a newly seen process"""
+    try:
+        proc = psutil.Process(pid)
+        with proc.oneshot():
+            name = proc.name()
+            try:
+                username = proc.username()
+            except (psutil.AccessDenied, KeyError):
+                username = ""
+            try:
+                cmdline = " ".join(proc.cmdline())
+            except psutil.AccessDenied:
+                cmdline = ""
+            try:
+                exe = proc.exe()
+            except psutil.AccessDenied:
+                exe = ""
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+    return StaticInfo(create_time, name, username, cmdline, exe)
+
+
+class ProcessSampler:
+    """
+    CPU and I/O accounting from two counter samples
+
+    psutil's cpu_percent() with no interval returns 0.0 the first time it
+    sees a process, so a single pass can't rank by CPU. The sampler records
+    CPU time and I/O counters on a priming pass, then computes per-second
+    rates from the deltas on the next one.
+
+    Static attributes (name, user, command line, executable) are read once
+    per process and cached by PID and create time, so refreshes only re-read
+    the dynamic counters. Entries for processes that have exited are
+    dropped on the next sample, and a reused PID is never matched to the
+    process that held it before.
+
+    Per process, a refresh costs one read of /proc/<pid>/stat, one of
+    /proc/<pid>/io unless `io` is off, and a listing of /proc/<pid>/fd only
+    when sample() is asked for fd counts; fill_fds() counts them for just
+    the rows being shown instead. That is the floor for a /proc reader:
+    about 20 ms per 1,000 processes with I/O and 15 ms without on Linux,
+    half of it in the file reads themselves, so a 5,000-process host takes
+    75-100 ms per refresh. The psutil fallback on other platforms is several
+    times slower.
+    """
+
+    def __init__(self, io: bool = True):
+        self.io = io
+        self._previous: Dict[int, Counters] = {}
+        self._static: Dict[int, StaticInfo] = {}
+        self._timestamp: Optional[float] = None
+        self._total_memory = psutil.virtual_memory().total
+        self._boot_time = psutil.boot_time()
+        self._procfs = _use_procfs()
+
+    def prime(self):
+        """Record baseline counters without producing results"""
+        self.sample()
+
+    def _iter_counters(self, fds: bool) -> Iterator[Tuple[int, Counters]]:
+        io = self.io
+        if self._procfs:
+            boot_time = self._boot_time
+            for name in os.listdir(PROC):
+                if not name.isdigit():
+                    continue
+                try:
+                    yield int(name), _read_procfs(int(name), boot_time, io, fds)
+                except (OSError, ValueError, IndexError):
+                    continue  # exited while being read
+        else:
+            for proc in psutil.process_iter():
+                try:
+                    yield proc.pid, _read_psutil(proc, io, fds)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+
+    def sample(self, fds: bool = False) -> List[ProcessStat]:
+        """
+        Read every process and compute rates since the previous sample
+
+        fd counts are -1 unless `fds` is set, which is only worth it when
+        ranking by them.
+        """
+        now = time.monotonic()
+        wall = time.time()
+        elapsed = now - self._timestamp if self._timestamp else 0.0
+        previous = self._previous
+        cache = self._static
+        current: Dict[int, Counters] = {}
+        static: Dict[int, StaticInfo] = {}
+        stats: List[ProcessStat] = []
+
+        for pid, counters in self._iter_counters(fds):
+            created = counters[0]
+            info = cache.get(pid)
+            if info is None or info.create_time != created:
+                info = _read_static(pid, created)
+                if info is None:
+                    continue
+            static[pid] = info
+            current[pid] = counters
+            if elapsed <= 0:
+                continue
+
+            _, ppid, cpu, rss, read_bytes, write_bytes, threads, fds = counters
+            before = previous.get(pid)
+            window = elapsed
+            if before is None or before[0] != created:
+                # Started during the interval: everything it used is new
+                before = (created, ppid, 0.0, 0, 0, 0, 0, 0)
+                window = min(elapsed, max(wall - created, 0.01))
+
+            cpu_percent = max(cpu - before[2], 0.0) / window * 100
+            read_rate = (
+                max(read_bytes - before[4], 0) / window
+                if read_bytes >= 0 and before[4] >= 0
+                else 0.0
+            )
+            write_rate = (
+                max(write_bytes - before[5], 0) / window
+                if write_bytes >= 0 and before[5] >= 0
+                else 0.0
+            )
+            stats.append(
+                ProcessStat(
+                    pid,
+                    ppid,
+                    info.name,
+                    info.username,
+                    info.cmdline,
+                    info.exe,
+                    cpu_percent,
+                    rss,
+                    rss / self._total_memory * 100 if self._total_memory else 0.0,
+                    read_rate,
+                    write_rate,
+                    threads,
+                    fds,
+                    read_bytes >= 0,
+                )
+            )
+
+        # Rebuilding both maps from live PIDs evicts exited processes
+        self._previous = current
+        self._static = static
+        self._timestamp = now
+        return stats
+
+    def measure(self, interval: float = 1.0, fds: bool = False) -> List[ProcessStat]:
+        """Prime, wait one interval and return the measured sample"""
+        self.prime()
+        time.sleep(interval)
+        return self.sample(fds)
+
+    def fill_fds(self, stats: List[ProcessStat]) -> List[ProcessStat]:
+        """`stats` with fd counts read now, for the few rows on screen"""
+        filled = []
+        for s in stats:
+            try:
+                if self._procfs:
+                    fds = _count_fds(s.pid)
+                else:
+                    fds = _psutil_fds(psutil.Process(s.pid))
+            except (OSError, psutil.NoSuchProcess):
+                fds = -1  # exited since the sample
+            filled.append(s._replace(num_fds=fds))
+        return filled
+
+
+def connection_counts() -> Dict[int, int]:
+    """
+    Open inet sockets per PID from one system-wide table read
+
+    Sockets whose owner can't be resolved (other users' processes without
+    root) are not counted; an empty dict means the table itself was denied.
+    """
+    counts: Dict[int, int] = {}
+    try:
+        connections = psutil.net_connections(kind="inet")
+    except (psutil.AccessDenied, OSError):
+        return counts
+    for conn in connections:
+        if conn.pid is not None:
+            counts[conn.pid] = counts.get(conn.pid, 0) + 1
+    return counts
+
+
+def top_processes(
+    stats: List[ProcessStat], sort_key: str = "cpu", limit: Optional[int] = None
+) -> List[ProcessStat]:
+    """Sort numerically by one of SORT_KEYS, highest first"""
+    attribute = SORT_KEYS[sort_key]
+    ordered = sorted(stats, key=lambda s: getattr(s, attribute), reverse=True)
+    return ordered[:limit] if limit else ordered
+
+
+class ProcessTree(NamedTuple):
+    """Parent/child graph with per-subtree resource totals"""
+
+    stats: Dict[int, ProcessStat]
+    children: Dict[int, List[int]]
+    roots: List[int]
+    # pid -> [rss, cpu_percent, threads, processes] for the whole subtree
+    totals: Dict[int, List[float]]
+
+
+def build_process_tree(stats: List[ProcessStat]) -> ProcessTree:
+    """
+    Build the process hierarchy and roll usage up to every ancestor
+
+    One pass links each process to its parent, a breadth-first walk from
+    the roots gives an order where parents precede children, and walking
+    that order backwards adds each subtree into its parent. Everything is
+    linear in the number of processes and needs no recursion, so very deep
+    or very wide trees are fine.
+    """
+    by_pid = {s.pid: s for s in stats}
+    children: Dict[int, List[int]] = {}
+    roots: List[int] = []
+    for s in stats:
+        if s.ppid in by_pid and s.ppid != s.pid:
+            children.setdefault(s.ppid, []).append(s.pid)
+        else:
+            roots.append(s.pid)
+
+    order = list(roots)
+    for pid in order:  # the list grows while iterating: a BFS queue
+        order.extend(children.get(pid, ()))
+
+    totals = {s.pid: [s.rss, s.cpu_percent, s.num_threads, 1] for s in stats}
+    for pid in reversed(order):
+        ppid = by_pid[pid].ppid
+        if ppid in totals and ppid != pid:
+            parent, own = totals[ppid], totals[pid]
+            parent[0] += own[0]
+            parent[1] += own[1]
+            parent[2] += own[2]
+            parent[3] += own[3]
+
+    return ProcessTree(by_pid, children, roots, totals)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Reputation Module
+Known-bad file hash lookup over a memory-mapped sorted SHA256 set
+"""
+
+import os
+import re
+from typing import Optional, Callable, Iterator, Dict
+
+from .utils import get_config
+from .digestset import (
+    DigestSet,
+    SharedDigestSet,
+    write_digest_set,
+    DEFAULT_BATCH_RECORDS,
+)
+
+# Records are raw 32-byte SHA256 digests in a digest set file (see digestset)
+
+MAGIC = b"PYTMAL1\x00"
+RECORD_SIZE = 32
+
+PROGRESS_INTERVAL = 1_000_000  # input lines between progress callbacks
+
+# First standalone SHA256 on a line: covers plain lists, sha256sum output
+# and quoted CSV exports from public malware feeds
+SHA256_TOKEN = re.compile(rb"(?<![0-9a-fA-F])[0-9a-fA-F]{64}(?![0-9a-fA-F])")
+
+
+class KnownBadHashStore(DigestSet):
+    """Read-only, memory-mapped set of known-bad file SHA256 digests"""
+
+    def __init__(self, path: str):
+        try:
+            super().__init__(path, MAGIC, RECORD_SIZE)
+        except ValueError as e:
+            raise ValueError(f"Not a valid PyTools hash database: {e}")
+
+    def contains_hash(self, sha256_hex: str) -> bool:
+        """Check a hex SHA256 string"""
+        return self.contains_digest(bytes.fromhex(sha256_hex))
+
+
+def _read_digests(
+    source_path: str,
+    stats: Dict[str, int],
+    progress: Optional[Callable[[int], None]],
+) -> Iterator[bytes]:
+    with open(source_path, "rb", buffering=1024 * 1024) as f:
+        for line in f:
+            stats["lines"] += 1
+            match = SHA256_TOKEN.search(line)
+            if match is None:
+                stats["skipped"] += 1
+                continue
+            yield bytes.fromhex(match.group().decode("ascii"))
+            if progress and stats["lines"] % PROGRESS_INTERVAL == 0:
+                progress(stats["lines"])
+
+
+def build_hash_db(
+    source_path: str,
+    output_path: str,
+    batch_records: int = DEFAULT_BATCH_RECORDS,
+    progress: Optional[Callable[[int], None]] = None,
+) -> dict:
+    """
+    Build a known-bad hash database from a SHA256 list
+
+    Args:
+        source_path: Text file with one SHA256 per line (extra columns are
+            ignored, so sha256sum output and CSV feeds work as-is)
+        output_path: Database file to create
+        batch_records: Digests held in memory per sorted run
+        progress: Callback receiving the number of input lines read so far
+
+    Returns:
+        Dictionary with lines read, records written and lines skipped
+    """
+    stats = {"lines": 0, "skipped": 0}
+    written = write_digest_set(
+        _read_digests(source_path, stats, progress),
+        output_path,
+        MAGIC,
+        RECORD_SIZE,
+        batch_records,
+    )
+
+    if progress:
+        progress(stats["lines"])
+
+    return {"lines": stats["lines"], "records": written, "skipped": stats["skipped"]}
+
+
+def get_hash_db_path() -> str:
+    """Configured hash database path (defaults to the config directory)"""
+    config = get_config()
+    path = config.get("security.malware_hashes", "")
+    if path:
+        return os.path.expanduser(path)
+    return os.path.join(config.config_dir, "malware_hashes.db")
+
+
+_shared = SharedDigestSet(KnownBadHashStore, get_hash_db_path)
+
+
+def get_hash_store() -> Optional[KnownBadHashStore]:
+    """Get the shared known-bad hash store, or None if none is installed"""
+    return _shared.get()
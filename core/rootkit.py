@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Rootkit Module
+In-process hidden process, deleted executable and preload heuristics
+"""
+
+import os
+import time
+from typing import Optional, Dict, List, Any, Set
+
+import psutil
+
+PROC = "/proc"
+SUSPICIOUS_DIRS = ("/tmp/", "/var/tmp/", "/dev/shm/", "/run/shm/")
+DELETED_SUFFIX = " (deleted)"
+
+
+def _finding(check: str, severity: str, target: str, detail: str) -> Dict[str, str]:
+    return {"check": check, "severity": severity, "target": target, "detail": detail}
+
+
+def _read_int(path: str, default: int) -> int:
+    try:
+        with open(path, "r") as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return default
+
+
+def is_supported() -> bool:
+    """The heuristics need a Linux-style /proc"""
+    return os.path.isdir(os.path.join(PROC, "self", "task"))
+
+
+def list_proc_pids() -> Set[int]:
+    """PIDs visible through /proc directory enumeration"""
+    return {int(name) for name in os.listdir(PROC) if name.isdigit()}
+
+
+def list_thread_ids(pids: Set[int]) -> Set[int]:
+    """Thread IDs of the given processes (they answer kill(0) but are not listed)"""
+    tids = set()
+    for pid in pids:
+        try:
+            tids.update(int(t) for t in os.listdir(f"{PROC}/{pid}/task"))
+        except OSError:
+            continue
+    return tids
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+
+
+def _tgid(pid: int) -> Optional[int]:
+    try:
+        with open(f"{PROC}/{pid}/status", "rb") as f:
+            for line in f:
+                if line.startswith(b"Tgid:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def probe_limit(visible: Set[int], full: bool = False) -> int:
+    """
+    Highest PID worth probing with kill(0)
+
+    Until the PID counter wraps, no process can have a PID above the last
+    one allocated, so probing stops there. After a wrap (a visible PID is
+    above ns_last_pid) or when full is set, the whole pid_max range is used.
+    """
+    pid_max = _read_int(f"{PROC}/sys/kernel/pid_max", 32768)
+    if full:
+        return pid_max
+    last_pid = _read_int(f"{PROC}/sys/kernel/ns_last_pid", pid_max)
+    highest = max(visible, default=0)
+    if highest > last_pid:
+        return pid_max
+    return max(last_pid, highest)
+
+
+def find_hidden_processes(full: bool = False) -> Dict[str, Any]:
+    """
+    Cross-reference /proc, psutil and kill(0) to find hidden PIDs
+
+    A rootkit hiding a process usually filters directory listings (getdents)
+    but cannot stop the kernel answering signals for the PID. Candidates
+    that answer kill(0) but are not listed are re-checked against a fresh
+    listing and their Tgid, so threads and short-lived processes started
+    during the scan are not reported.
+
+    Returns:
+        Dictionary with findings, counts, probed range and elapsed seconds
+    """
+    start = time.perf_counter()
+    findings = []
+
+    listed = list_proc_pids()
+    ps_pids = set(psutil.pids())
+    limit = probe_limit(listed | ps_pids, full)
+    known = listed | ps_pids | list_thread_ids(listed)
+
+    kill = os.kill
+    candidates = []
+    for pid in range(1, limit + 1):
+        if pid in known:
+            continue
+        try:
+            kill(pid, 0)
+        except ProcessLookupError:
+            continue
+        except PermissionError:
+            pass
+        except OSError:
+            continue
+        candidates.append(pid)
+
+    if candidates:
+        relisted = list_proc_pids()
+        for pid in candidates:
+            if pid in relisted or not _alive(pid):
+                continue
+            tgid = _tgid(pid)
+            if tgid is not None and tgid != pid:
+                continue  # a thread of a process started during the scan
+            detail = (
+                "Answers kill(0) but is missing from /proc listing"
+                if tgid is None
+                else "Has /proc entry but is filtered from directory listing"
+            )
+            findings.append(_finding("hidden_process", "high", str(pid), detail))
+
+    mismatched = listed ^ ps_pids
+    if mismatched:
+        relisted = list_proc_pids()
+        mismatched &= relisted ^ set(psutil.pids())
+    for pid in sorted(mismatched):
+        if _alive(pid):
+            findings.append(
+                _finding(
+                    "hidden_process",
+                    "warning",
+                    str(pid),
+                    "Process listings disagree between /proc and psutil",
+                )
+            )
+
+    return {
+        "findings": findings,
+        "processes": len(listed),
+        "probed": limit,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def _classify_preload(path: str) -> str:
+    """Severity for a preloaded library path"""
+    name = os.path.basename(path)
+    if (
+        not path.startswith("/")
+        or path.startswith(SUSPICIOUS_DIRS)
+        or name.startswith(".")
+        or not os.path.exists(path)
+    ):
+        return "high"
+    return "warning"
+
+
+def check_system_preload() -> List[Dict[str, str]]:
+    """Flag entries in /etc/ld.so.preload (loaded into every process)"""
+    findings = []
+    try:
+        with open("/etc/ld.so.preload", "r", errors="replace") as f:
+            entries = f.read().split()
+    except OSError:
+        return findings
+    for entry in entries:
+        if entry.startswith("#"):
+            continue
+        findings.append(
+            _finding(
+                "ld_preload",
+                _classify_preload(entry),
+                entry,
+                "Listed in /etc/ld.so.preload",
+            )
+        )
+    return findings
+
+
+def check_processes(pids: Set[int]) -> Dict[str, Any]:
+    """
+    Inspect each visible process for deleted executables and LD_PRELOAD
+
+    Processes that cannot be inspected (other users without root) are
+    counted but not reported.
+    """
+    findings = []
+    inaccessible = 0
+    for pid in sorted(pids):
+        base = f"{PROC}/{pid}"
+        try:
+            exe = os.readlink(f"{base}/exe")
+        except PermissionError:
+            inaccessible += 1
+            exe = None
+        except OSError:
+            exe = None  # kernel threads have no executable
+
+        if exe and exe.endswith(DELETED_SUFFIX):
+            path = exe[: -len(DELETED_SUFFIX)]
+            fileless = path.startswith(("/memfd:",) + SUSPICIOUS_DIRS)
+            findings.append(
+                _finding(
+                    "deleted_exe",
+                    "high" if fileless else "warning",
+                    f"{pid} ({path})",
+                    (
+                        "Running from a fileless/temporary location"
+                        if fileless
+                        else "Executable deleted or replaced since start"
+                    ),
+                )
+            )
+
+        try:
+            with open(f"{base}/environ", "rb") as f:
+                environ = f.read()
+        except OSError:
+            continue
+        if b"LD_PRELOAD=" not in environ:
+            continue
+        for var in environ.split(b"\0"):
+            if not var.startswith(b"LD_PRELOAD="):
+                continue
+            value = var[len(b"LD_PRELOAD=") :].decode("utf-8", errors="replace")
+            for lib in value.replace(":", " ").split():
+                findings.append(
+                    _finding(
+                        "ld_preload",
+                        _classify_preload(lib),
+                        f"{pid} ({lib})",
+                        "LD_PRELOAD set in process environment",
+                    )
+                )
+
+    return {"findings": findings, "inaccessible": inaccessible}
+
+
+def run_checks(full: bool = False) -> Dict[str, Any]:
+    """
+    Run all heuristics
+
+    Returns:
+        Dictionary with combined findings, process counts, probed PID range,
+        uninspectable process count and elapsed seconds
+    """
+    start = time.perf_counter()
+    hidden = find_hidden_processes(full)
+    processes = check_processes(list_proc_pids())
+    findings = hidden["findings"] + check_system_preload() + processes["findings"]
+    return {
+        "findings": findings,
+        "processes": hidden["processes"],
+        "probed": hidden["probed"],
+        "inaccessible": processes["inaccessible"],
+        "seconds": time.perf_counter() - start,
+    }
@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core Signatures Module
+Multi-pattern byte signature scanning with an Aho-Corasick automaton
+"""
+
+import os
+import re
+import time
+import pickle
+import hashlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, List, Any, Callable, Iterable, Iterator, Tuple
+
+from .base import pipelined_map
+from .utils import get_config, get_cache
+
+SIGNATURES_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data",
+    "signatures.txt",
+)
+
+CHUNK_SIZE = 1024 * 1024
+DEFAULT_MAX_FILE_SIZE = 100 * 1024 * 1024
+FILES_PER_TASK = 16
+
+HEX_PATTERN = re.compile(r"^(?:[0-9a-fA-F]{2}|\?\?)+$")
+
+
+class Signature:
+    """
+    A named byte pattern, optionally containing single-byte wildcards
+
+    The pattern is stored as literal fragments with their offsets. The
+    longest fragment is the anchor fed to the automaton; the remaining
+    fragments are verified around each anchor hit.
+    """
+
+    def __init__(self, name: str, fragments: List[Tuple[int, bytes]], length: int):
+        self.name = name
+        self.fragments = fragments
+        self.length = length
+        self.anchor_offset, self.anchor = max(fragments, key=lambda f: len(f[1]))
+
+
+def parse_pattern(text: str) -> Tuple[List[Tuple[int, bytes]], int]:
+    """
+    Parse a rule pattern into (offset, literal) fragments
+
+    Patterns are either a quoted string with Python-style escapes
+    ("eval(base64_decode(") or hex bytes with optional spaces and ??
+    wildcards (4D 5A ?? ?? 50 45).
+    """
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] == '"':
+        data = text[1:-1].encode("latin-1").decode("unicode_escape").encode("latin-1")
+        if not data:
+            raise ValueError("Empty pattern")
+        return [(0, data)], len(data)
+
+    compact = text.replace(" ", "")
+    if not compact or not HEX_PATTERN.match(compact):
+        raise ValueError(f"Invalid hex pattern: {text}")
+
+    fragments = []
+    current = bytearray()
+    start = 0
+    tokens = [compact[i : i + 2] for i in range(0, len(compact), 2)]
+    for i, token in enumerate(tokens):
+        if token == "??":
+            if current:
+                fragments.append((start, bytes(current)))
+                current = bytearray()
+            start = i + 1
+        else:
+            current.append(int(token, 16))
+    if current:
+        fragments.append((start, bytes(current)))
+
+    if not fragments or max(len(f[1]) for f in fragments) < 2:
+        raise ValueError(f"Pattern needs at least two literal bytes: {text}")
+    return fragments, len(tokens)
+
+
+def load_rules(path: str) -> List[Signature]:
+    """
+    Load signatures from a rules file
+
+    Each non-empty, non-comment line is "name: pattern". Invalid lines
+    raise ValueError with the line number.
+    """
+    signatures = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            name, sep, pattern = line.partition(":")
+            if not sep or not name.strip():
+                raise ValueError(f"{path}:{line_no}: expected 'name: pattern'")
+            try:
+                fragments, length = parse_pattern(pattern)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_no}: {e}")
+            signatures.append(Signature(name.strip(), fragments, length))
+    return signatures
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over signature anchors
+
+    Transitions are compiled into a full DFA (one 256-entry list per state),
+    so scanning is one table lookup per byte. While the automaton sits at
+    the root no match is in progress, so a compiled alternation of all
+    anchors (searched in C by the regex engine) skips straight to the next
+    position where an anchor starts.
+    """
+
+    def __init__(self, signatures: List[Signature]):
+        self.signatures = signatures
+        self.max_length = max((s.length for s in signatures), default=0)
+        self._build()
+
+    def _build(self):
+        anchors: Dict[bytes, int] = {}
+        self.anchor_rules: List[List[int]] = []
+        for rule_id, signature in enumerate(self.signatures):
+            if signature.anchor not in anchors:
+                anchors[signature.anchor] = len(self.anchor_rules)
+                self.anchor_rules.append([])
+            self.anchor_rules[anchors[signature.anchor]].append(rule_id)
+        self.anchor_lengths = [len(a) for a in anchors]
+
+        # Trie
+        children: List[Dict[int, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for anchor, anchor_id in anchors.items():
+            state = 0
+            for byte in anchor:
+                nxt = children[state].get(byte)
+                if nxt is None:
+                    nxt = len(children)
+                    children[state][byte] = nxt
+                    children.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(anchor_id)
+
+        # Breadth-first failure links, folded into a full DFA
+        delta: List[List[int]] = [[0] * 256 for _ in children]
+        fail = [0] * len(children)
+        queue = deque()
+        for byte, nxt in children[0].items():
+            delta[0][byte] = nxt
+            queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            row = delta[state]
+            row[:] = delta[fail[state]]
+            for byte, nxt in children[state].items():
+                fail[nxt] = delta[fail[state]][byte] if state else 0
+                row[byte] = nxt
+                queue.append(nxt)
+
+        self.delta = delta
+        self.outputs = [tuple(o) if o else None for o in outputs]
+        self.root_skip = re.compile(
+            b"|".join(re.escape(anchor) for anchor in anchors) if anchors else b"(?!)"
+        )
+
+    def scan(self, buf: bytes, report_from: int = 0) -> List[Tuple[int, int]]:
+        """
+        Find full signature matches in a buffer
+
+        Args:
+            buf: Data to scan
+            report_from: Only report matches ending after this index
+                (bytes before it were already covered by a previous buffer)
+
+        Returns:
+            List of (rule id, start offset in buf)
+        """
+        matches = []
+        delta = self.delta
+        outputs = self.outputs
+        search = self.root_skip.search
+        n = len(buf)
+        state = 0
+        pos = 0
+        while pos < n:
+            if state == 0:
+                hit = search(buf, pos)
+                if hit is None:
+                    break
+                pos = hit.start()
+            state = delta[state][buf[pos]]
+            found = outputs[state]
+            if found:
+                for anchor_id in found:
+                    anchor_start = pos - self.anchor_lengths[anchor_id] + 1
+                    for rule_id in self.anchor_rules[anchor_id]:
+                        start = self._verify(buf, anchor_start, rule_id, report_from)
+                        if start is not None:
+                            matches.append((rule_id, start))
+            pos += 1
+        return matches
+
+    def _verify(
+        self, buf: bytes, anchor_start: int, rule_id: int, report_from: int
+    ) -> Optional[int]:
+        signature = self.signatures[rule_id]
+        start = anchor_start - signature.anchor_offset
+        end = start + signature.length
+        if start < 0 or end > len(buf) or end <= report_from:
+            return None
+        for offset, literal in signature.fragments:
+            if buf[start + offset : start + offset + len(literal)] != literal:
+                return None
+        return start
+
+
+def scan_file(
+    automaton: AhoCorasick, path: str, chunk_size: int = CHUNK_SIZE
+) -> Tuple[List[Tuple[str, int]], bytes]:
+    """
+    Stream a file through the automaton in chunks, hashing as it goes
+
+    Each buffer is prefixed with the last (max pattern length - 1) bytes
+    of the previous one, so matches spanning a chunk boundary are found
+    exactly once. The SHA256 is computed in the same pass, so hash
+    reputation checks cost no extra read.
+
+    Returns:
+        (list of (signature name, file offset), SHA256 digest)
+    """
+    overlap = max(automaton.max_length - 1, 0)
+    matches = []
+    sha256 = hashlib.sha256()
+    tail = b""
+    base = 0  # file offset of buf[0]
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            sha256.update(chunk)
+            buf = tail + chunk
+            for rule_id, start in automaton.scan(buf, report_from=len(tail)):
+                matches.append((automaton.signatures[rule_id].name, base + start))
+            tail = buf[-overlap:] if overlap else b""
+            base += len(buf) - len(tail)
+    return matches, sha256.digest()
+
+
+def get_rules_paths() -> List[str]:
+    """Bundled rules plus user rules from the config directory/config key"""
+    config = get_config()
+    paths = [SIGNATURES_FILE]
+    user_rules = os.path.join(config.config_dir, "signatures.txt")
+    if os.path.exists(user_rules):
+        paths.append(user_rules)
+    extra = config.get("security.signature_rules", "")
+    if extra:
+        paths.append(os.path.expanduser(extra))
+    return paths
+
+
+def rules_fingerprint(rules_paths: List[str]) -> bytes:
+    """Digest of the rules files' contents, used to invalidate cached results"""
+    digest = hashlib.sha256()
+    for path in rules_paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.digest()
+
+
+def load_automaton(rules_paths: List[str]) -> AhoCorasick:
+    """Compile the signatures from several rules files into one automaton"""
+    signatures = []
+    for path in rules_paths:
+        signatures.extend(load_rules(path))
+    return AhoCorasick(signatures)
+
+
+class ScanCache:
+    """
+    Persistent per-file scan results keyed by (device, inode)
+
+    An entry is reused while the file's size and mtime are unchanged. The
+    SHA256 is kept regardless of rules so hash lookups always run against
+    the current known-bad set; signature matches are only reused if the
+    rules fingerprint matches too.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[Tuple[int, int], tuple] = {}
+        self._seen: set = set()
+        try:
+            with open(path, "rb") as f:
+                version, entries = pickle.load(f)
+            if version == self.VERSION:
+                self.entries = entries
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            pass
+
+    def lookup(self, st: os.stat_result, fingerprint: bytes) -> Optional[tuple]:
+        """Return (sha256, matches) for an unchanged file, else None"""
+        key = (st.st_dev, st.st_ino)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        _, size, mtime, digest, rules, matches = entry
+        if size != st.st_size or mtime != st.st_mtime_ns or rules != fingerprint:
+            return None
+        self._seen.add(key)
+        return digest, matches
+
+    def store(
+        self,
+        path: str,
+        st: os.stat_result,
+        digest: bytes,
+        fingerprint: bytes,
+        matches: List[Tuple[str, int]],
+    ):
+        key = (st.st_dev, st.st_ino)
+        self.entries[key] = (
+            path,
+            st.st_size,
+            st.st_mtime_ns,
+            digest,
+            fingerprint,
+            matches,
+        )
+        self._seen.add(key)
+
+    def save(self, root: str):
+        """Drop entries under root not seen this scan, then write atomically"""
+        prefix = os.path.join(os.path.abspath(root), "")
+        self.entries = {
+            key: entry
+            for key, entry in self.entries.items()
+            if key in self._seen or not entry[0].startswith(prefix)
+        }
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((self.VERSION, self.entries), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+
+
+def get_scan_cache() -> ScanCache:
+    """Scan cache stored in the PyTools cache directory"""
+    return ScanCache(os.path.join(get_cache().cache_dir, "scan_results.pkl"))
+
+
+_worker_automaton: Optional[AhoCorasick] = None
+
+
+def _init_worker(rules_paths: List[str]):
+    global _worker_automaton
+    _worker_automaton = load_automaton(rules_paths)
+
+
+def _scan_batch(items: List[Tuple[str, Any]]) -> List[Tuple[str, Any, Any, Any]]:
+    """Scan a batch of (path, stat) in a worker; errors are returned, not raised"""
+    results = []
+    for path, st in items:
+        try:
+            matches, digest = scan_file(_worker_automaton, path)
+            results.append((path, st, matches, digest))
+        except OSError as e:
+            results.append((path, st, e.strerror or str(e), None))
+    return results
+
+
+def iter_files(
+    root: str,
+    max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+    skip_extensions: Iterable[str] = (),
+) -> Iterator[Tuple[str, os.stat_result]]:
+    """Yield (path, stat) for regular files under root, skipping by size/extension"""
+    skip = {ext.lower() for ext in skip_extensions}
+    if os.path.isfile(root):
+        yield root, os.stat(root)
+        return
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            if skip and os.path.splitext(entry.name)[1].lower() in skip:
+                                continue
+                            st = entry.stat(follow_symlinks=False)
+                            if 0 < st.st_size <= max_file_size:
+                                yield entry.path, st
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def _batched(items: Iterator[Any], size: int) -> Iterator[List[Any]]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def scan_path(
+    root: str,
+    rules_paths: List[str],
+    workers: Optional[int] = None,
+    max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+    skip_extensions: Iterable[str] = (),
+    hash_store: Optional[Any] = None,
+    cache: Optional[ScanCache] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Scan files under root in a process pool
+
+    Args:
+        root: File or directory to scan
+        rules_paths: Signature rules files
+        workers: Number of worker processes (defaults to CPU count)
+        max_file_size: Skip files larger than this
+        skip_extensions: File extensions (".iso") to skip
+        hash_store: Known-bad SHA256 set with contains_digest(), if any
+        cache: Per-inode result cache; unchanged files are not re-read
+        progress: Callback receiving (files scanned, bytes scanned)
+
+    Returns:
+        Dictionary with matches, known-bad hits, errors, counts and throughput
+    """
+    root = os.path.abspath(root)
+    # Compile in the parent too so rule errors surface before the pool starts
+    signature_count = len(load_automaton(rules_paths).signatures)
+    fingerprint = rules_fingerprint(rules_paths)
+    workers = workers or os.cpu_count() or 1
+
+    stats: Dict[str, Any] = {
+        "signatures": signature_count,
+        "files": 0,
+        "cached": 0,
+        "bytes": 0,
+        "matches": [],
+        "known_bad": [],
+        "errors": [],
+    }
+
+    def record(path: str, digest: bytes, matches: List[Tuple[str, int]]):
+        stats["files"] += 1
+        for name, offset in matches:
+            stats["matches"].append((path, name, offset))
+        if hash_store is not None and hash_store.contains_digest(digest):
+            stats["known_bad"].append((path, digest.hex()))
+
+    def pending() -> Iterator[Tuple[str, os.stat_result]]:
+        for path, st in iter_files(root, max_file_size, skip_extensions):
+            cached = cache.lookup(st, fingerprint) if cache else None
+            if cached is None:
+                yield path, st
+                continue
+            record(path, *cached)
+            stats["cached"] += 1
+            if progress and stats["cached"] % 1000 == 0:
+                progress(stats["files"], stats["bytes"])
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(rules_paths,)
+    ) as executor:
+        for results in pipelined_map(
+            executor, _scan_batch, _batched(pending(), FILES_PER_TASK), workers * 4
+        ):
+            for path, st, found, digest in results:
+                if isinstance(found, str):
+                    stats["errors"].append((path, found))
+                    continue
+                stats["bytes"] += st.st_size
+                record(path, digest, found)
+                if cache is not None:
+                    cache.store(path, st, digest, fingerprint, found)
+            if progress:
+                progress(stats["files"], stats["bytes"])
+
+    if progress:
+        progress(stats["files"], stats["bytes"])
+    if cache is not None:
+        cache.save(root)
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["mb_s"] = (
+        stats["bytes"] / (1024 * 1024) / stats["seconds"] if stats["seconds"] else 0.0
+    )
+    return stats
@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+PyTools v2.0.0 - Core System Info Module
+Concurrent system information collectors
+"""
+
+import os
+import glob
+import getpass
+import platform
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeout
+from datetime import datetime
+from typing import Optional, Dict, List, Tuple, Callable
+
+import psutil
+
+from .base import format_bytes, format_duration
+from .monitor import get_sampler
+from .utils import get_cache
+
+PENDING = "…"
+
+# (field names, collector returning those fields)
+Collector = Tuple[Tuple[str, ...], Callable[[], Dict[str, str]]]
+
+
+def cpu_model() -> str:
+    """CPU model name from /proc/cpuinfo, falling back to platform"""
+    try:
+        with open("/proc/cpuinfo", "r", errors="replace") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key.strip() in ("model name", "Hardware", "Processor"):
+                    return " ".join(value.split())
+    except OSError:
+        pass
+    return platform.processor() or platform.machine() or "Unknown"
+
+
+def collect_os() -> Dict[str, str]:
+    uname = platform.uname()
+    return {
+        "OS": f"{uname.system} {uname.release}",
+        "OS Version": uname.version,
+        "Architecture": uname.machine,
+        "Python Version": platform.python_version(),
+        "Hostname": uname.node,
+    }
+
+
+def collect_processor() -> Dict[str, str]:
+    return {"Processor": cpu_model()}
+
+
+def collect_cpu_counts() -> Dict[str, str]:
+    return {
+        "CPU Cores": str(psutil.cpu_count(logical=False)),
+        "CPU Threads": str(psutil.cpu_count(logical=True)),
+    }
+
+
+def collect_cpu_usage() -> Dict[str, str]:
+    """Latest reading of the shared background sampler"""
+    sampler = get_sampler()
+    sample = sampler.latest or sampler.wait_for_sample(0, sampler.interval * 2)
+    if sample is None:
+        return {"CPU Usage": "N/A"}
+    return {"CPU Usage": f"{sample['cpu']['total']:.1f}%"}
+
+
+def collect_memory() -> Dict[str, str]:
+    mem = psutil.virtual_memory()
+    return {
+        "Total RAM": format_bytes(mem.total),
+        "Available RAM": format_bytes(mem.available),
+        "Used RAM": f"{format_bytes(mem.used)} ({mem.percent}%)",
+    }
+
+
+def collect_disk() -> Dict[str, str]:
+    disk = psutil.disk_usage("/")
+    return {
+        "Total Disk": format_bytes(disk.total),
+        "Used Disk": f"{format_bytes(disk.used)} ({disk.percent}%)",
+        "Free Disk": format_bytes(disk.free),
+    }
+
+
+def collect_boot() -> Dict[str, str]:
+    boot_time = datetime.fromtimestamp(psutil.boot_time())
+    uptime_seconds = int((datetime.now() - boot_time).total_seconds())
+    return {
+        "Boot Time": boot_time.strftime("%Y-%m-%d %H:%M:%S"),
+        "Uptime": format_duration(uptime_seconds),
+    }
+
+
+def read_os_release() -> Dict[str, str]:
+    """Key/value pairs of /etc/os-release (or /usr/lib/os-release)"""
+    for path in ("/etc/os-release", "/usr/lib/os-release"):
+        try:
+            with open(path, "r", errors="replace") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            continue
+        release = {}
+        for line in lines:
+            key, sep, value = line.partition("=")
+            if sep and not key.startswith("#"):
+                release[key.strip()] = value.strip().strip("\"'")
+        return release
+    return {}
+
+
+def _read_first(paths: List[str]) -> str:
+    """Stripped content of the first readable, non-empty file"""
+    for path in paths:
+        try:
+            with open(path, "r", errors="replace") as f:
+                value = f.read().strip("\x00\n ")
+        except OSError:
+            continue
+        if value:
+            return value
+    return ""
+
+
+def _count_dpkg(path: str) -> int:
+    with open(path, "rb") as f:
+        return f.read().count(b"Status: install ok installed")
+
+
+def _count_rpm(path: str) -> int:
+    db = sqlite3.connect(f"file:{path}?mode=ro&immutable=1", uri=True)
+    try:
+        return db.execute("SELECT COUNT(*) FROM Packages").fetchone()[0]
+    finally:
+        db.close()
+
+
+def _count_apk(path: str) -> int:
+    with open(path, "rb") as f:
+        return sum(1 for line in f if line.startswith(b"P:"))
+
+
+def _count_dirs(path: str) -> int:
+    with os.scandir(path) as entries:
+        return sum(1 for e in entries if e.is_dir(follow_symlinks=False))
+
+
+def _count_snaps(path: str) -> int:
+    with os.scandir(path) as entries:
+        return sum(1 for e in entries if e.name.endswith(".snap"))
+
+
+_prefix = os.environ.get("PREFIX", "/data/data/com.termux/files/usr")
+
+# (manager, database path, counter); the database's mtime changes whenever
+# packages are installed or removed, so it keys the cached count
+PACKAGE_DBS: List[Tuple[str, str, Callable[[str], int]]] = [
+    ("dpkg", "/var/lib/dpkg/status", _count_dpkg),
+    ("dpkg", f"{_prefix}/var/lib/dpkg/status", _count_dpkg),
+    ("rpm", "/var/lib/rpm/rpmdb.sqlite", _count_rpm),
+    ("rpm", "/usr/lib/sysimage/rpm/rpmdb.sqlite", _count_rpm),
+    ("pacman", "/var/lib/pacman/local", _count_dirs),
+    ("apk", "/lib/apk/db/installed", _count_apk),
+    ("flatpak", "/var/lib/flatpak/app", _count_dirs),
+    ("snap", "/var/lib/snapd/snaps", _count_snaps),
+    ("brew", "/opt/homebrew/Cellar", _count_dirs),
+    ("brew", "/usr/local/Cellar", _count_dirs),
+    ("brew", "/home/linuxbrew/.linuxbrew/Cellar", _count_dirs),
+]
+
+
+def package_counts() -> Dict[str, int]:
+    """
+    Installed package count per package manager
+
+    Counting means reading whole databases, so results are cached across
+    runs under the database path and only recounted when its mtime changes.
+    """
+    cache = get_cache()
+    cached = cache.get("package_counts", {})
+    fresh: Dict[str, List[int]] = {}
+    counts: Dict[str, int] = {}
+    for manager, path, counter in PACKAGE_DBS:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        entry = cached.get(path)
+        if entry is None or entry[0] != mtime:
+            try:
+                entry = [mtime, counter(path)]
+            except (OSError, sqlite3.Error, TypeError):
+                continue
+        fresh[path] = entry
+        if entry[1]:
+            counts[manager] = counts.get(manager, 0) + entry[1]
+    if fresh != cached:
+        cache.set("package_counts", fresh, persist=True)
+    return counts
+
+
+PCI_IDS = ["/usr/share/hwdata/pci.ids", "/usr/share/misc/pci.ids", "/usr/share/pci.ids"]
+
+PCI_VENDORS = {
+    "1002": "AMD",
+    "10de": "NVIDIA",
+    "8086": "Intel",
+    "1af4": "Red Hat Virtio",
+    "15ad": "VMware",
+    "1234": "QEMU",
+    "80ee": "VirtualBox",
+    "1414": "Microsoft",
+    "1a03": "ASPEED",
+    "102b": "Matrox",
+}
+
+
+def _pci_name(vendor: str, device: str) -> str:
+    """Vendor and device name from pci.ids, or the raw IDs"""
+    fallback = f"{PCI_VENDORS.get(vendor, vendor)} [{vendor}:{device}]"
+    for path in PCI_IDS:
+        try:
+            f = open(path, "r", encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        with f:
+            vendor_name = None
+            for line in f:
+                if vendor_name is None:
+                    if line.startswith(vendor):
+                        vendor_name = line[4:].strip()
+                elif line.startswith("\t") and not line.startswith("\t\t"):
+                    if line[1:5] == device:
+                        return f"{vendor_name} {line[5:].strip()}"
+                elif not line.startswith(("\t", "#")) and line.strip():
+                    break  # the next vendor: device not listed
+            if vendor_name:
+                return f"{vendor_name} [{device}]"
+        break
+    return fallback
+
+
+def gpus() -> List[str]:
+    """Display controllers from PCI class 0x03 in /sys, names cached by ID"""
+    cache = get_cache()
+    names = cache.get("pci_names", {})
+    found = []
+    for path in sorted(glob.glob("/sys/bus/pci/devices/*")):
+        try:
+            with open(f"{path}/class") as f:
+                if not f.read().startswith("0x03"):
+                    continue
+            with open(f"{path}/vendor") as f:
+                vendor = f.read().strip()[2:]
+            with open(f"{path}/device") as f:
+                device = f.read().strip()[2:]
+        except OSError:
+            continue
+        key = f"{vendor}:{device}"
+        if key not in names:
+            names[key] = _pci_name(vendor, device)
+            cache.set("pci_names", names, persist=True)
+        found.append(names[key])
+    return found
+
+
+# Processes between us and the terminal emulator
+_NOT_TERMINALS = {
+    "bash",
+    "zsh",
+    "fish",
+    "sh",
+    "dash",
+    "ksh",
+    "tcsh",
+    "csh",
+    "sudo",
+    "su",
+    "doas",
+    "login",
+    "sshd",
+    "pytools",
+}
+
+
+def terminal_name() -> str:
+    """Terminal emulator from the environment or the parent process chain"""
+    for variable in ("TERM_PROGRAM", "TERMINAL_EMULATOR"):
+        if os.environ.get(variable):
+            return os.environ[variable]
+    if os.environ.get("SSH_TTY"):
+        return os.environ["SSH_TTY"]
+    try:
+        for parent in psutil.Process().parents():
+            name = parent.name()
+            if name in _NOT_TERMINALS or name.startswith("python") or name == "init":
+                continue
+            if name != "systemd":
+                return name
+            break
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        pass
+    return os.environ.get("TERM", "N/A")
+
+
+def user_host() -> str:
+    """user@hostname heading of the summary"""
+    try:
+        user = getpass.getuser()
+    except (KeyError, OSError):
+        user = str(os.getuid()) if hasattr(os, "getuid") else "user"
+    return f"{user}@{platform.node()}"
+
+
+def collect_distro() -> Dict[str, str]:
+    if platform.system() == "Darwin":
+        name = f"macOS {platform.mac_ver()[0]}"
+    else:
+        release = read_os_release()
+        name = release.get("PRETTY_NAME") or release.get("NAME") or platform.system()
+    return {"Distro": f"{name} {platform.machine()}"}
+
+
+def collect_host() -> Dict[str, str]:
+    model = _read_first(
+        [
+            "/sys/devices/virtual/dmi/id/product_name",
+            "/sys/firmware/devicetree/base/model",
+            "/proc/device-tree/model",
+        ]
+    )
+    version = _read_first(["/sys/devices/virtual/dmi/id/product_version"])
+    if version and version not in model and "O.E.M" not in version:
+        model = f"{model} {version}"
+    return {"Host": model or platform.node()}
+
+
+def collect_kernel() -> Dict[str, str]:
+    return {"Kernel": platform.release()}
+
+
+def collect_packages() -> Dict[str, str]:
+    counts = package_counts()
+    if not counts:
+        return {"Packages": "N/A"}
+    return {"Packages": ", ".join(f"{n} ({m})" for m, n in counts.items())}
+
+
+def collect_shell() -> Dict[str, str]:
+    shell = os.environ.get("SHELL") or os.environ.get("COMSPEC") or ""
+    return {"Shell": os.path.basename(shell) or "N/A"}
+
+
+def collect_terminal() -> Dict[str, str]:
+    return {"Terminal": terminal_name()}
+
+
+def collect_desktop() -> Dict[str, str]:
+    desktop = (
+        os.environ.get("XDG_CURRENT_DESKTOP")
+        or os.environ.get("DESKTOP_SESSION")
+        or ("Aqua" if platform.system() == "Darwin" else "")
+    )
+    return {"DE": desktop.replace(":", ", ") or "N/A"}
+
+
+def collect_cpu() -> Dict[str, str]:
+    model = cpu_model()
+    threads = psutil.cpu_count(logical=True)
+    max_khz = _read_first(["/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq"])
+    speed = ""
+    if max_khz.isdigit() and "@" not in model:
+        speed = f" @ {int(max_khz) / 1e6:.2f}GHz"
+    return {"CPU": f"{model} ({threads}){speed}"}
+
+
+def collect_gpu() -> Dict[str, str]:
+    return {"GPU": "; ".join(gpus()) or "N/A"}
+
+
+def collect_memory_summary() -> Dict[str, str]:
+    mem = psutil.virtual_memory()
+    used = mem.total - mem.available
+    return {"Memory": f"{format_bytes(used)} / {format_bytes(mem.total)}"}
+
+
+# The neofetch-style overview shown above the detailed table
+SUMMARY_COLLECTORS: List[Collector] = [
+    (("Distro",), collect_distro),
+    (("Host",), collect_host),
+    (("Kernel",), collect_kernel),
+    (("Packages",), collect_packages),
+    (("Shell",), collect_shell),
+    (("Terminal",), collect_terminal),
+    (("DE",), collect_desktop),
+    (("CPU",), collect_cpu),
+    (("GPU",), collect_gpu),
+    (("Memory",), collect_memory_summary),
+]
+
+
+COLLECTORS: List[Collector] = [
+    (("OS", "OS Version", "Architecture", "Python Version", "Hostname"), collect_os),
+    (("Processor",), collect_processor),
+    (("CPU Cores", "CPU Threads"), collect_cpu_counts),
+    (("CPU Usage",), collect_cpu_usage),
+    (("Total RAM", "Available RAM", "Used RAM"), collect_memory),
+    (("Total Disk", "Used Disk", "Free Disk"), collect_disk),
+    (("Boot Time", "Uptime"), collect_boot),
+]
+
+
+def pending(collectors: List[Collector] = COLLECTORS) -> Dict[str, str]:
+    """Every field of the collectors, in order, marked as not yet known"""
+    return {field: PENDING for fields, _ in collectors for field in fields}
+
+
+def gather(
+    collectors: List[Collector] = COLLECTORS,
+    timeout: float = 3.0,
+    on_update: Optional[Callable[[Dict[str, str]], None]] = None,
+) -> Dict[str, str]:
+    """
+    Run collectors concurrently
+
+    The result dict is created up front with every field set to PENDING, in
+    collector order, and filled in place as collectors finish; on_update is
+    called with it after each one so a screen can redraw progressively.
+    Fields of collectors that fail show "N/A", and of those still running
+    after `timeout` show "timed out" (their threads are abandoned).
+    """
+    info = pending(collectors)
+    if not collectors:
+        return info
+    executor = ThreadPoolExecutor(max_workers=len(collectors))
+    futures = {executor.submit(func): fields for fields, func in collectors}
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            fields = futures[future]
+            try:
+                values = future.result()
+            except Exception:
+                values = {}
+            for field in fields:
+                info[field] = values.get(field, "N/A")
+            if on_update:
+                on_update(info)
+    except FuturesTimeout:
+        for future, fields in futures.items():
+            if not future.done():
+                for field in fields:
+                    info[field] = "timed out"
+        if on_update:
+            on_update(info)
+    finally:
+        executor.shutdown(wait=False)
+    return info
@@ -103,10 +103,30 @@ class Config:
             "security": {
                 "min_password_length": 12,
                 "show_password": False,
+                "kdf_log_n": 15,
+                "encryption_chunk_size": 1048576,
+                "breach_db": "",
+                "passphrase_wordlist": "",
+                "signature_rules": "",
+                "scan_max_file_size": 104857600,
+                "scan_skip_extensions": [".iso", ".mp4", ".mkv", ".avi", ".mov"],
+                "malware_hashes": "",
+                "scan_timeout": 600,
             },
             "system": {
                 "clear_screen": True,
                 "confirm_dangerous": True,
+                "dashboard_fps": 4,
+                "process_list_limit": 20,
+                "clean_tmp_age_days": 7,
+                "clean_log_age_days": 30,
+                "journal_keep_days": 14,
+                "clean_estimate_timeout": 60,
+                "info_timeout": 3,
+                "history_enabled": True,
+                "exporter_bind": "127.0.0.1",
+                "exporter_port": 9877,
+                "exporter_interval": 5,
             },
         }
 
@@ -6,12 +6,25 @@ Security analysis, password tools, and protection utilities
 
 import os
 import re
-import secrets
-import string
+import csv
+import time
 import hashlib
 from typing import Optional, Dict, List, Any
 
-from core.base import BaseModule, SystemInfo, CommandExecutor
+from core import (
+    audit,
+    crypto,
+    engines,
+    generator,
+    hashbench,
+    permaudit,
+    rootkit,
+    signatures,
+)
+from core.passwords import get_estimator, format_crack_time
+from core.breach import build_store, get_breach_store, get_store_path
+from core.reputation import build_hash_db, get_hash_store, get_hash_db_path
+from core.base import BaseModule, SystemInfo, CommandExecutor, format_bytes
 from core.utils import get_logger, get_config
 from ui.display import Display
 
@@ -30,101 +43,232 @@ class PasswordStrengthModule(BaseModule):
 
     def execute(self) -> bool:
         try:
-            password = self.display.prompt(
-                "Enter password to check strength", password=True
-            )
+            self.display.console.print("1. Check a password")
+            self.display.console.print("2. Audit a password file")
+            self.display.console.print()
 
-            if not password:
-                self.display.show_warning("No password provided")
+            choice = self.display.prompt("Choose option", default="1")
+
+            if choice == "1":
+                return self._check_single()
+            elif choice == "2":
+                return self._audit_file()
+            else:
+                self.display.show_warning("Invalid choice")
                 return False
 
-            self.display.console.print()
+        except Exception as e:
+            self.log_error("Password check failed", e)
+            self.display.show_error(f"Failed to check password: {str(e)}")
+            return False
 
-            # Analyze password
-            analysis = self._analyze_password(password)
+    def _audit_file(self) -> bool:
+        """Score every password in a file and report aggregate statistics"""
+        source = self.display.prompt("Path to password file (one per line)")
+        if not source or not os.path.exists(source):
+            self.display.show_error("File not found")
+            return False
 
-            # Display results
-            strength = analysis["strength"]
-            score = analysis["score"]
-            color = analysis["color"]
+        output = self.display.prompt(
+            "CSV report path", default=os.path.splitext(source)[0] + "_audit.csv"
+        )
+        summary_path = os.path.splitext(output)[0] + "_summary.csv"
+        min_length = get_config().get("security.min_password_length", 12)
 
-            self.display.console.print(
-                f"[{color}]Password Strength: {strength} ({score}/100)[/{color}]"
+        self.display.console.print()
+        total_bytes = os.path.getsize(source)
+        start = time.perf_counter()
+
+        with self.display.show_progress_bar(total_bytes, "Auditing...") as progress:
+            task = progress.add_task("Auditing passwords...", total=total_bytes)
+
+            def on_progress(scored: int, read_bytes: int):
+                progress.update(
+                    task,
+                    completed=read_bytes,
+                    description=f"Auditing passwords... {scored:,} scored",
+                )
+
+            stats = audit.audit_file(
+                source,
+                output,
+                min_length=min_length,
+                workers=get_config().get("performance.max_threads", None),
+                progress=on_progress,
             )
-            self.display.console.print()
 
-            # Show details
-            details = {
-                "Length": str(analysis["length"]),
-                "Has Uppercase": "✓" if analysis["has_upper"] else "✗",
-                "Has Lowercase": "✓" if analysis["has_lower"] else "✗",
-                "Has Numbers": "✓" if analysis["has_digit"] else "✗",
-                "Has Special Chars": "✓" if analysis["has_special"] else "✗",
-                "Estimated Crack Time": analysis["crack_time"],
-            }
+        elapsed = time.perf_counter() - start
+        audit.write_summary(stats, summary_path)
+        total = stats["total"] or 1
+
+        self.display.console.print()
+        self.display.show_key_value(
+            {
+                "Passwords": f"{stats['total']:,}",
+                "Average Guesses": f"10^{stats['avg_guesses_log10']:.1f}",
+                "Time": f"{elapsed:.1f}s",
+                "Throughput": (
+                    f"{stats['total'] / elapsed * 60:,.0f} passwords/min"
+                    if elapsed > 0
+                    else "N/A"
+                ),
+                "Report": output,
+                "Summary": summary_path,
+            },
+            "📋 Password Audit",
+        )
 
-            self.display.show_key_value(details, "🔐 Password Analysis")
+        self.display.console.print()
+        self.display.show_table(
+            "📊 Strength Distribution",
+            ["Strength", "Count", "Percent"],
+            [
+                [label, f"{count:,}", f"{count * 100 / total:.1f}%"]
+                for label, count in zip(audit.STRENGTH_LABELS, stats["scores"])
+            ],
+        )
 
-            # Show recommendations
-            if analysis["recommendations"]:
-                self.display.console.print()
-                self.display.show_section("💡 Recommendations")
-                for rec in analysis["recommendations"]:
-                    self.display.console.print(f"  • {rec}")
+        if stats["failures"]:
+            self.display.console.print()
+            self.display.show_table(
+                "❌ Most Common Failures",
+                ["Failure", "Count", "Percent"],
+                [
+                    [
+                        audit.FAILURE_LABELS[code],
+                        f"{count:,}",
+                        f"{count * 100 / total:.1f}%",
+                    ]
+                    for code, count in stats["failures"].most_common(10)
+                ],
+            )
 
-            return True
+        if stats["reused"]:
+            self.display.console.print()
+            self.display.show_table(
+                "♻️ Most Reused Passwords",
+                ["Password", "Occurrences"],
+                [[masked, f"≥{count:,}"] for masked, count in stats["reused"][:10]],
+            )
 
-        except Exception as e:
-            self.log_error("Password check failed", e)
-            self.display.show_error(f"Failed to check password: {str(e)}")
+        return True
+
+    def _check_single(self) -> bool:
+        """Analyze a single password typed at the prompt"""
+        password = self.display.prompt(
+            "Enter password to check strength", password=True
+        )
+
+        if not password:
+            self.display.show_warning("No password provided")
             return False
 
+        self.display.console.print()
+
+        # Analyze password
+        analysis = self._analyze_password(password)
+
+        # Display results
+        strength = analysis["strength"]
+        score = analysis["score"]
+        color = analysis["color"]
+
+        self.display.console.print(
+            f"[{color}]Password Strength: {strength} ({score}/100)[/{color}]"
+        )
+        self.display.console.print()
+
+        # Show details
+        details = {
+            "Length": str(analysis["length"]),
+            "Has Uppercase": "✓" if analysis["has_upper"] else "✗",
+            "Has Lowercase": "✓" if analysis["has_lower"] else "✗",
+            "Has Numbers": "✓" if analysis["has_digit"] else "✗",
+            "Has Special Chars": "✓" if analysis["has_special"] else "✗",
+            "Estimated Guesses": f"10^{analysis['guesses_log10']:.1f}",
+            "Entropy": f"{analysis['entropy']:.1f} bits",
+            "Estimated Crack Time": analysis["crack_time"],
+        }
+        if analysis["breached"] is not None:
+            details["Found in Breaches"] = "✗ Yes" if analysis["breached"] else "✓ No"
+
+        self.display.show_key_value(details, "🔐 Password Analysis")
+
+        # Show the patterns an attacker would try
+        if analysis["patterns"]:
+            self.display.console.print()
+            headers = ["Token", "Pattern", "Details", "Guesses"]
+            rows = [
+                [p["token"], p["pattern"], p["details"], f"{p['guesses']:.0f}"]
+                for p in analysis["patterns"]
+            ]
+            self.display.show_table("🧩 Detected Patterns", headers, rows)
+
+        # Show warnings and recommendations
+        if analysis["warnings"]:
+            self.display.console.print()
+            for warning in analysis["warnings"]:
+                self.display.show_warning(warning)
+
+        if analysis["recommendations"]:
+            self.display.console.print()
+            self.display.show_section("💡 Recommendations")
+            for rec in analysis["recommendations"]:
+                self.display.console.print(f"  • {rec}")
+
+        return True
+
+    def _describe_match(self, match: Dict[str, Any]) -> str:
+        """Short human description of a matched pattern"""
+        pattern = match["pattern"]
+        if pattern == "dictionary":
+            details = f"{match['dictionary_name']} #{match['rank']}"
+            if match.get("l33t"):
+                details += " (l33t)"
+            if match.get("reversed"):
+                details += " (reversed)"
+            return details
+        elif pattern == "spatial":
+            return f"{match['graph']}, {match['turns']} turn(s)"
+        elif pattern == "repeat":
+            return f"'{match['base_token']}' x{match['repeat_count']}"
+        elif pattern == "sequence":
+            return f"{match['sequence_name']} sequence"
+        elif pattern == "regex":
+            return "recent year"
+        elif pattern == "date":
+            return f"{match['year']}-{match['month']:02d}-{match['day']:02d}"
+        return "no pattern"
+
     def _analyze_password(self, password: str) -> Dict[str, Any]:
         """Analyze password strength"""
         length = len(password)
         has_upper = bool(re.search(r"[A-Z]", password))
         has_lower = bool(re.search(r"[a-z]", password))
         has_digit = bool(re.search(r"\d", password))
-        has_special = bool(re.search(r"[!@#$%^&*(),.?\":{}|<>]", password))
-
-        # Calculate score
-        score = 0
-        if length >= 8:
-            score += 20
-        if length >= 12:
-            score += 15
-        if length >= 16:
-            score += 15
-        if has_upper:
-            score += 15
-        if has_lower:
-            score += 15
-        if has_digit:
-            score += 10
-        if has_special:
-            score += 10
-
-        # Determine strength
-        if score >= 90:
-            strength = "Very Strong"
-            color = "bright_green"
-            crack_time = "Centuries+"
-        elif score >= 70:
-            strength = "Strong"
-            color = "green"
-            crack_time = "Years to decades"
-        elif score >= 50:
-            strength = "Medium"
-            color = "yellow"
-            crack_time = "Days to months"
-        elif score >= 30:
-            strength = "Weak"
-            color = "orange"
-            crack_time = "Hours to days"
-        else:
-            strength = "Very Weak"
-            color = "red"
-            crack_time = "Minutes to hours"
+        has_special = bool(re.search(r"[^A-Za-z0-9]", password))
+
+        estimate = get_estimator().estimate(password)
+        warnings = list(estimate["feedback"])
+
+        # Map guesses onto 0-100 (10^12 guesses and above is 100)
+        score = min(100, int(estimate["guesses_log10"] * 100 / 12))
+
+        # A breached password is tried first by any attacker
+        store = get_breach_store()
+        breached = store.contains(password) if store else None
+        if breached:
+            estimate["score"] = 0
+            score = 0
+            warnings.insert(0, "This password appears in a known data breach")
+
+        strength, color = [
+            ("Very Weak", "red"),
+            ("Weak", "orange"),
+            ("Medium", "yellow"),
+            ("Strong", "green"),
+            ("Very Strong", "bright_green"),
+        ][estimate["score"]]
 
         # Generate recommendations
         recommendations = []
@@ -138,6 +282,20 @@ class PasswordStrengthModule(BaseModule):
             recommendations.append("Add numbers (0-9)")
         if not has_special:
             recommendations.append("Add special characters (!@#$%^&*)")
+        if estimate["score"] < 3:
+            recommendations.append(
+                "Add more unrelated words or random characters, avoid common patterns"
+            )
+
+        patterns = [
+            {
+                "token": match["token"],
+                "pattern": match["pattern"],
+                "details": self._describe_match(match),
+                "guesses": match["guesses"],
+            }
+            for match in estimate["sequence"]
+        ]
 
         return {
             "strength": strength,
@@ -148,7 +306,15 @@ class PasswordStrengthModule(BaseModule):
             "has_lower": has_lower,
             "has_digit": has_digit,
             "has_special": has_special,
-            "crack_time": crack_time,
+            "guesses": estimate["guesses"],
+            "guesses_log10": estimate["guesses_log10"],
+            "entropy": estimate["entropy"],
+            "crack_time": (
+                "Instant" if breached else format_crack_time(estimate["crack_seconds"])
+            ),
+            "patterns": patterns,
+            "breached": breached,
+            "warnings": warnings,
             "recommendations": recommendations,
         }
 
@@ -167,80 +333,303 @@ class PasswordGeneratorModule(BaseModule):
 
     def execute(self) -> bool:
         try:
-            # Get preferences
-            length_str = self.display.prompt("Password length", default="16")
-            try:
-                length = int(length_str)
-                if length < 8:
-                    self.display.show_warning("Minimum length is 8, using 8")
-                    length = 8
-                elif length > 128:
-                    self.display.show_warning("Maximum length is 128, using 128")
-                    length = 128
-            except:
-                length = 16
-
-            use_special = self.display.confirm(
-                "Include special characters?", default=True
+            self.display.console.print("1. Generate passwords")
+            self.display.console.print("2. Bulk generate passwords to file")
+            self.display.console.print("3. Bulk generate passphrases to file")
+            self.display.console.print()
+
+            choice = self.display.prompt("Choose option", default="1")
+
+            if choice == "1":
+                return self._generate_interactive()
+            elif choice == "2":
+                return self._bulk_passwords()
+            elif choice == "3":
+                return self._bulk_passphrases()
+            else:
+                self.display.show_warning("Invalid choice")
+                return False
+
+        except Exception as e:
+            self.log_error("Password generation failed", e)
+            self.display.show_error(f"Failed to generate passwords: {str(e)}")
+            return False
+
+    def _prompt_length(self) -> int:
+        """Ask for a password length between 8 and 128"""
+        length_str = self.display.prompt("Password length", default="16")
+        try:
+            length = int(length_str)
+            if length < 8:
+                self.display.show_warning("Minimum length is 8, using 8")
+                length = 8
+            elif length > 128:
+                self.display.show_warning("Maximum length is 128, using 128")
+                length = 128
+        except:
+            length = 16
+        return length
+
+    def _prompt_count(self, default: str) -> int:
+        """Ask for a positive output count"""
+        count_str = self.display.prompt("Number to generate", default=default)
+        try:
+            return max(1, int(count_str.replace(",", "").replace("_", "")))
+        except ValueError:
+            return int(default)
+
+    def _generate_interactive(self) -> bool:
+        """Generate a few passwords and print them"""
+        length = self._prompt_length()
+        use_special = self.display.confirm("Include special characters?", default=True)
+        count_str = self.display.prompt("Number of passwords to generate", default="5")
+        try:
+            count = int(count_str)
+            count = max(1, min(count, 20))
+        except:
+            count = 5
+
+        self.display.console.print()
+
+        # Generate passwords
+        passwords = []
+        for _ in range(count):
+            password = self._generate_password(length, use_special)
+            passwords.append(password)
+
+        # Display passwords
+        self.display.show_section("🔑 Generated Passwords")
+        for i, pwd in enumerate(passwords, 1):
+            self.display.console.print(f"  {i}. [green]{pwd}[/green]")
+
+        self.display.console.print()
+        entropy = generator.password_entropy(length, self._classes(use_special))
+        self.display.show_info(f"Entropy per password: {entropy:.1f} bits")
+        self.display.show_info("💡 Tip: Store passwords in a secure password manager")
+
+        return True
+
+    def _bulk_passwords(self) -> bool:
+        """Generate a large number of passwords to a file"""
+        length = self._prompt_length()
+        use_special = self.display.confirm("Include special characters?", default=True)
+        count = self._prompt_count("1000000")
+        output = self.display.prompt("Output file path", default="passwords.txt")
+
+        classes = self._classes(use_special)
+        outputs = generator.generate_passwords(length, classes, count)
+        entropy = generator.password_entropy(length, classes)
+        return self._write_bulk(outputs, output, count, entropy, "passwords")
+
+    def _bulk_passphrases(self) -> bool:
+        """Generate a large number of diceware passphrases to a file"""
+        wordlist_path = self.display.prompt(
+            "Diceware wordlist path (7,776+ words)",
+            default=get_config().get("security.passphrase_wordlist", ""),
+        )
+        if not wordlist_path:
+            self.display.show_error(
+                "No wordlist configured: download a diceware list such as the "
+                "EFF large wordlist and set security.passphrase_wordlist"
             )
-            count_str = self.display.prompt(
-                "Number of passwords to generate", default="5"
+            return False
+        if not os.path.exists(wordlist_path):
+            self.display.show_error("Wordlist not found")
+            return False
+
+        try:
+            words = max(
+                1, int(self.display.prompt("Words per passphrase", default="6"))
             )
+        except ValueError:
+            words = 6
+        separator = self.display.prompt("Separator", default="-")
+        count = self._prompt_count("1000000")
+        output = self.display.prompt("Output file path", default="passphrases.txt")
+
+        try:
+            wordlist = generator.MappedWordlist(wordlist_path)
+        except ValueError as e:
+            self.display.show_error(str(e))
+            return False
+        with wordlist:
+            self.display.show_info(f"Loaded {len(wordlist):,} words")
             try:
-                count = int(count_str)
-                count = max(1, min(count, 20))
-            except:
-                count = 5
+                outputs = generator.generate_passphrases(
+                    wordlist, words, count, separator
+                )
+            except ValueError as e:
+                self.display.show_error(str(e))
+                return False
+            entropy = generator.passphrase_entropy(len(wordlist), words)
+            return self._write_bulk(outputs, output, count, entropy, "passphrases")
 
-            self.display.console.print()
+    def _write_bulk(
+        self, outputs, output: str, count: int, entropy: float, label: str
+    ) -> bool:
+        """Stream outputs to file with progress and report the rate"""
+        self.display.console.print()
+        with self.display.show_progress_bar(count, "Generating...") as progress:
+            task = progress.add_task(f"Generating {label}...", total=count)
+            stats = generator.write_outputs(
+                outputs,
+                output,
+                count,
+                progress=lambda done: progress.update(task, completed=done),
+            )
 
-            # Generate passwords
-            passwords = []
-            for _ in range(count):
-                password = self._generate_password(length, use_special)
-                passwords.append(password)
+        self.display.console.print()
+        self.display.show_key_value(
+            {
+                "Generated": f"{stats['count']:,} {label}",
+                "Output": output,
+                "Size": format_bytes(stats["bytes"]),
+                "Time": f"{stats['seconds']:.2f}s",
+                "Rate": f"{stats['rate']:,.0f} {label}/s",
+                "Entropy": f"{entropy:.1f} bits each",
+            },
+            "🔑 Bulk Generation",
+        )
+        return True
+
+    def _classes(self, use_special: bool) -> List[str]:
+        """Required character classes"""
+        classes = ["upper", "lower", "digit"]
+        if use_special:
+            classes.append("special")
+        return classes
 
-            # Display passwords
-            self.display.show_section("🔑 Generated Passwords")
-            for i, pwd in enumerate(passwords, 1):
-                self.display.console.print(f"  {i}. [green]{pwd}[/green]")
+    def _generate_password(self, length: int, use_special: bool) -> str:
+        """Generate a secure random password"""
+        classes = self._classes(use_special)
+        return next(generator.generate_passwords(length, classes, 1))
+
+
+class BreachDatabaseModule(BaseModule):
+    """Offline breached-password database"""
+
+    def __init__(self, display: Display):
+        super().__init__(
+            name="Breached Password Check",
+            description="Check passwords against a local breach corpus",
+            category="security",
+        )
+        self.display = display
+        self.icon = "🚨"
 
+    def execute(self) -> bool:
+        try:
+            self.display.console.print("1. Check a password")
+            self.display.console.print("2. Import hash list")
+            self.display.console.print("3. Database status")
             self.display.console.print()
-            self.display.show_info(
-                "💡 Tip: Store passwords in a secure password manager"
-            )
 
-            return True
+            choice = self.display.prompt("Choose option", default="1")
+
+            if choice == "1":
+                return self._check_password()
+            elif choice == "2":
+                return self._import_hashes()
+            elif choice == "3":
+                return self._show_status()
+            else:
+                self.display.show_warning("Invalid choice")
+                return False
 
         except Exception as e:
-            self.log_error("Password generation failed", e)
-            self.display.show_error(f"Failed to generate passwords: {str(e)}")
+            self.log_error("Breach database operation failed", e)
+            self.display.show_error(f"Operation failed: {str(e)}")
             return False
 
-    def _generate_password(self, length: int, use_special: bool) -> str:
-        """Generate a secure random password"""
-        characters = string.ascii_letters + string.digits
-        if use_special:
-            characters += string.punctuation
+    def _check_password(self) -> bool:
+        """Look up a single password"""
+        store = get_breach_store()
+        if store is None:
+            self.display.show_warning("No breach database installed")
+            self.display.show_info("Use 'Import hash list' to build one")
+            return False
 
-        # Ensure at least one of each type
-        password = [
-            secrets.choice(string.ascii_uppercase),
-            secrets.choice(string.ascii_lowercase),
-            secrets.choice(string.digits),
-        ]
+        password = self.display.prompt("Enter password to check", password=True)
+        if not password:
+            self.display.show_warning("No password provided")
+            return False
 
-        if use_special:
-            password.append(secrets.choice(string.punctuation))
+        start = time.perf_counter()
+        found = store.contains(password)
+        elapsed_us = (time.perf_counter() - start) * 1e6
+
+        self.display.console.print()
+        if found:
+            self.display.show_error("Password found in breach corpus - do not use it")
+        else:
+            self.display.show_success("Password not found in breach corpus")
+        self.display.show_info(
+            f"Searched {store.count:,} hashes in {elapsed_us:.1f} µs"
+        )
+        return True
+
+    def _import_hashes(self) -> bool:
+        """Build the database from a hash list"""
+        source = self.display.prompt("Path to hash list (SHA1 hex, one per line)")
+        if not source or not os.path.exists(source):
+            self.display.show_error("File not found")
+            return False
 
-        # Fill the rest
-        while len(password) < length:
-            password.append(secrets.choice(characters))
+        plaintext = self.display.confirm(
+            "Is the file plaintext passwords instead of SHA1 hashes?", default=False
+        )
+        output = self.display.prompt("Database path", default=get_store_path())
 
-        # Shuffle
-        secrets.SystemRandom().shuffle(password)
+        self.display.console.print()
+        total = os.path.getsize(source)
+        start = time.perf_counter()
 
-        return "".join(password)
+        with self.display.show_progress_bar(total, "Importing...") as progress:
+            task = progress.add_task("Sorting hashes...", total=None)
+
+            def on_progress(lines: int):
+                progress.update(
+                    task, description=f"Sorting hashes... {lines:,} lines read"
+                )
+
+            stats = build_store(source, output, plaintext, progress=on_progress)
+
+        elapsed = time.perf_counter() - start
+        self.display.console.print()
+        self.display.show_key_value(
+            {
+                "Lines Read": f"{stats['lines']:,}",
+                "Unique Hashes": f"{stats['records']:,}",
+                "Skipped Lines": f"{stats['skipped']:,}",
+                "Database": output,
+                "Size": format_bytes(os.path.getsize(output)),
+                "Time": f"{elapsed:.1f}s",
+            },
+            "🚨 Breach Database Imported",
+        )
+        if output != get_store_path():
+            self.display.show_info(
+                "Set security.breach_db in the config to use this database"
+            )
+        return True
+
+    def _show_status(self) -> bool:
+        """Show installed database information"""
+        path = get_store_path()
+        store = get_breach_store()
+        if store is None:
+            self.display.show_warning(f"No breach database at {path}")
+            return False
+
+        self.display.show_key_value(
+            {
+                "Database": path,
+                "Hashes": f"{store.count:,}",
+                "Size": format_bytes(os.path.getsize(path)),
+            },
+            "🚨 Breach Database",
+        )
+        return True
 
 
 class HashGeneratorModule(BaseModule):
@@ -259,6 +648,7 @@ class HashGeneratorModule(BaseModule):
         try:
             self.display.console.print("1. Hash text")
             self.display.console.print("2. Hash file")
+            self.display.console.print("3. Benchmark hash throughput")
             self.display.console.print()
 
             choice = self.display.prompt("Choose option", default="1")
@@ -267,6 +657,8 @@ class HashGeneratorModule(BaseModule):
                 return self._hash_text()
             elif choice == "2":
                 return self._hash_file()
+            elif choice == "3":
+                return self._benchmark()
             else:
                 self.display.show_warning("Invalid choice")
                 return False
@@ -308,16 +700,16 @@ class HashGeneratorModule(BaseModule):
         self.display.show_info("Calculating hashes...")
 
         try:
-            with open(filepath, "rb") as f:
-                data = f.read()
+            # One streaming pass feeds every algorithm
+            digests = hashbench.hash_file(filepath, ["md5", "sha1", "sha256", "sha512"])
 
             hashes = {
                 "File": filepath,
-                "Size": f"{len(data)} bytes",
-                "MD5": hashlib.md5(data).hexdigest(),
-                "SHA1": hashlib.sha1(data).hexdigest(),
-                "SHA256": hashlib.sha256(data).hexdigest(),
-                "SHA512": hashlib.sha512(data).hexdigest(),
+                "Size": f"{os.path.getsize(filepath)} bytes",
+                "MD5": digests["md5"],
+                "SHA1": digests["sha1"],
+                "SHA256": digests["sha256"],
+                "SHA512": digests["sha512"],
             }
 
             self.display.show_key_value(hashes, "🔒 File Hashes")
@@ -327,6 +719,93 @@ class HashGeneratorModule(BaseModule):
             self.display.show_error(f"Failed to read file: {str(e)}")
             return False
 
+    def _benchmark(self) -> bool:
+        """Measure hash throughput across algorithms, buffers and read methods"""
+        size_mb = self.display.prompt("Data size per run (MB)", default="32")
+        try:
+            data_size = int(size_mb) * 1024 * 1024
+        except ValueError:
+            self.display.show_error("Invalid size")
+            return False
+        if data_size <= 0:
+            self.display.show_error("Size must be positive")
+            return False
+
+        output = self.display.prompt(
+            "Save JSON results to", default=os.path.abspath("hash_benchmark.json")
+        )
+        workers = get_config().get("performance.max_threads", None)
+
+        self.display.console.print()
+        with self.display.show_progress_bar(0, "Benchmarking...") as progress:
+            task = progress.add_task("Benchmarking...", total=None)
+
+            def on_progress(done: int, total: int):
+                progress.update(task, completed=done, total=total)
+
+            results = hashbench.run_benchmark(
+                data_size=data_size, workers=workers, progress=on_progress
+            )
+
+        rates = {
+            (r["algorithm"], r["buffer_size"], r["mode"]): r["mb_s"]
+            for r in results["results"]
+        }
+        modes = ["memory"] + hashbench.FILE_METHODS
+        rows = []
+        for algorithm in hashbench.ALGORITHMS:
+            for buffer_size in hashbench.BUFFER_SIZES:
+                rows.append(
+                    [algorithm, format_bytes(buffer_size)]
+                    + [f"{rates[(algorithm, buffer_size, m)]:,.0f}" for m in modes]
+                )
+
+        self.display.console.print()
+        self.display.show_table(
+            "⏱️ Hash Throughput (MB/s, warm cache)",
+            ["Algorithm", "Buffer", "Memory", "read()", "readinto()", "mmap"],
+            rows,
+        )
+
+        self.display.console.print()
+        self.display.show_table(
+            "🧵 Multi-file Hashing (MB/s)",
+            ["Algorithm", "Files", "Single Thread", "Parallel", "Speedup"],
+            [
+                [
+                    p["algorithm"],
+                    str(p["files"]),
+                    f"{p['sequential_mb_s']:,.0f}",
+                    f"{p['parallel_mb_s']:,.0f}",
+                    (
+                        f"{p['parallel_mb_s'] / p['sequential_mb_s']:.1f}x"
+                        if p["sequential_mb_s"]
+                        else "N/A"
+                    ),
+                ]
+                for p in results["parallel"]
+            ],
+        )
+
+        best = results["best"]
+        if best:
+            self.display.show_success(
+                f"Fastest file hashing: {best['algorithm']} via {best['mode']} "
+                f"with {format_bytes(best['buffer_size'])} buffers "
+                f"({best['mb_s']:,.0f} MB/s)"
+            )
+        ceiling = results["memory_ceiling"]
+        if ceiling:
+            self.display.show_info(
+                f"In-memory ceiling: {ceiling['algorithm']} with "
+                f"{format_bytes(ceiling['buffer_size'])} buffers "
+                f"({ceiling['mb_s']:,.0f} MB/s, no file reads)"
+            )
+
+        hashbench.save_results(results, output)
+        self.display.show_info(f"Results saved to {output}")
+        return True
+
 
 class MalwareScanModule(BaseModule):
     """Scan for malware and viruses"""
@@ -344,90 +823,488 @@ class MalwareScanModule(BaseModule):
 
     def execute(self) -> bool:
         try:
-            # Check for available antivirus tools
-            av_tools = {
-                "clamav": "clamscan",
-                "chkrootkit": "chkrootkit",
-                "rkhunter": "rkhunter",
-            }
+            self.display.console.print("1. Built-in signature and hash scan")
+            self.display.console.print(
+                "2. External scanners (ClamAV, chkrootkit, rkhunter)"
+            )
+            self.display.console.print("3. Import known-bad hash list")
+            self.display.console.print()
 
-            available_tools = []
-            for name, cmd in av_tools.items():
-                if self.system_info.is_command_available(cmd):
-                    available_tools.append((name, cmd))
+            choice = self.display.prompt("Choose option", default="1")
 
-            if not available_tools:
-                self.display.show_warning("No antivirus tools found")
-                self.display.console.print()
-                self.display.show_info("Available tools to install:")
-                self.display.console.print("  • ClamAV: apt install clamav")
-                self.display.console.print("  • chkrootkit: apt install chkrootkit")
-                self.display.console.print("  • rkhunter: apt install rkhunter")
-                return False
+            if choice == "1":
+                return self._signature_scan()
+            elif choice == "2":
+                return self._external_scan()
+            elif choice == "3":
+                return self._import_hashes()
+
+            self.display.show_warning("Invalid choice")
+            return False
+
+        except Exception as e:
+            self.log_error("Malware scan failed", e)
+            self.display.show_error(f"Scan failed: {str(e)}")
+            return False
+
+    def _signature_scan(self) -> bool:
+        """Scan files with the built-in signature engine and hash reputation"""
+        config = get_config()
+        target = os.path.expanduser(
+            self.display.prompt("Path to scan", default=os.path.expanduser("~"))
+        )
+        if not os.path.exists(target):
+            self.display.show_error("Path not found")
+            return False
+
+        rules_paths = signatures.get_rules_paths()
+        max_size = config.get(
+            "security.scan_max_file_size", signatures.DEFAULT_MAX_FILE_SIZE
+        )
+        skip_extensions = config.get("security.scan_skip_extensions", [])
+        hash_store = get_hash_store()
+        cache = signatures.get_scan_cache()
+
+        self.display.console.print()
+        with self.display.show_progress_bar(0, "Scanning...") as progress:
+            task = progress.add_task("Scanning files...", total=None)
+
+            def on_progress(files: int, scanned: int):
+                progress.update(
+                    task,
+                    description=f"Scanning files... {files:,} files, "
+                    f"{format_bytes(scanned)} read",
+                )
+
+            stats = signatures.scan_path(
+                target,
+                rules_paths,
+                workers=config.get("performance.max_threads", None),
+                max_file_size=max_size,
+                skip_extensions=skip_extensions,
+                hash_store=hash_store,
+                cache=cache,
+                progress=on_progress,
+            )
+
+        self.display.console.print()
+        self.display.show_key_value(
+            {
+                "Signatures": f"{stats['signatures']:,}",
+                "Known-Bad Hashes": (
+                    f"{hash_store.count:,}" if hash_store else "Not installed"
+                ),
+                "Files Scanned": f"{stats['files']:,}",
+                "Unchanged (cached)": f"{stats['cached']:,}",
+                "Data Read": format_bytes(stats["bytes"]),
+                "Unreadable": f"{len(stats['errors']):,}",
+                "Time": f"{stats['seconds']:.1f}s",
+                "Throughput": f"{stats['mb_s']:.1f} MB/s",
+            },
+            "🦠 Signature Scan",
+        )
+
+        self.display.console.print()
+        if not stats["matches"] and not stats["known_bad"]:
+            self.display.show_success("No signature or hash matches found")
+            return True
 
-            self.display.show_info(f"Found {len(available_tools)} antivirus tool(s)")
+        if stats["known_bad"]:
+            self.display.show_table(
+                "☣️ Known-Bad Files",
+                ["File", "SHA256"],
+                [[path, digest] for path, digest in stats["known_bad"][:100]],
+            )
             self.display.console.print()
 
-            for name, cmd in available_tools:
-                self.display.console.print(f"  • {name}")
+        if stats["matches"]:
+            self.display.show_table(
+                "⚠️ Signature Matches",
+                ["File", "Signature", "Offset"],
+                [
+                    [path, name, f"0x{offset:x}"]
+                    for path, name, offset in stats["matches"][:100]
+                ],
+            )
+            if len(stats["matches"]) > 100:
+                self.display.show_info(f"... and {len(stats['matches']) - 100} more")
+
+        flagged = {m[0] for m in stats["matches"]} | {k[0] for k in stats["known_bad"]}
+        self.display.show_warning(f"{len(flagged)} suspicious file(s) found")
+        return True
+
+    def _import_hashes(self) -> bool:
+        """Build the known-bad hash database from a SHA256 list"""
+        source = self.display.prompt("Path to hash list (SHA256, one per line)")
+        if not source or not os.path.exists(source):
+            self.display.show_error("File not found")
+            return False
+
+        output = self.display.prompt("Database path", default=get_hash_db_path())
+
+        self.display.console.print()
+        start = time.perf_counter()
+
+        with self.display.show_progress_bar(0, "Importing...") as progress:
+            task = progress.add_task("Sorting hashes...", total=None)
 
+            def on_progress(lines: int):
+                progress.update(
+                    task, description=f"Sorting hashes... {lines:,} lines read"
+                )
+
+            stats = build_hash_db(source, output, progress=on_progress)
+
+        elapsed = time.perf_counter() - start
+        self.display.console.print()
+        self.display.show_key_value(
+            {
+                "Lines Read": f"{stats['lines']:,}",
+                "Unique Hashes": f"{stats['records']:,}",
+                "Skipped Lines": f"{stats['skipped']:,}",
+                "Database": output,
+                "Size": format_bytes(os.path.getsize(output)),
+                "Time": f"{elapsed:.1f}s",
+            },
+            "☣️ Hash Database Imported",
+        )
+        if output != get_hash_db_path():
+            self.display.show_info(
+                "Set security.malware_hashes in the config to use this database"
+            )
+        return True
+
+    def _external_scan(self) -> bool:
+        """Run installed third-party scanners concurrently"""
+        available_tools = [
+            name
+            for name, engine in engines.ENGINES.items()
+            if self.system_info.is_command_available(engine["command"])
+        ]
+
+        if not available_tools:
+            self.display.show_warning("No antivirus tools found")
             self.display.console.print()
+            self.display.show_info("Available tools to install:")
+            self.display.console.print("  • ClamAV: apt install clamav")
+            self.display.console.print("  • chkrootkit: apt install chkrootkit")
+            self.display.console.print("  • rkhunter: apt install rkhunter")
+            return False
+
+        self.display.show_info(f"Found {len(available_tools)} antivirus tool(s)")
+        self.display.console.print()
+
+        for name in available_tools:
+            self.display.console.print(f"  • {name}")
+
+        self.display.console.print()
+
+        if not self.display.confirm("Start malware scan?", default=False):
+            self.display.show_warning("Scan cancelled")
+            return False
+
+        # Root engines run with sudo -n, so cache credentials up front
+        sudo = not self.system_info.is_root and not self.system_info.is_termux
+        if sudo and any(engines.ENGINES[n]["root"] for n in available_tools):
+            self.display.show_info("Some scanners need root privileges")
+            if self.executor.run("sudo -v").returncode != 0:
+                self.display.show_warning("Skipping scanners that need root")
+                available_tools = [
+                    n for n in available_tools if not engines.ENGINES[n]["root"]
+                ]
+                if not available_tools:
+                    return False
+
+        target = os.path.expanduser("~")
+        commands = {
+            name: engines.build_command(name, target, sudo) for name in available_tools
+        }
+        width = max(len(name) for name in commands)
+
+        def on_line(name: str, line: str):
+            self.display.console.print(
+                f"{name:>{width}} │ {line}", style="dim", markup=False, highlight=False
+            )
 
-            if not self.display.confirm("Start malware scan?", default=False):
-                self.display.show_warning("Scan cancelled")
+        def on_done(name: str, result: Dict[str, Any]):
+            status = "timed out" if result["timed_out"] else "finished"
+            self.display.show_info(f"{name} {status} in {result['seconds']:.1f}s")
+
+        self.display.console.print()
+        self.display.show_info(f"Running {', '.join(commands)} in parallel...")
+        self.display.console.print()
+
+        start = time.perf_counter()
+        results = self.executor.run_concurrent(
+            commands,
+            timeout=get_config().get("security.scan_timeout", 600),
+            on_line=on_line,
+            on_done=on_done,
+        )
+        elapsed = time.perf_counter() - start
+
+        findings = []
+        rows = []
+        for name, result in results.items():
+            parsed = engines.parse_output(name, result["lines"])
+            findings.extend(parsed)
+            if result["error"]:
+                status = f"Error: {result['error']}"
+            elif result["timed_out"]:
+                status = "Timed out"
+            else:
+                status = f"Exit {result['returncode']}"
+            rows.append([name, status, str(len(parsed)), f"{result['seconds']:.1f}s"])
+
+        self.display.console.print()
+        self.display.show_table(
+            "🦠 Scanner Results", ["Engine", "Status", "Findings", "Wall Time"], rows
+        )
+        self.display.show_info(
+            f"Total {elapsed:.1f}s (sequential would be "
+            f"{sum(r['seconds'] for r in results.values()):.1f}s)"
+        )
+
+        self.display.console.print()
+        if not findings:
+            self.display.show_success("Scan completed - no findings")
+            return True
+
+        self.display.show_table(
+            "⚠️ Findings",
+            ["Engine", "Severity", "Target", "Detail"],
+            [[f["engine"], f["severity"], f["target"], f["detail"]] for f in findings],
+        )
+        self.display.show_warning(f"Scan completed - {len(findings)} finding(s)")
+        return True
+
+
+class RootkitCheckModule(BaseModule):
+    """Native hidden process and rootkit heuristics"""
+
+    SEVERITY_COLORS = {"high": "red", "warning": "yellow"}
+
+    def __init__(self, display: Display):
+        super().__init__(
+            name="Rootkit Heuristics",
+            description="Detect hidden processes and preload hooks",
+            category="security",
+        )
+        self.display = display
+        self.system_info = SystemInfo()
+        self.icon = "🕵️"
+
+    def execute(self) -> bool:
+        try:
+            if not rootkit.is_supported():
+                self.display.show_error("Rootkit heuristics require Linux /proc")
                 return False
 
-            # Run scans
-            for name, cmd in available_tools:
-                self.display.console.print()
-                self.display.show_info(f"Running {name}...")
-                self.display.console.print()
+            full = self.display.confirm(
+                "Probe the full PID range (slower, catches wrapped PIDs)?",
+                default=False,
+            )
+
+            self.display.console.print()
+            results = rootkit.run_checks(full=full)
+
+            self.display.show_key_value(
+                {
+                    "Processes": f"{results['processes']:,}",
+                    "PIDs Probed": f"1-{results['probed']:,}",
+                    "Not Inspectable": (
+                        f"{results['inaccessible']:,} (run as root for full coverage)"
+                        if results["inaccessible"] and not self.system_info.is_root
+                        else f"{results['inaccessible']:,}"
+                    ),
+                    "Time": f"{results['seconds'] * 1000:.0f} ms",
+                },
+                "🕵️ Rootkit Heuristics",
+            )
+
+            self.display.console.print()
+            findings = results["findings"]
+            if not findings:
+                self.display.show_success("No hidden processes or preload hooks found")
+                return True
+
+            rows = []
+            for finding in findings:
+                color = self.SEVERITY_COLORS.get(finding["severity"], "white")
+                rows.append(
+                    [
+                        finding["check"],
+                        f"[{color}]{finding['severity']}[/{color}]",
+                        finding["target"],
+                        finding["detail"],
+                    ]
+                )
+            self.display.show_table(
+                "⚠️ Findings", ["Check", "Severity", "Target", "Detail"], rows
+            )
+
+            high = sum(1 for f in findings if f["severity"] == "high")
+            if high:
+                self.display.show_error(f"{high} high-severity finding(s)")
+            else:
+                self.display.show_warning(f"{len(findings)} finding(s) to review")
+            return True
+
+        except Exception as e:
+            self.log_error("Rootkit check failed", e)
+            self.display.show_error(f"Check failed: {str(e)}")
+            return False
+
+
+class PermissionAuditModule(BaseModule):
+    """Audit filesystem permissions and ownership"""
 
-                if name == "clamav":
-                    scan_cmd = f"{cmd} --infected --recursive --suppress-ok-results ~/"
-                elif name == "chkrootkit":
-                    scan_cmd = f"sudo {cmd}"
-                elif name == "rkhunter":
-                    scan_cmd = f"sudo {cmd} --check --skip-keypress"
-                else:
-                    scan_cmd = cmd
+    SEVERITY_COLORS = {"high": "red", "warning": "yellow", "info": "cyan"}
+    MAX_STREAMED = 500
 
-                try:
-                    self.executor.run(scan_cmd, timeout=600)
-                except:
-                    self.display.show_warning(f"{name} scan had issues")
+    def __init__(self, display: Display):
+        super().__init__(
+            name="Permission Audit",
+            description="Find SUID/SGID, world-writable and orphaned files",
+            category="security",
+        )
+        self.display = display
+        self.icon = "🛂"
+
+    def execute(self) -> bool:
+        try:
+            if not permaudit.is_supported():
+                self.display.show_error("Permission audit requires a POSIX system")
+                return False
+
+            root = os.path.expanduser(self.display.prompt("Path to audit", default="/"))
+            if not os.path.isdir(root):
+                self.display.show_error("Directory not found")
+                return False
+
+            one_filesystem = self.display.confirm(
+                "Stay on the same filesystem?", default=True
+            )
+            show_info = self.display.confirm(
+                "Show expected SUID/capability binaries?", default=False
+            )
+            report = self.display.prompt("CSV report path (blank to skip)", default="")
+
+            auditor = permaudit.PermissionAuditor(
+                root,
+                workers=get_config().get("performance.max_threads", None),
+                one_filesystem=one_filesystem,
+            )
 
             self.display.console.print()
-            self.display.show_success("Scan completed")
+            counts: Dict[tuple, int] = {}
+            shown = 0
+            writer = None
+            report_file = None
+            if report:
+                report_file = open(report, "w", encoding="utf-8", newline="")
+                writer = csv.writer(report_file)
+                writer.writerow(["check", "severity", "path", "detail"])
+
+            try:
+                for finding in auditor.run():
+                    key = (finding["check"], finding["severity"])
+                    counts[key] = counts.get(key, 0) + 1
+                    if writer:
+                        writer.writerow(
+                            [
+                                finding["check"],
+                                finding["severity"],
+                                finding["path"],
+                                finding["detail"],
+                            ]
+                        )
+                    if finding["severity"] == "info" and not show_info:
+                        continue
+                    shown += 1
+                    if shown <= self.MAX_STREAMED:
+                        self.display.console.print(
+                            f"{finding['severity']:>7}  {finding['check']:<14} "
+                            f"{finding['path']}  ({finding['detail']})",
+                            style=self.SEVERITY_COLORS.get(finding["severity"]),
+                            markup=False,
+                            highlight=False,
+                        )
+            finally:
+                if report_file:
+                    report_file.close()
+
+            if shown > self.MAX_STREAMED:
+                self.display.show_info(
+                    f"... {shown - self.MAX_STREAMED:,} more not shown"
+                    + (f" (see {report})" if report else "")
+                )
+
+            stats = auditor.stats
+            entries = stats["dirs"] + stats["files"]
+            self.display.console.print()
+            self.display.show_key_value(
+                {
+                    "Root": auditor.root,
+                    "Directories": f"{stats['dirs']:,}",
+                    "Files": f"{stats['files']:,}",
+                    "Unreadable": f"{stats['errors']:,}",
+                    "Findings": f"{stats['findings']:,}",
+                    "Time": f"{stats['seconds']:.1f}s",
+                    "Rate": (
+                        f"{entries / stats['seconds']:,.0f} entries/s"
+                        if stats["seconds"] > 0
+                        else "N/A"
+                    ),
+                },
+                "🛂 Permission Audit",
+            )
+
+            if counts:
+                self.display.console.print()
+                self.display.show_table(
+                    "📊 Findings by Check",
+                    ["Check", "Severity", "Count"],
+                    [
+                        [check, severity, f"{count:,}"]
+                        for (check, severity), count in sorted(counts.items())
+                    ],
+                )
+            if report:
+                self.display.show_success(f"Report saved to {report}")
             return True
 
         except Exception as e:
-            self.log_error("Malware scan failed", e)
-            self.display.show_error(f"Scan failed: {str(e)}")
+            self.log_error("Permission audit failed", e)
+            self.display.show_error(f"Audit failed: {str(e)}")
             return False
 
 
 class FileEncryptionModule(BaseModule):
-    """Simple file encryption/decryption"""
+    """Chunked authenticated file encryption/decryption"""
 
     def __init__(self, display: Display):
         super().__init__(
             name="File Encryption",
-            description="Encrypt/decrypt files (simple XOR)",
+            description="Encrypt/decrypt files (AES-256-GCM)",
             category="security",
         )
         self.display = display
+        self.config = get_config()
         self.icon = "🔐"
 
     def execute(self) -> bool:
         try:
             self.display.console.print("1. Encrypt file")
             self.display.console.print("2. Decrypt file")
+            self.display.console.print("3. Decrypt byte range")
+            self.display.console.print("4. Verify integrity")
+            self.display.console.print("5. Benchmark full vs ranged decrypt")
             self.display.console.print()
 
             choice = self.display.prompt("Choose option", default="1")
 
-            if choice not in ["1", "2"]:
+            if choice not in ["1", "2", "3", "4", "5"]:
                 self.display.show_warning("Invalid choice")
                 return False
 
@@ -436,23 +1313,47 @@ class FileEncryptionModule(BaseModule):
                 self.display.show_error("File not found")
                 return False
 
+            if choice in ["3", "4", "5"] and not crypto.is_container(filepath):
+                self.display.show_error("Not an encrypted container")
+                return False
+
             password = self.display.prompt("Enter password", password=True)
             if not password:
                 self.display.show_warning("No password provided")
                 return False
 
-            output = self.display.prompt(
-                "Output file path", default=filepath + ".encrypted"
-            )
+            if choice == "3":
+                return self._decrypt_range(filepath, password)
+            elif choice == "4":
+                return self._verify(filepath, password)
+            elif choice == "5":
+                return self._benchmark(filepath, password)
+
+            if choice == "1":
+                default_output = filepath + ".encrypted"
+            elif filepath.endswith(".encrypted"):
+                default_output = filepath[: -len(".encrypted")]
+            else:
+                default_output = filepath + ".decrypted"
+
+            output = self.display.prompt("Output file path", default=default_output)
 
             self.display.console.print()
 
+            start = time.perf_counter()
             if choice == "1":
                 self._encrypt_file(filepath, output, password)
                 self.display.show_success(f"File encrypted: {output}")
             else:
                 self._decrypt_file(filepath, output, password)
                 self.display.show_success(f"File decrypted: {output}")
+            elapsed = time.perf_counter() - start
+
+            size = os.path.getsize(filepath)
+            rate = size / elapsed / (1024 * 1024) if elapsed > 0 else 0.0
+            self.display.show_info(
+                f"Processed {format_bytes(size)} in {elapsed:.2f}s ({rate:.1f} MB/s)"
+            )
 
             return True
 
@@ -461,24 +1362,120 @@ class FileEncryptionModule(BaseModule):
             self.display.show_error(f"Operation failed: {str(e)}")
             return False
 
-    def _encrypt_file(self, input_path: str, output_path: str, password: str):
-        """Simple XOR encryption (NOT PRODUCTION GRADE!)"""
-        key = hashlib.sha256(password.encode()).digest()
+    def _decrypt_range(self, filepath: str, password: str) -> bool:
+        """Decrypt only the chunks covering a byte range"""
+        header = crypto.read_header(filepath)
+        self.display.show_info(
+            f"Plaintext size: {header.plaintext_size} bytes "
+            f"({header.chunk_count} chunks of {format_bytes(header.chunk_size)})"
+        )
 
-        with open(input_path, "rb") as f_in:
-            data = f_in.read()
+        try:
+            offset = int(self.display.prompt("Start offset (bytes)", default="0"))
+            length = int(
+                self.display.prompt(
+                    "Length (bytes)", default=str(header.plaintext_size - offset)
+                )
+            )
+        except ValueError:
+            self.display.show_error("Offset and length must be integers")
+            return False
 
-        encrypted = bytearray()
-        for i, byte in enumerate(data):
-            encrypted.append(byte ^ key[i % len(key)])
+        output = self.display.prompt(
+            "Output file path", default=f"{filepath}.{offset}-{offset + length}"
+        )
+        self.display.console.print()
 
-        with open(output_path, "wb") as f_out:
-            f_out.write(encrypted)
+        start = time.perf_counter()
+        written = crypto.decrypt_range(
+            filepath,
+            output,
+            password,
+            offset,
+            length,
+            workers=self.config.get("performance.max_threads", None),
+        )
+        elapsed = time.perf_counter() - start
+
+        self.display.show_success(
+            f"Decrypted {format_bytes(written)} to {output} in {elapsed:.2f}s"
+        )
+        return True
+
+    def _verify(self, filepath: str, password: str) -> bool:
+        """Verify every chunk tag without writing plaintext"""
+        self.display.console.print()
+        self.display.show_info("Verifying container integrity...")
+
+        start = time.perf_counter()
+        chunks = crypto.verify_file(
+            filepath, password, workers=self.config.get("performance.max_threads", None)
+        )
+        elapsed = time.perf_counter() - start
+
+        self.display.show_success(
+            f"Integrity OK: {chunks} chunk(s) verified in {elapsed:.2f}s"
+        )
+        return True
+
+    def _benchmark(self, filepath: str, password: str) -> bool:
+        """Compare full and ranged decrypt throughput"""
+        try:
+            range_size = int(
+                self.display.prompt("Range size (bytes)", default=str(64 * 1024))
+            )
+        except ValueError:
+            range_size = 64 * 1024
+
+        self.display.console.print()
+        self.display.show_info("Running decrypt benchmark...")
+
+        result = crypto.benchmark_decrypt(
+            filepath,
+            password,
+            range_size=range_size,
+            workers=self.config.get("performance.max_threads", None),
+        )
+
+        details = {
+            "File Size": format_bytes(result["size"]),
+            "Chunks": str(result["chunks"]),
+            "Full Decrypt": f"{result['full_seconds']:.3f}s "
+            f"({result['full_mb_s']:.1f} MB/s)",
+            "Range Size": format_bytes(result["range_size"]),
+            "Ranged Decrypt": f"{result['range_ms']:.2f} ms/range "
+            f"({result['range_mb_s']:.1f} MB/s)",
+        }
+        self.display.show_key_value(details, "⏱️ Decrypt Benchmark")
+        return True
+
+    def _encrypt_file(self, input_path: str, output_path: str, password: str):
+        """Encrypt into a chunked AES-256-GCM container"""
+        crypto.encrypt_file(
+            input_path,
+            output_path,
+            password,
+            chunk_size=self.config.get(
+                "security.encryption_chunk_size", crypto.DEFAULT_CHUNK_SIZE
+            ),
+            kdf_log_n=self.config.get("security.kdf_log_n", crypto.DEFAULT_KDF_LOG_N),
+            workers=self.config.get("performance.max_threads", None),
+        )
 
     def _decrypt_file(self, input_path: str, output_path: str, password: str):
-        """Simple XOR decryption"""
-        # XOR encryption is symmetric
-        self._encrypt_file(input_path, output_path, password)
+        """Decrypt a container, falling back to the legacy XOR format"""
+        if crypto.is_container(input_path):
+            crypto.decrypt_file(
+                input_path,
+                output_path,
+                password,
+                workers=self.config.get("performance.max_threads", None),
+            )
+        else:
+            self.display.show_warning(
+                "Legacy XOR file detected - re-encrypt it with the new format"
+            )
+            crypto.legacy_xor_file(input_path, output_path, password)
 
 
 def get_security_modules(display: Display) -> List[BaseModule]:
@@ -486,7 +1483,10 @@ def get_security_modules(display: Display) -> List[BaseModule]:
     return [
         PasswordStrengthModule(display),
         PasswordGeneratorModule(display),
+        BreachDatabaseModule(display),
         HashGeneratorModule(display),
         MalwareScanModule(display),
+        RootkitCheckModule(display),
+        PermissionAuditModule(display),
         FileEncryptionModule(display),
     ]
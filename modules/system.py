@@ -8,6 +8,7 @@ import os
 import sys
 import platform
 import subprocess
+import time
 import psutil
 from datetime import datetime
 from typing import Optional, Dict, List, Any
@@ -19,9 +20,37 @@ from core.base import (
     format_bytes,
     format_duration,
 )
+from core.cleanup import estimate_all, get_providers
+from core.diskusage import (
+    DiskUsage,
+    DiskUsageScanner,
+    get_snapshot_path,
+    growth,
+    load_snapshot,
+    save_snapshot,
+)
+from core import sysinfo
+from core.exporter import MetricsExporter
+from core.history import get_history, is_recording
+from core.monitor import SystemSampler
+from core.processes import (
+    SORT_KEYS,
+    ProcessSampler,
+    build_process_tree,
+    connection_counts,
+    top_processes,
+)
 from core.utils import get_logger, get_config
 from ui.display import Display
 
+SORT_LABELS = {
+    "cpu": "CPU Usage",
+    "rss": "Memory (RSS)",
+    "io": "Disk I/O",
+    "threads": "Threads",
+    "fds": "Open Files",
+}
+
 
 class SystemInformationModule(BaseModule):
     """Display comprehensive system information"""
@@ -38,16 +67,44 @@ class SystemInformationModule(BaseModule):
 
     def execute(self) -> bool:
         try:
-            info = self._gather_system_info()
-
-            # Show with neofetch if available
-            if self.system_info.is_command_available("neofetch"):
-                self.display.show_info("Fetching system information with neofetch...\n")
-                os.system("neofetch")
-                self.display.console.print()
+            timeout = get_config().get("system.info_timeout", 3)
+
+            # Overview read natively from /proc, /sys and /etc/os-release
+            header = sysinfo.user_host()
+            with self.display.create_live(
+                self.display.build_panel(
+                    self.display.build_key_value(
+                        sysinfo.pending(sysinfo.SUMMARY_COLLECTORS)
+                    ),
+                    header,
+                ),
+                screen=False,
+            ) as live:
+                sysinfo.gather(
+                    sysinfo.SUMMARY_COLLECTORS,
+                    timeout,
+                    lambda info: live.update(
+                        self.display.build_panel(
+                            self.display.build_key_value(info), header
+                        ),
+                        refresh=True,
+                    ),
+                )
+            self.display.console.print()
 
-            # Show detailed info
-            self.display.show_key_value(info, "📊 Detailed System Information")
+            # Show detailed info, filling in fields as collectors finish
+            title = "📊 Detailed System Information"
+            with self.display.create_live(
+                self.display.build_key_value(sysinfo.pending(), title),
+                screen=False,
+            ) as live:
+                sysinfo.gather(
+                    sysinfo.COLLECTORS,
+                    timeout,
+                    lambda info: live.update(
+                        self.display.build_key_value(info, title), refresh=True
+                    ),
+                )
 
             return True
         except Exception as e:
@@ -55,49 +112,6 @@ class SystemInformationModule(BaseModule):
             self.display.show_error(f"Failed to retrieve system information: {str(e)}")
             return False
 
-    def _gather_system_info(self) -> Dict[str, str]:
-        """Gather comprehensive system information"""
-        info = {}
-
-        try:
-            # Basic info
-            info["OS"] = f"{platform.system()} {platform.release()}"
-            info["OS Version"] = platform.version()
-            info["Architecture"] = platform.machine()
-            info["Processor"] = platform.processor() or "Unknown"
-            info["Python Version"] = platform.python_version()
-            info["Hostname"] = platform.node()
-
-            # CPU info
-            info["CPU Cores"] = str(psutil.cpu_count(logical=False))
-            info["CPU Threads"] = str(psutil.cpu_count(logical=True))
-            info["CPU Usage"] = f"{psutil.cpu_percent(interval=1)}%"
-
-            # Memory info
-            mem = psutil.virtual_memory()
-            info["Total RAM"] = format_bytes(mem.total)
-            info["Available RAM"] = format_bytes(mem.available)
-            info["Used RAM"] = f"{format_bytes(mem.used)} ({mem.percent}%)"
-
-            # Disk info
-            disk = psutil.disk_usage("/")
-            info["Total Disk"] = format_bytes(disk.total)
-            info["Used Disk"] = f"{format_bytes(disk.used)} ({disk.percent}%)"
-            info["Free Disk"] = format_bytes(disk.free)
-
-            # Boot time
-            boot_time = datetime.fromtimestamp(psutil.boot_time())
-            info["Boot Time"] = boot_time.strftime("%Y-%m-%d %H:%M:%S")
-
-            # Uptime
-            uptime_seconds = int((datetime.now() - boot_time).total_seconds())
-            info["Uptime"] = format_duration(uptime_seconds)
-
-        except Exception as e:
-            self.log_warning(f"Error gathering some system info: {e}")
-
-        return info
-
 
 class SystemUptimeModule(BaseModule):
     """Display system uptime"""
@@ -159,6 +173,26 @@ class DiskUsageModule(BaseModule):
         self.icon = "💾"
 
     def execute(self) -> bool:
+        try:
+            self.display.console.print("1. Partition usage")
+            self.display.console.print("2. Analyze directory space")
+            self.display.console.print()
+
+            choice = self.display.prompt("Choose option", default="1")
+
+            if choice == "1":
+                return self._show_partitions()
+            elif choice == "2":
+                return self._analyze()
+            else:
+                self.display.show_error("Invalid option")
+                return False
+        except Exception as e:
+            self.log_error("Failed to get disk usage", e)
+            self.display.show_error(f"Failed to retrieve disk usage: {str(e)}")
+            return False
+
+    def _show_partitions(self) -> bool:
         try:
             partitions = psutil.disk_partitions()
 
@@ -208,6 +242,159 @@ class DiskUsageModule(BaseModule):
             self.display.show_error(f"Failed to retrieve disk usage: {str(e)}")
             return False
 
+    def _analyze(self) -> bool:
+        root = os.path.expanduser(
+            self.display.prompt("Directory to analyze", default=os.getcwd())
+        )
+        if not os.path.isdir(root):
+            self.display.show_error(f"Not a directory: {root}")
+            return False
+        one_filesystem = self.display.confirm("Stay on this filesystem?", default=True)
+
+        snapshot_path = get_snapshot_path(root)
+        previous = load_snapshot(snapshot_path)
+        incremental = False
+        if previous is not None and previous.root == os.path.abspath(root):
+            taken = datetime.fromtimestamp(previous.timestamp)
+            self.display.show_info(
+                f"Snapshot from {taken.strftime('%Y-%m-%d %H:%M:%S')} found"
+            )
+            incremental = self.display.confirm(
+                "Incremental rescan (skip directories whose mtime is unchanged)?",
+                default=True,
+            )
+        else:
+            previous = None
+
+        progress = self.display.show_progress_bar(0, "Scanning")
+        with progress:
+            progress.add_task(f"Scanning {root}...", total=None)
+            usage = DiskUsageScanner(
+                root,
+                workers=get_config().get("performance.max_threads", None),
+                one_filesystem=one_filesystem,
+                previous=previous,
+                incremental=incremental,
+            ).scan()
+
+        try:
+            save_snapshot(usage, snapshot_path)
+        except OSError as e:
+            self.display.show_warning(f"Could not save snapshot: {e}")
+
+        stats = usage.stats
+        self.display.show_key_value(
+            {
+                "Allocated": format_bytes(stats["bytes"]),
+                "Files": f"{stats['files']:,}",
+                "Directories": f"{stats['dirs']:,}",
+                "Unreadable": str(stats["errors"]),
+                "Reused from snapshot": f"{stats['reused']:,} directories",
+                "Time": f"{stats['seconds']:.2f}s",
+                "Rate": f"{stats['files'] / max(stats['seconds'], 1e-9):,.0f} files/s",
+            },
+            "📊 Scan Summary",
+        )
+        self._show_largest(usage)
+        if previous is not None:
+            self._show_growth(usage, previous)
+        self._drill_down(usage)
+        return True
+
+    def _show_growth(self, usage: DiskUsage, previous: DiskUsage, count: int = 15):
+        change = usage.total_bytes[0] - previous.total_bytes[0]
+        sign = "+" if change >= 0 else "-"
+        rows = [
+            [
+                f"+{format_bytes(total)}",
+                f"+{format_bytes(own)}" if own > 0 else "",
+                usage.path(index),
+            ]
+            for total, own, index in growth(usage, previous, count)
+        ]
+        since = datetime.fromtimestamp(previous.timestamp).strftime("%Y-%m-%d %H:%M")
+        if rows:
+            self.display.show_table(
+                f"📈 Growth since {since} ({sign}{format_bytes(abs(change))} total)",
+                ["Subtree", "Files here", "Directory"],
+                rows,
+            )
+        else:
+            self.display.show_info(
+                f"No directory grew since {since} ({sign}{format_bytes(abs(change))})"
+            )
+
+    def _show_largest(self, usage: DiskUsage, count: int = 15):
+        total = max(usage.total_bytes[0], 1)
+        self.display.show_table(
+            "📁 Largest Directories",
+            ["Size", "%", "Files", "Directory"],
+            [
+                [
+                    format_bytes(usage.total_bytes[i]),
+                    f"{usage.total_bytes[i] / total * 100:.1f}%",
+                    f"{usage.total_files[i]:,}",
+                    usage.path(i),
+                ]
+                for i in usage.largest_directories(count)
+            ],
+        )
+        self.display.show_table(
+            "📄 Largest Files",
+            ["Size", "File"],
+            [[format_bytes(size), path] for size, path in usage.top_files[:count]],
+        )
+
+    def _drill_down(self, usage: DiskUsage):
+        """Browse the scanned tree without touching the disk again"""
+        current = 0
+        while True:
+            children = usage.children(current)[:30]
+            total = max(usage.total_bytes[current], 1)
+            rows = [
+                [
+                    str(n),
+                    format_bytes(usage.total_bytes[i]),
+                    f"{usage.total_bytes[i] / total * 100:.1f}%",
+                    f"{usage.total_files[i]:,}",
+                    usage.names[i] + "/",
+                ]
+                for n, i in enumerate(children, 1)
+            ]
+            if usage.own_files[current]:
+                rows.append(
+                    [
+                        "",
+                        format_bytes(usage.own_bytes[current]),
+                        f"{usage.own_bytes[current] / total * 100:.1f}%",
+                        f"{usage.own_files[current]:,}",
+                        "(files here)",
+                    ]
+                )
+            self.display.show_table(
+                f"📂 {usage.path(current)} - {format_bytes(usage.total_bytes[current])}",
+                ["#", "Size", "%", "Files", "Name"],
+                rows,
+            )
+
+            choice = self.display.prompt(
+                "Number to open, '..' to go up, 'q' to finish", default="q"
+            ).strip()
+            if choice.lower() == "q":
+                return
+            if choice == "..":
+                if current > 0:
+                    current = usage.parents[current]
+                continue
+            try:
+                number = int(choice)
+            except ValueError:
+                number = 0
+            if 1 <= number <= len(children):
+                current = children[number - 1]
+            else:
+                self.display.show_warning("Invalid choice")
+
 
 class MemoryUsageModule(BaseModule):
     """Display memory usage information"""
@@ -278,43 +465,63 @@ class ProcessListModule(BaseModule):
         )
         self.display = display
         self.icon = "⚙️"
+        self.sampler = ProcessSampler()
 
     def execute(self) -> bool:
         try:
-            self.display.show_info("Gathering process information...")
-
-            # Get all processes
-            processes = []
-            for proc in psutil.process_iter(
-                ["pid", "name", "username", "memory_percent", "cpu_percent"]
-            ):
-                try:
-                    pinfo = proc.info
-                    processes.append(
-                        [
-                            str(pinfo["pid"]),
-                            pinfo["name"][:30],
-                            pinfo["username"][:15] if pinfo["username"] else "N/A",
-                            f"{pinfo['memory_percent']:.1f}%",
-                            f"{pinfo['cpu_percent']:.1f}%",
-                        ]
-                    )
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-
-            # Sort by memory usage
-            processes.sort(key=lambda x: float(x[3].rstrip("%")), reverse=True)
-
-            # Show top 20 processes
-            headers = ["PID", "Name", "User", "Memory %", "CPU %"]
+            self.display.console.print("Sort by:")
+            for i, key in enumerate(SORT_KEYS, 1):
+                self.display.console.print(f"{i}. {SORT_LABELS[key]}")
+            self.display.console.print()
+            choice = self.display.prompt("Choose option", default="1")
+            keys = list(SORT_KEYS)
+            try:
+                number = int(choice)
+            except ValueError:
+                number = 0
+            sort_key = keys[number - 1] if 1 <= number <= len(keys) else "cpu"
+
+            limit = get_config().get("system.process_list_limit", 20)
+            self.display.show_info("Measuring process activity over 1 second...")
+            by_fds = sort_key == "fds"
+            stats = self.sampler.measure(1.0, fds=by_fds)
+            top = top_processes(stats, sort_key, limit)
+            if not by_fds:
+                top = self.sampler.fill_fds(top)
+
+            rows = [
+                [
+                    str(s.pid),
+                    s.name[:30],
+                    s.username[:15] if s.username else "N/A",
+                    f"{s.cpu_percent:.1f}%",
+                    format_bytes(s.rss),
+                    format_bytes(s.read_rate) if s.io_visible else "-",
+                    format_bytes(s.write_rate) if s.io_visible else "-",
+                    str(s.num_threads),
+                    str(s.num_fds) if s.num_fds >= 0 else "-",
+                ]
+                for s in top
+            ]
+            headers = [
+                "PID",
+                "Name",
+                "User",
+                "CPU %",
+                "RSS",
+                "Read/s",
+                "Write/s",
+                "Threads",
+                "FDs",
+            ]
             self.display.show_table(
-                f"⚙️ Top {min(20, len(processes))} Processes (by Memory Usage)",
+                f"⚙️ Top {len(rows)} Processes (by {SORT_LABELS[sort_key]})",
                 headers,
-                processes[:20],
+                rows,
             )
 
             self.display.console.print()
-            self.display.show_info(f"Total processes running: {len(processes)}")
+            self.display.show_info(f"Total processes running: {len(stats)}")
 
             return True
         except Exception as e:
@@ -323,6 +530,553 @@ class ProcessListModule(BaseModule):
             return False
 
 
+class ProcessTreeModule(BaseModule):
+    """Show the process hierarchy with per-subtree resource totals"""
+
+    def __init__(self, display: Display):
+        super().__init__(
+            name="Process Tree",
+            description="Process hierarchy with rolled-up memory, CPU and threads",
+            category="system",
+        )
+        self.display = display
+        self.icon = "🌳"
+        self.sampler = ProcessSampler(io=False)
+
+    def execute(self) -> bool:
+        try:
+            self.display.console.print("Rank subtrees by:")
+            self.display.console.print("1. Memory (RSS)")
+            self.display.console.print("2. CPU Usage")
+            self.display.console.print("3. Threads")
+            self.display.console.print()
+            choice = self.display.prompt("Choose option", default="1")
+            column = {"2": 1, "3": 2}.get(choice, 0)
+            depth = self.display.prompt("Maximum depth", default="4")
+            width = self.display.prompt("Children shown per process", default="8")
+            try:
+                depth, width = max(int(depth), 1), max(int(width), 1)
+            except ValueError:
+                depth, width = 4, 8
+
+            self.display.show_info("Measuring process activity over 1 second...")
+            tree = build_process_tree(self.sampler.measure(1.0))
+
+            data = self._subtrees(tree, tree.roots, column, depth, width)
+            self.display.show_tree(
+                f"🌳 {len(tree.stats)} processes ({self._summary(tree, tree.roots)})",
+                data,
+            )
+            return True
+        except Exception as e:
+            self.log_error("Failed to build process tree", e)
+            self.display.show_error(f"Failed to build process tree: {str(e)}")
+            return False
+
+    @staticmethod
+    def _format(totals: List[float]) -> str:
+        rss, cpu, threads, count = totals
+        plural = "s" if threads != 1 else ""
+        text = f"{format_bytes(rss)}, {cpu:.1f}% CPU, {int(threads)} thread{plural}"
+        if count > 1:
+            text += f", {int(count)} procs"
+        return text
+
+    def _summary(self, tree, pids: List[int]) -> str:
+        totals = [0.0, 0.0, 0.0, 0.0]
+        for pid in pids:
+            for i, value in enumerate(tree.totals[pid]):
+                totals[i] += value
+        return self._format(totals)
+
+    def _subtrees(
+        self, tree, pids: List[int], column: int, depth: int, width: int
+    ) -> Dict[str, Any]:
+        """
+        Nested dict for Display.show_tree
+
+        Children are ordered by the chosen subtree total; beyond `width`
+        children or `depth` levels, the rest collapse into one summary line.
+        """
+        ranked = sorted(pids, key=lambda pid: tree.totals[pid][column], reverse=True)
+        data: Dict[str, Any] = {}
+        for pid in ranked[:width]:
+            proc = tree.stats[pid]
+            label = f"{proc.name} ({pid}) - {self._format(tree.totals[pid])}"
+            children = tree.children.get(pid, [])
+            if not children:
+                data[label] = {}
+            elif depth > 1:
+                data[label] = self._subtrees(tree, children, column, depth - 1, width)
+            else:
+                data[label] = {
+                    f"… {len(children)} child{'ren' if len(children) > 1 else ''}": (
+                        self._summary(tree, children)
+                    )
+                }
+        hidden = ranked[width:]
+        if hidden:
+            data[f"… {len(hidden)} more"] = self._summary(tree, hidden)
+        return data
+
+
+class ProcessIOModule(BaseModule):
+    """Live per-process disk I/O ranking, similar to iotop"""
+
+    def __init__(self, display: Display):
+        super().__init__(
+            name="Process I/O Monitor",
+            description="Live per-process disk read/write rates and connections",
+            category="system",
+        )
+        self.display = display
+        self.icon = "💽"
+        self.sampler = ProcessSampler()
+
+    def execute(self) -> bool:
+        try:
+            interval = self.display.prompt("Refresh interval in seconds", default="2")
+            try:
+                interval = max(float(interval), 0.5)
+            except ValueError:
+                interval = 2.0
+            show_idle = self.display.confirm("Include idle processes?", default=False)
+            limit = get_config().get("system.process_list_limit", 20)
+
+            self.sampler.prime()
+            refreshes = 0
+            table = self.display.build_table("💽 Process I/O", ["Waiting..."], [])
+            try:
+                with self.display.create_live(table, screen=False) as live:
+                    while True:
+                        time.sleep(interval)
+                        stats = self.sampler.sample()
+                        live.update(
+                            self._build(stats, connection_counts(), show_idle, limit),
+                            refresh=True,
+                        )
+                        refreshes += 1
+            except KeyboardInterrupt:
+                pass
+
+            self.display.show_success(f"Stopped after {refreshes} refreshes")
+            return True
+        except Exception as e:
+            self.log_error("Process I/O monitor failed", e)
+            self.display.show_error(f"Process I/O monitor failed: {str(e)}")
+            return False
+
+    def _build(
+        self,
+        stats: List[Any],
+        connections: Dict[int, int],
+        show_idle: bool,
+        limit: int,
+    ):
+        """Rank by combined read+write rate and build the table"""
+        visible = [s for s in stats if s.io_visible]
+        total_read = sum(s.read_rate for s in visible)
+        total_write = sum(s.write_rate for s in visible)
+        ranked = top_processes(
+            [s for s in visible if show_idle or s.io_rate > 0], "io", limit
+        )
+
+        rows = [
+            [
+                str(s.pid),
+                s.name[:25],
+                s.username[:12] if s.username else "N/A",
+                format_bytes(s.read_rate),
+                format_bytes(s.write_rate),
+                str(connections[s.pid]) if s.pid in connections else "-",
+                s.cmdline[:40],
+            ]
+            for s in ranked
+        ]
+        hidden = len(stats) - len(visible)
+        title = (
+            f"💽 Process I/O - read {format_bytes(total_read)}/s, "
+            f"write {format_bytes(total_write)}/s"
+        )
+        table = self.display.build_table(
+            title,
+            ["PID", "Name", "User", "Read/s", "Write/s", "Conns", "Command"],
+            rows,
+        )
+        caption = f"{time.strftime('%H:%M:%S')} · Ctrl+C to exit"
+        if hidden:
+            caption += f" · I/O hidden for {hidden} process(es)"
+        table.caption = caption
+        return table
+
+
+class SystemDashboardModule(BaseModule):
+    """Live dashboard of CPU, memory, disk and network activity"""
+
+    TITLES = {
+        "cpu": "🔥 CPU",
+        "memory": "🧠 Memory",
+        "disk": "💾 Disk I/O",
+        "net": "🌐 Network",
+        "footer": "",
+    }
+
+    def __init__(self, display: Display):
+        super().__init__(
+            name="Live Dashboard",
+            description="Live CPU, memory, disk and network monitor",
+            category="system",
+        )
+        self.display = display
+        self.icon = "📈"
+
+    def execute(self) -> bool:
+        try:
+            interval = self.display.prompt("Sampling interval in seconds", default="1")
+            try:
+                interval = max(float(interval), 0.1)
+            except ValueError:
+                interval = 1.0
+            fps = max(float(get_config().get("system.dashboard_fps", 4)), 0.5)
+
+            stats = self._run(interval, 1.0 / fps)
+
+            self.display.show_success("Dashboard stopped")
+            self.display.show_key_value(
+                {
+                    "Samples": str(stats["samples"]),
+                    "Frames drawn": str(stats["frames"]),
+                    "Panel updates": str(stats["updates"]),
+                    "Sampler CPU": f"{stats['overhead']['cpu_percent']:.2f}%",
+                },
+                "📈 Session",
+            )
+            return True
+        except Exception as e:
+            self.log_error("Dashboard failed", e)
+            self.display.show_error(f"Dashboard failed: {str(e)}")
+            return False
+
+    def _run(self, interval: float, frame_time: float) -> Dict[str, Any]:
+        """
+        Render samples until Ctrl+C
+
+        Each panel is rebuilt only when its formatted content changes, and a
+        frame is drawn only when at least one panel changed, no faster than
+        frame_time allows (samples arriving in between are coalesced).
+        """
+        layout = self.display.create_layout(
+            [["cpu"], ["memory", "disk", "net"], ["footer"]]
+        )
+        layout["footer"].size = 3
+        builders = {
+            "cpu": self._cpu_panel,
+            "memory": self._memory_panel,
+            "disk": self._disk_panel,
+            "net": self._net_panel,
+            "footer": self._footer_panel,
+        }
+        shown: Dict[str, Any] = {}
+        stats = {"samples": 0, "frames": 0, "updates": 0, "overhead": {}}
+        waiting = self.display.build_panel("Waiting for first sample...")
+        for name in builders:
+            layout[name].update(waiting)
+
+        sampler = SystemSampler(interval)
+        version = 0
+        last_frame = 0.0
+        try:
+            with sampler, self.display.create_live(layout) as live:
+                live.refresh()
+                while True:
+                    sample = sampler.wait_for_sample(version, timeout=interval * 2)
+                    if sample is None:
+                        continue
+                    version = sampler.version
+                    stats["samples"] += 1
+                    stats["overhead"] = sample["overhead"]
+
+                    delay = last_frame + frame_time - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                        sample = sampler.latest or sample
+                        version = sampler.version
+
+                    changed = False
+                    for name, builder in builders.items():
+                        rows = builder(sample, stats)
+                        if shown.get(name) == rows:
+                            continue
+                        shown[name] = rows
+                        layout[name].update(self._render(name, rows))
+                        stats["updates"] += 1
+                        changed = True
+
+                    if changed:
+                        live.refresh()
+                        last_frame = time.monotonic()
+                        stats["frames"] += 1
+        except KeyboardInterrupt:
+            pass
+
+        if not stats["overhead"]:
+            stats["overhead"] = sampler.overhead
+        return stats
+
+    def _render(self, name: str, rows: tuple) -> Any:
+        if name == "footer":
+            return self.display.build_panel("   ".join(rows), style="dim cyan")
+        if name == "cpu":
+            table = self.display.build_table(
+                "", ["Core", "Usage", "", "Core", "Usage", ""], list(rows)
+            )
+            table.show_header = False
+            table.box = None
+            return self.display.build_panel(table, self.TITLES[name])
+        return self.display.build_panel(
+            self.display.build_key_value(dict(rows)), self.TITLES[name]
+        )
+
+    @staticmethod
+    def _bar(percent: float, length: int = 20) -> str:
+        used_blocks = int((min(percent, 100.0) / 100) * length)
+        return "█" * used_blocks + "░" * (length - used_blocks)
+
+    def _cpu_panel(self, sample: Dict[str, Any], stats: Dict[str, Any]) -> tuple:
+        cpu = sample["cpu"]
+        cells = [("All", f"{cpu['total']:5.1f}%", self._bar(cpu["total"]))]
+        cells += [
+            (str(i), f"{pct:5.1f}%", self._bar(pct))
+            for i, pct in enumerate(cpu["cores"])
+        ]
+        if len(cells) % 2:
+            cells.append(("", "", ""))
+        half = len(cells) // 2
+        return tuple(left + right for left, right in zip(cells[:half], cells[half:]))
+
+    def _memory_panel(self, sample: Dict[str, Any], stats: Dict[str, Any]) -> tuple:
+        mem, swap = sample["memory"], sample["swap"]
+        rows = [
+            ("RAM", f"{self._bar(mem['percent'], 15)} {mem['percent']:.1f}%"),
+            ("Used", format_bytes(mem["used"])),
+            ("Available", format_bytes(mem["available"])),
+        ]
+        if swap["total"]:
+            rows += [
+                (
+                    "Swap",
+                    f"{self._bar(swap['percent'], 15)} {swap['percent']:.1f}%",
+                ),
+            ]
+        return tuple(rows)
+
+    def _disk_panel(self, sample: Dict[str, Any], stats: Dict[str, Any]) -> tuple:
+        disk = sample["disk"]
+        return (
+            ("Read", f"{format_bytes(disk['read_bytes'])}/s"),
+            ("Write", f"{format_bytes(disk['write_bytes'])}/s"),
+            ("Read ops", f"{disk['read_ops']:.0f}/s"),
+            ("Write ops", f"{disk['write_ops']:.0f}/s"),
+        )
+
+    def _net_panel(self, sample: Dict[str, Any], stats: Dict[str, Any]) -> tuple:
+        net = sample["net"]
+        return (
+            ("Received", f"{format_bytes(net['recv_bytes'])}/s"),
+            ("Sent", f"{format_bytes(net['sent_bytes'])}/s"),
+            ("Packets in", f"{net['recv_packets']:.0f}/s"),
+            ("Packets out", f"{net['sent_packets']:.0f}/s"),
+        )
+
+    def _footer_panel(self, sample: Dict[str, Any], stats: Dict[str, Any]) -> tuple:
+        load = sample["cpu"]["load"]
+        overhead = sample["overhead"]
+        return (
+            datetime.fromtimestamp(sample["timestamp"]).strftime("%H:%M:%S"),
+            (
+                "Load " + " ".join(f"{value:.2f}" for value in load)
+                if load
+                else "Load N/A"
+            ),
+            f"Sampler {overhead['cpu_percent']:.2f}% CPU, "
+            f"{overhead['sample_ms']:.1f} ms/sample",
+            "Ctrl+C to exit",
+        )
+
+
+class MetricsHistoryModule(BaseModule):
+    """Charts of the recorded metrics history"""
+
+    # menu choice -> [(metric, name, unit)]
+    VIEWS = {
+        "1": [("memory", "Memory", "%")],
+        "2": [("cpu", "CPU", "%")],
+        "3": [("disk_read", "Disk read", "B/s"), ("disk_write", "Disk write", "B/s")],
+        "4": [("net_recv", "Received", "B/s"), ("net_sent", "Sent", "B/s")],
+        "5": [("swap", "Swap", "%")],
+    }
+    SPANS = {"1": ("1 hour", 3600), "2": ("24 hours", 86400), "3": ("30 days", 2592000)}
+    SPARKS = "▁▂▃▄▅▆▇█"
+
+    def __init__(self, display: Display):
+        super().__init__(
+            name="Metrics History",
+            description="Charts of recorded CPU, memory, disk and network use",
+            category="system",
+        )
+        self.display = display
+        self.icon = "🕒"
+
+    def execute(self) -> bool:
+        try:
+            history = get_history()
+            if history is None:
+                self.display.show_warning(
+                    "No metrics history yet (enable system.history_enabled)"
+                )
+                return True
+            if not is_recording():
+                self.display.show_info("History is being recorded by another PyTools")
+
+            self.display.console.print("1. Memory usage")
+            self.display.console.print("2. CPU usage")
+            self.display.console.print("3. Disk I/O")
+            self.display.console.print("4. Network")
+            self.display.console.print("5. Swap usage")
+            self.display.console.print()
+            view = self.display.prompt("Choose metric", default="1")
+            if view not in self.VIEWS:
+                self.display.show_error("Invalid choice")
+                return False
+
+            self.display.console.print("1. Last hour")
+            self.display.console.print("2. Last 24 hours")
+            self.display.console.print("3. Last 30 days")
+            self.display.console.print()
+            span = self.display.prompt("Choose time span", default="2")
+            if span not in self.SPANS:
+                self.display.show_error("Invalid choice")
+                return False
+
+            metrics = self.VIEWS[view]
+            span_label, seconds = self.SPANS[span]
+            width = max(self.display.console.width - 8, 20)
+            now = time.time()
+            for metric, name, unit in metrics:
+                resolution, values = history.series(metric, seconds, now)
+                self._show_series(
+                    f"🕒 {name} - last {span_label}", values, resolution, unit, width
+                )
+            return True
+        except Exception as e:
+            self.log_error("Failed to show metrics history", e)
+            self.display.show_error(f"Failed to show metrics history: {str(e)}")
+            return False
+
+    @staticmethod
+    def _format(value: float, unit: str) -> str:
+        if unit == "%":
+            return f"{value:.1f}%"
+        return f"{format_bytes(value)}/s"
+
+    def _sparkline(self, values: List[float], width: int, ceiling: float) -> str:
+        """Average buckets into `width` columns; gaps without data are blank"""
+        columns = min(width, len(values))
+        line = []
+        for c in range(columns):
+            chunk = values[
+                c * len(values) // columns : (c + 1) * len(values) // columns
+            ]
+            known = [v for v in chunk if v == v]  # NaN != NaN
+            if not known:
+                line.append(" ")
+                continue
+            level = sum(known) / len(known) / ceiling if ceiling else 0.0
+            line.append(self.SPARKS[min(int(level * len(self.SPARKS)), 7)])
+        return "".join(line)
+
+    def _show_series(
+        self, title: str, values: List[float], resolution: int, unit: str, width: int
+    ):
+        known = [v for v in values if v == v]
+        if not known:
+            self.display.show_warning(f"{title}: nothing recorded in this period")
+            return
+        ceiling = 100.0 if unit == "%" else max(known)
+        chart = self._sparkline(values, width, ceiling)
+        stats = {
+            "Latest": self._format(known[-1], unit),
+            "Average": self._format(sum(known) / len(known), unit),
+            "Min": self._format(min(known), unit),
+            "Max": self._format(max(known), unit),
+            "Coverage": f"{len(known) / len(values) * 100:.0f}% "
+            f"({format_duration(len(known) * resolution)})",
+        }
+        summary = self.display.build_key_value(stats)
+        self.display.console.print(self.display.build_panel(chart, title))
+        self.display.console.print(summary)
+
+
+class MetricsExporterModule(BaseModule):
+    """Serve system metrics to Prometheus from the foreground"""
+
+    def __init__(self, display: Display):
+        super().__init__(
+            name="Metrics Exporter",
+            description="Serve Prometheus/OpenMetrics metrics over HTTP",
+            category="system",
+        )
+        self.display = display
+        self.icon = "📤"
+
+    def execute(self) -> bool:
+        try:
+            config = get_config()
+            bind = self.display.prompt(
+                "Bind address", default=config.get("system.exporter_bind", "127.0.0.1")
+            )
+            port = self.display.prompt(
+                "Port", default=str(config.get("system.exporter_port", 9877))
+            )
+            try:
+                port = int(port)
+            except ValueError:
+                self.display.show_error("Invalid port")
+                return False
+
+            exporter = MetricsExporter(
+                bind, port, config.get("system.exporter_interval", 5)
+            ).start()
+            self.display.show_success(f"Serving metrics at {exporter.url}")
+            self.display.show_info(
+                "Run 'python3 pytools.py --exporter' to serve without the menu. "
+                "Ctrl+C to stop."
+            )
+            try:
+                exporter.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                exporter.stop()
+
+            self.display.show_key_value(
+                {
+                    "Scrapes served": str(exporter.scrapes),
+                    "Last refresh": f"{exporter.refresh_seconds * 1000:.1f} ms",
+                },
+                "📤 Exporter Stopped",
+            )
+            return True
+        except OSError as e:
+            self.log_error("Failed to start metrics exporter", e)
+            self.display.show_error(f"Could not start exporter: {str(e)}")
+            return False
+        except Exception as e:
+            self.log_error("Metrics exporter failed", e)
+            self.display.show_error(f"Metrics exporter failed: {str(e)}")
+            return False
+
+
 class SystemUpdateModule(BaseModule):
     """Update system packages"""
 
@@ -465,27 +1219,74 @@ class SystemCleanModule(BaseModule):
 
     def execute(self) -> bool:
         try:
-            self.display.show_warning("This will clean temporary files and caches")
+            if self.system_info.os_type == "windows":
+                self.display.show_info("Windows cleanup not fully implemented")
+                return False
+
+            providers = get_providers(self.system_info)
+            sizes = self._estimate(providers)
 
+            ready = [p for p in providers if sizes.get(p)]
+            if not ready:
+                self.display.show_info("Nothing to clean")
+                return True
+
+            default = ",".join(str(providers.index(p) + 1) for p in ready if p.default)
+            choice = self.display.prompt(
+                "Sources to clean (comma-separated numbers, 'a' for all)",
+                default=default or "a",
+            )
+            if choice.strip().lower() == "a":
+                selected = ready
+            else:
+                selected = []
+                for part in choice.split(","):
+                    try:
+                        number = int(part)
+                    except ValueError:
+                        number = 0
+                    if not 1 <= number <= len(providers):
+                        self.display.show_warning(
+                            f"Ignoring invalid choice: {part.strip()}"
+                        )
+                        continue
+                    provider = providers[number - 1]
+                    if provider in ready and provider not in selected:
+                        selected.append(provider)
+            if not selected:
+                self.display.show_warning("Nothing selected")
+                return False
+
+            total = sum(sizes[p] for p in selected)
+            self.display.show_warning(
+                f"This will permanently delete about {format_bytes(total)} "
+                f"from {len(selected)} source(s): "
+                + ", ".join(p.name for p in selected)
+            )
             if not self.display.confirm("Continue with system cleanup?", default=False):
-                self.display.show_warning("Cleanup cancelled")
+                self.display.show_warning("Cleanup cancelled (dry run only)")
                 return False
 
             self.display.console.print()
-            freed_space = 0
-
-            # Clean based on OS
-            if self.system_info.os_type == "linux":
-                freed_space = self._clean_linux()
-            elif self.system_info.os_type == "darwin":
-                freed_space = self._clean_macos()
-            elif self.system_info.os_type == "windows":
-                self.display.show_info("Windows cleanup not fully implemented")
-                return False
+            rows = []
+            freed_total = 0
+            for provider in selected:
+                self.display.show_info(f"Cleaning {provider.name}...")
+                try:
+                    freed = provider.clean(self.executor)
+                except Exception as e:
+                    self.log_error(f"Cleaning {provider.name} failed", e)
+                    rows.append([provider.name, "-", f"failed: {e}"])
+                    continue
+                freed_total += freed
+                rows.append([provider.name, format_bytes(freed), "done"])
 
-            if freed_space > 0:
+            self.display.show_table(
+                "🧹 Cleanup Results", ["Source", "Freed", "Status"], rows
+            )
+            if freed_total > 0:
                 self.display.show_success(
-                    f"Cleanup completed! Freed approximately {format_bytes(freed_space)}"
+                    f"Cleanup completed! Freed approximately {format_bytes(freed_total)}"
                 )
             else:
                 self.display.show_info("Cleanup completed!")
@@ -497,74 +1298,34 @@ class SystemCleanModule(BaseModule):
             self.display.show_error(f"Cleanup failed: {str(e)}")
             return False
 
-    def _clean_linux(self) -> int:
-        """Clean Linux system"""
-        freed = 0
+    def _estimate(self, providers: List[Any]) -> Dict[Any, Optional[int]]:
+        """Estimate all sources concurrently, filling the table as they finish"""
+        cells = {p: ["…", "estimating"] for p in providers}
 
-        # Clean package cache
-        if self.system_info.package_manager in ["apt", "apt-get"]:
-            self.display.show_info("Cleaning APT cache...")
-            self.executor.run_silent("sudo apt clean")
-            self.executor.run_silent("sudo apt autoclean")
+        def table():
+            rows = [
+                [str(i), p.name, cells[p][0], cells[p][1]]
+                for i, p in enumerate(providers, 1)
+            ]
+            return self.display.build_table(
+                "🧹 Cleanup Sources (dry run)",
+                ["#", "Source", "Reclaimable", "Details"],
+                rows,
+            )
 
-        # Clean thumbnail cache
-        thumb_cache = os.path.expanduser("~/.cache/thumbnails")
-        if os.path.exists(thumb_cache):
-            self.display.show_info("Cleaning thumbnail cache...")
-            try:
-                import shutil
+        timeout = get_config().get("system.clean_estimate_timeout", 60)
+        with self.display.create_live(table(), screen=False) as live:
 
-                size = self._get_dir_size(thumb_cache)
-                shutil.rmtree(thumb_cache, ignore_errors=True)
-                freed += size
-            except:
-                pass
+            def on_done(provider, size, note):
+                cells[provider] = [
+                    format_bytes(size) if size is not None else "n/a",
+                    note,
+                ]
+                live.update(table(), refresh=True)
 
-        # Clean temp files
-        temp_dirs = ["/tmp", "/var/tmp"]
-        for temp_dir in temp_dirs:
-            if os.path.exists(temp_dir) and os.access(temp_dir, os.W_OK):
-                self.display.show_info(f"Cleaning {temp_dir}...")
-                try:
-                    for item in os.listdir(temp_dir):
-                        item_path = os.path.join(temp_dir, item)
-                        if os.path.isfile(item_path):
-                            try:
-                                size = os.path.getsize(item_path)
-                                os.remove(item_path)
-                                freed += size
-                            except:
-                                pass
-                except:
-                    pass
-
-        return freed
-
-    def _clean_macos(self) -> int:
-        """Clean macOS system"""
-        freed = 0
-
-        # Clean user cache
-        cache_dir = os.path.expanduser("~/Library/Caches")
-        if os.path.exists(cache_dir):
-            self.display.show_info("Cleaning user caches...")
-            # Only clean safe caches
-            # Implementation would go here
-
-        return freed
-
-    def _get_dir_size(self, path: str) -> int:
-        """Get directory size in bytes"""
-        total = 0
-        try:
-            for entry in os.scandir(path):
-                if entry.is_file(follow_symlinks=False):
-                    total += entry.stat().st_size
-                elif entry.is_dir(follow_symlinks=False):
-                    total += self._get_dir_size(entry.path)
-        except:
-            pass
-        return total
+            sizes = estimate_all(providers, timeout, on_done)
+        self.display.console.print()
+        return sizes
 
 
 def get_system_modules(display: Display) -> List[BaseModule]:
@@ -575,6 +1336,11 @@ def get_system_modules(display: Display) -> List[BaseModule]:
         DiskUsageModule(display),
         MemoryUsageModule(display),
         ProcessListModule(display),
+        ProcessTreeModule(display),
+        ProcessIOModule(display),
+        SystemDashboardModule(display),
+        MetricsHistoryModule(display),
+        MetricsExporterModule(display),
         SystemUpdateModule(display),
         SystemCleanModule(display),
     ]
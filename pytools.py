@@ -32,6 +32,7 @@ Features:
 import sys
 import os
 import signal
+import argparse
 from typing import Optional
 
 # Add current directory to path for imports
@@ -51,8 +52,8 @@ def check_python_version():
         sys.exit(1)
 
 
-def check_dependencies():
-    """Check and report missing dependencies"""
+def check_dependencies(interactive: bool = True):
+    """Check and report missing dependencies (optional ones only when interactive)"""
     required = {
         "rich": "pip install rich",
         "requests": "pip install requests",
@@ -66,6 +67,7 @@ def check_dependencies():
         "pytube": "pip install pytube",
         "qrcode": "pip install qrcode[pil]",
         "tqdm": "pip install tqdm",
+        "cryptography": "pip install cryptography",
     }
 
     missing_required = []
@@ -90,7 +92,7 @@ def check_dependencies():
         print("\nPlease install required dependencies and try again.")
         sys.exit(1)
 
-    if missing_optional:
+    if missing_optional and interactive:
         print("⚠️  Optional dependencies not installed (some features may be limited):")
         for module, cmd in missing_optional:
             print(f"   • {module}: {cmd}")
@@ -127,6 +129,12 @@ def initialize_pytools():
     system_info = SystemInfo()
     logger.info(f"System detected: {system_info}")
 
+    # Record metrics history in the background
+    if config.get("system.history_enabled", True):
+        from core.history import start_recording
+
+        start_recording()
+
     # Create display
     theme = config.get("theme", "cyberpunk")
     display = Display(theme=theme)
@@ -325,9 +333,46 @@ def create_config_modules(display):
     ]
 
 
+def parse_arguments():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(
+        description="PyTools v2.0.0 - Advanced Python Toolkit"
+    )
+    parser.add_argument(
+        "--exporter",
+        action="store_true",
+        help="run headless, serving Prometheus metrics at /metrics",
+    )
+    parser.add_argument("--bind", help="exporter bind address (system.exporter_bind)")
+    parser.add_argument("--port", type=int, help="exporter port (system.exporter_port)")
+    return parser.parse_args()
+
+
+def run_exporter(args):
+    """Serve /metrics until interrupted, without the interactive UI"""
+    from core import setup_logging, get_config
+    from core.exporter import MetricsExporter
+
+    logger = setup_logging()
+    config = get_config()
+    exporter = MetricsExporter(
+        args.bind or config.get("system.exporter_bind", "127.0.0.1"),
+        args.port or config.get("system.exporter_port", 9877),
+        config.get("system.exporter_interval", 5),
+    ).start()
+    logger.info(f"Metrics exporter listening on {exporter.url}")
+    print(f"📤 Serving metrics at {exporter.url} (Ctrl+C to stop)")
+    try:
+        exporter.serve_forever()
+    finally:
+        exporter.stop()
+
+
 def main():
     """Main entry point for PyTools"""
     try:
+        args = parse_arguments()
+
         # Check Python version
         check_python_version()
 
@@ -335,7 +380,11 @@ def main():
         setup_signal_handlers()
 
         # Check dependencies
-        check_dependencies()
+        check_dependencies(interactive=not args.exporter)
+
+        if args.exporter:
+            run_exporter(args)
+            return
 
         # Initialize PyTools
         display, config, system_info, logger = initialize_pytools()
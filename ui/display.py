@@ -281,6 +281,16 @@ class Display:
         colors: Optional[List[str]] = None,
     ):
         """Display data in a table"""
+        self.console.print(self.build_table(title, headers, rows, colors))
+
+    def build_table(
+        self,
+        title: str,
+        headers: List[str],
+        rows: List[List[str]],
+        colors: Optional[List[str]] = None,
+    ) -> Table:
+        """Build a table renderable without printing it"""
         table = Table(
             title=title,
             show_header=True,
@@ -298,10 +308,14 @@ class Display:
         for row in rows:
             table.add_row(*[str(cell) for cell in row])
 
-        self.console.print(table)
+        return table
 
     def show_key_value(self, data: Dict[str, str], title: str = ""):
         """Display key-value pairs"""
+        self.console.print(self.build_key_value(data, title))
+
+    def build_key_value(self, data: Dict[str, str], title: str = "") -> Table:
+        """Build a key-value renderable without printing it"""
         table = Table(
             show_header=False,
             box=MINIMAL,
@@ -315,7 +329,48 @@ class Display:
         for key, value in data.items():
             table.add_row(key, str(value))
 
-        self.console.print(table)
+        return table
+
+    def build_panel(self, renderable: Any, title: str = "", style: str = "cyan"):
+        """Wrap a renderable in a titled panel"""
+        return Panel(renderable, title=title, border_style=style, box=ROUNDED)
+
+    def create_layout(self, rows: List[List[str]]) -> Layout:
+        """
+        Build a layout grid of named regions
+
+        Each inner list is one row of equally wide columns; regions are
+        addressed by name (layout["cpu"].update(...)).
+        """
+        layout = Layout()
+        layout.split_column(
+            *[
+                (
+                    Layout(name=row[0])
+                    if len(row) == 1
+                    else Layout(name="_".join(row) + "_row")
+                )
+                for row in rows
+            ]
+        )
+        for row in rows:
+            if len(row) > 1:
+                layout["_".join(row) + "_row"].split_row(
+                    *[Layout(name=name) for name in row]
+                )
+        return layout
+
+    def create_live(
+        self, renderable: Any, screen: bool = True, transient: bool = False
+    ) -> Live:
+        """Live display that only redraws when refresh() is called"""
+        return Live(
+            renderable,
+            console=self.console,
+            auto_refresh=False,
+            screen=screen,
+            transient=transient,
+        )
 
     def show_progress_bar(self, total: int, description: str = "Processing..."):
         """Create and return a progress bar context"""